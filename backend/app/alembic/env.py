@@ -16,7 +16,8 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.
 # Import all models
 from app.models import Base
 from app.auth.models import User, Role, Permission, Group
-from app.validator.models import ImportedData, ValidationResult
+from app.validator.models import ImportedData, ImportedRow, ValidationResult, ValidationSummary
+from app.jobs.models import Job
 
 # Construct the database URL from environment variables
 DATABASE_URL = f"postgresql+asyncpg://{os.getenv('POSTGRES_USER')}:{os.getenv('POSTGRES_PASSWORD')}@{os.getenv('POSTGRES_SERVER')}:{os.getenv('POSTGRES_PORT')}/{os.getenv('POSTGRES_DB')}"
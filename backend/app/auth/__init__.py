@@ -1,12 +1,13 @@
 import jwt
-from .dependencies import create_access_token, decode_access_token, get_current_user
+from .dependencies import create_access_token, decode_access_token, get_current_user, require_permission
 from .exceptions import (
     InvalidCredentialsException,
     UserNotFoundException,
     InactiveUserException,
     PermissionDeniedException,
     TokenExpiredException,
-    InvalidTokenException
+    InvalidTokenException,
+    PasswordHashingBusyException
 )
 from .schemas import UserCreate, RoleCreate, PermissionCreate, GroupCreate, Token
 
@@ -14,12 +15,14 @@ __all__ = [
     "create_access_token",
     "decode_access_token",
     "get_current_user",
+    "require_permission",
     "InvalidCredentialsException",
     "UserNotFoundException",
     "InactiveUserException",
     "PermissionDeniedException",
     "TokenExpiredException",
     "InvalidTokenException",
+    "PasswordHashingBusyException",
     "UserCreate",
     "RoleCreate",
     "PermissionCreate",
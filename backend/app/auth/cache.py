@@ -0,0 +1,72 @@
+"""
+Caches of the authentication path.
+
+- token_cache holds the verified payload of recently seen access tokens, keyed by
+  the SHA-256 hash of the token, so that a token is not decoded and verified on
+  every request. An entry never outlives the expiry of its token.
+- user_cache holds a snapshot of the user of recently seen token subjects, so that
+  authenticated requests do not query the 'users' table. Entries are invalidated
+  when the user is updated or deleted through this process, and expire after
+  AUTH_USER_CACHE_TTL seconds to bound the staleness seen by other processes.
+- permission_cache holds the effective permission names of recently seen users,
+  keyed by user ID, so that authorization is a set lookup. Entries are
+  invalidated when the roles of a user or the permissions of a role change.
+"""
+
+import hashlib
+from typing import Any, Dict, FrozenSet, Optional
+from uuid import UUID
+from app.cache import TTLCache
+from app.config import settings
+from app.auth import schemas
+
+# Verified token payloads, keyed by token hash
+token_cache: TTLCache[Dict[str, Any]] = TTLCache(settings.AUTH_TOKEN_CACHE_SIZE, settings.AUTH_TOKEN_CACHE_TTL)
+
+# User snapshots, keyed by token subject (the user's email)
+user_cache: TTLCache[schemas.UserResponse] = TTLCache(settings.AUTH_USER_CACHE_SIZE, settings.AUTH_USER_CACHE_TTL)
+
+# Effective permission names, keyed by user ID
+permission_cache: TTLCache[FrozenSet[str]] = TTLCache(settings.AUTH_PERMISSION_CACHE_SIZE, settings.AUTH_PERMISSION_CACHE_TTL)
+
+
+def token_key(token: str) -> str:
+    """
+    Return the cache key of a token: its SHA-256 hex digest, so tokens themselves are not kept in memory.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def invalidate_user(*emails: Optional[str]) -> None:
+    """
+    Drop the cached snapshots of the users with the given emails.
+
+    Args:
+        *emails (Optional[str]): The emails of the users, e.g. before and after an update; None is ignored.
+    """
+    for email in emails:
+        if email is not None:
+            user_cache.pop(email)
+
+
+def invalidate_permissions(user_id: Optional[UUID] = None) -> None:
+    """
+    Drop cached effective permissions.
+
+    Args:
+        user_id (Optional[UUID]): The user whose permissions changed, or None when a
+            role or permission changed, which may affect every user.
+    """
+    if user_id is None:
+        permission_cache.clear()
+    else:
+        permission_cache.pop(user_id)
+
+
+def clear() -> None:
+    """
+    Empty every cache.
+    """
+    token_cache.clear()
+    user_cache.clear()
+    permission_cache.clear()
@@ -1,7 +1,9 @@
+import time
 from datetime import datetime, timedelta, timezone
+from typing import Callable
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
-from app.auth import exceptions
+from app.auth import cache, exceptions
 from app.database import get_db
 from app.config import settings
 
@@ -49,26 +51,89 @@ def decode_access_token(token: str) -> dict:
     except jwt.PyJWTError:
         raise exceptions.InvalidCredentialsException()  # Raise an exception if decoding fails
 
+def verify_access_token(token: str) -> dict:
+    """
+    Decode a JSON Web Token (JWT), reusing the payload of a recently verified identical token.
+
+    Verified payloads are cached by token hash until the token expires, so a
+    client sending the same token on every request is only verified once.
+
+    Args:
+        token (str): The JWT to verify.
+
+    Returns:
+        dict: The decoded payload of the token.
+
+    Raises:
+        InvalidCredentialsException: If the token is invalid or expired.
+    """
+    key = cache.token_key(token)
+    payload = cache.token_cache.get(key)
+    if payload is None:
+        payload = decode_access_token(token)
+        expires_at = payload.get("exp")
+        if expires_at is not None:
+            # Never serve the payload past the expiry of the token
+            cache.token_cache.set(key, payload, ttl=expires_at - time.time())
+    return payload
+
 async def get_current_user(token: str = Depends(oauth2_scheme), db = Depends(get_db)):
     """
     Retrieve the current user based on the provided token.
 
+    The user is served from the in-process user cache when the token subject was
+    seen recently, in which case the database is not queried.
+
     Args:
         token (str): The JWT token extracted from the request.
         db: The database session dependency.
 
     Returns:
-        User: The user object corresponding to the token's subject.
+        schemas.UserResponse: A snapshot of the user corresponding to the token's subject.
 
     Raises:
         InvalidCredentialsException: If the token is invalid or the user is not found.
     """
-    from app.auth import service, exceptions  # Move imports here
-    payload = decode_access_token(token)  # Decode the token to get the payload
+    from app.auth import service, exceptions, schemas  # Move imports here
+    payload = verify_access_token(token)  # Verify the token to get the payload
     email: str = payload.get("sub")  # Extract the email from the payload
     if email is None:
         raise exceptions.InvalidCredentialsException()  # Raise an exception if email is not found
-    user = await service.get_user_by_email(db, email)  # Retrieve the user from the database
-    if user is None:
+    user = cache.user_cache.get(email)  # Serve recently seen users from memory
+    if user is not None:
+        return user
+    db_user = await service.get_user_by_email(db, email)  # Retrieve the user from the database
+    if db_user is None:
         raise exceptions.InvalidCredentialsException()  # Raise an exception if user is not found
-    return user  # Return the user object
\ No newline at end of file
+    user = schemas.UserResponse.model_validate(db_user, from_attributes=True)  # Detach a snapshot from the session
+    cache.user_cache.set(email, user)
+    return user  # Return the user snapshot
+
+def require_permission(permission: str) -> Callable:
+    """
+    Build a dependency that only lets through users holding a permission.
+
+    Superusers hold every permission. Other users are checked against their
+    cached effective permission set, so the check is a set lookup.
+
+    Args:
+        permission (str): The name of the required permission.
+
+    Returns:
+        Callable: A dependency returning the current user, or raising
+                  PermissionDeniedException if they lack the permission.
+
+    Example:
+        @router.delete("/imports/{id}", dependencies=[Depends(require_permission("imports:delete"))])
+    """
+    async def check_permission(current_user = Depends(get_current_user), db = Depends(get_db)):
+        from app.auth import service  # Imported here like in get_current_user
+        if current_user.is_superuser:
+            return current_user
+        permissions = await service.get_effective_permissions(db, current_user.id)
+        if permission not in permissions:
+            raise exceptions.PermissionDeniedException()
+        return current_user
+
+    return check_permission
+
@@ -106,4 +106,24 @@ class InvalidTokenException(HTTPException):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token",
             headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+        )
+
+class PasswordHashingBusyException(HTTPException):
+    """
+    Exception raised when too many password hashes are already waiting.
+
+    This exception is raised during bursts of logins or sign-ups, when the
+    password hashing queue is full, so that requests fail fast instead of
+    piling up.
+
+    Attributes:
+        status_code (int): The HTTP status code for service unavailable (503).
+        detail (str): A message detailing the reason for the exception.
+        headers (dict): Additional headers to include in the response.
+    """
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many authentication requests, please retry",
+            headers={"Retry-After": "1"},
+        )
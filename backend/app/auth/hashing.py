@@ -0,0 +1,147 @@
+"""
+Password hashing off the event loop.
+
+Argon2 is deliberately slow and memory-hard, so hashing or verifying a password
+on the event loop thread would stall every other request of the process. Both
+run in a small dedicated thread pool instead; argon2-cffi releases the GIL while
+hashing, so the event loop keeps serving requests meanwhile.
+
+At most PASSWORD_HASH_WORKERS hashes run at the same time, and at most
+PASSWORD_HASH_MAX_QUEUE more wait for a free worker; further requests are
+rejected with 503 instead of piling up during a login storm.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional, TypeVar
+from passlib.context import CryptContext
+from app.auth import exceptions
+from app.config import settings
+
+T = TypeVar('T')
+
+# Initialize the password context for hashing passwords using Argon2
+pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+
+
+class PasswordHashExecutor:
+    """
+    Run password hashing in a bounded thread pool and record its queue depth.
+
+    Attributes:
+        workers (int): The number of hashes allowed to run at the same time.
+        max_queue (int): The number of hashes allowed to wait for a free worker.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore = asyncio.Semaphore(workers)
+        self.queued = 0
+        self.running = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self._total_wait = 0.0
+        self._total_run = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a hashing function in the pool once a worker is free.
+
+        Args:
+            func (Callable[..., T]): The hashing function.
+            *args (Any): The arguments of the function.
+
+        Returns:
+            T: The result of the function.
+
+        Raises:
+            PasswordHashingBusyException: If max_queue hashes are already waiting.
+        """
+        if self.queued >= self.max_queue:
+            self.rejected += 1
+            raise exceptions.PasswordHashingBusyException()
+
+        submitted = time.perf_counter()
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+
+        started = time.perf_counter()
+        self._total_wait += started - submitted
+        self.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), partial(func, *args))
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self._total_run += time.perf_counter() - started
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the current and peak queue depth, the counts of hashes and their average wait and run times.
+        """
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "running": self.running,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "average_wait_seconds": self._total_wait / self.completed if self.completed else 0.0,
+            "average_run_seconds": self._total_run / self.completed if self.completed else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        """
+        Shut down the thread pool, waiting for running hashes to finish.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+# The password hashing pool shared by the whole application
+password_hasher = PasswordHashExecutor(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_QUEUE)
+
+
+async def hash_password(password: str) -> str:
+    """
+    Hash a password with Argon2 outside the event loop.
+
+    Args:
+        password (str): The plain password.
+
+    Returns:
+        str: The encoded hash.
+    """
+    return await password_hasher.run(pwd_context.hash, password)
+
+
+async def verify_password(password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against its hash outside the event loop.
+
+    Args:
+        password (str): The plain password.
+        hashed_password (str): The stored hash.
+
+    Returns:
+        bool: Whether the password matches the hash.
+    """
+    return await password_hasher.run(pwd_context.verify, password, hashed_password)
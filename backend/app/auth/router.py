@@ -6,6 +6,7 @@ from app.auth import schemas
 from app.auth.dependencies import create_access_token, oauth2_scheme, get_current_user
 from app.database import get_db
 from app.auth import service  # Import service here instead of from __init__
+from app.auth.hashing import password_hasher
 from app.auth.models import User  # Import models directly here
 
 router = APIRouter()
@@ -97,6 +98,17 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSessi
     access_token = create_access_token(data={"sub": user.email})
     return {"access_token": access_token, "token_type": "bearer"}
 
+@router.get("/password-hashing/stats")
+async def read_password_hashing_stats():
+    """
+    Report the load of the password hashing pool.
+
+    Returns:
+        dict: The running and queued hashes, the peak queue depth, the completed and
+              rejected counts, and the average wait and run times.
+    """
+    return password_hasher.stats()
+
 @router.get("/users/me", response_model=schemas.UserResponse)
 async def read_users_me(current_user: schemas.UserResponse = Depends(get_current_user)):
     """
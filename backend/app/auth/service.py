@@ -1,15 +1,13 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.auth import schemas
+from app.auth import cache, schemas
+from app.auth.hashing import hash_password, pwd_context, verify_password
 from app.auth.models import User, Role, Permission, Group
-from passlib.context import CryptContext
 from sqlalchemy.orm import selectinload
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
+from typing import FrozenSet
 from uuid import UUID
 from app.auth.schemas import UserUpdate
 
-# Initialize the password context for hashing passwords using Argon2
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
-
 async def create_user(db: AsyncSession, user: schemas.UserCreate):
     """
     Create a new user in the database.
@@ -32,7 +30,7 @@ async def create_user(db: AsyncSession, user: schemas.UserCreate):
     if existing_user.scalar_one_or_none():
         raise ValueError("Email already registered")
     
-    hashed_password = pwd_context.hash(user.password)
+    hashed_password = await hash_password(user.password)  # Hash outside the event loop
     db_user = User(email=user.email, hashed_password=hashed_password)
     db.add(db_user)
     await db.commit()
@@ -61,12 +59,15 @@ async def update_user(db: AsyncSession, user_id: UUID, user_update: UserUpdate)
     user = await db.get(User, user_id)
     if not user:
         return None
+    previous_email = user.email
     
     for key, value in user_update.model_dump(exclude_unset=True).items():
         setattr(user, key, value)
     
     await db.commit()
     await db.refresh(user)
+    cache.invalidate_user(previous_email, user.email)  # Drop the stale snapshot of the user
+    cache.invalidate_permissions(user_id)
     return user
 
 async def delete_user(db: AsyncSession, user_id: UUID) -> bool:
@@ -84,8 +85,11 @@ async def delete_user(db: AsyncSession, user_id: UUID) -> bool:
     """
     user = await db.get(User, user_id)
     if user:
+        email = user.email
         await db.delete(user)
         await db.commit()
+        cache.invalidate_user(email)  # Stop authenticating the deleted user
+        cache.invalidate_permissions(user_id)
         return True
     return False
 
@@ -149,6 +153,10 @@ async def create_group(db: AsyncSession, group: schemas.GroupCreate):
     await db.refresh(db_group)
     return db_group
 
+def _user_by_email(email: str):
+    # A lambda statement is built and compiled once; later calls only bind the email
+    return lambda_stmt(lambda: select(User).where(User.email == email))
+
 async def get_user_by_email(db: AsyncSession, email: str):
     """
     Retrieve a user by their email address.
@@ -162,7 +170,7 @@ async def get_user_by_email(db: AsyncSession, email: str):
     Returns:
         User | None: The user instance if found, None otherwise.
     """
-    result = await db.execute(select(User).where(User.email == email))
+    result = await db.execute(_user_by_email(email))
     return result.scalar_one_or_none()
 
 async def authenticate_user(db: AsyncSession, email: str, password: str):
@@ -180,11 +188,11 @@ async def authenticate_user(db: AsyncSession, email: str, password: str):
     Returns:
         User | False: The authenticated user instance if successful, False otherwise.
     """
-    user = await db.execute(select(User).filter(User.email == email))
+    user = await db.execute(_user_by_email(email))
     user = user.scalar_one_or_none()
     if not user:
         return False
-    if not pwd_context.verify(password, user.hashed_password):
+    if not await verify_password(password, user.hashed_password):  # Verify outside the event loop
         return False
     return user
 
@@ -203,7 +211,7 @@ async def assign_role_to_user(db: AsyncSession, user_id: UUID, role_id: UUID):
     Returns:
         User | None: The updated user instance if successful, None otherwise.
     """
-    user_stmt = select(User).where(User.id == user_id)
+    user_stmt = select(User).options(selectinload(User.roles)).where(User.id == user_id)
     role_stmt = select(Role).where(Role.id == role_id)
     
     user_result = await db.execute(user_stmt)
@@ -216,9 +224,69 @@ async def assign_role_to_user(db: AsyncSession, user_id: UUID, role_id: UUID):
         user.roles.append(role)
         await db.commit()
         await db.refresh(user)
+        cache.invalidate_permissions(user_id)  # The user's effective permissions changed
         return user
     return None
 
+async def assign_permission_to_role(db: AsyncSession, role_id: UUID, permission_id: UUID):
+    """
+    Grant a permission to a role.
+
+    This function retrieves a role and a permission by their IDs and grants the
+    permission to the role if both exist. Every cached permission set is dropped,
+    since any user may hold the role.
+
+    Args:
+        db (AsyncSession): The database session to use for the operation.
+        role_id (UUID): The ID of the role to grant the permission to.
+        permission_id (UUID): The ID of the permission to grant.
+
+    Returns:
+        Role | None: The updated role instance if successful, None otherwise.
+    """
+    role = (await db.execute(
+        select(Role).options(selectinload(Role.permissions)).where(Role.id == role_id)
+    )).scalar_one_or_none()
+    permission = (await db.execute(select(Permission).where(Permission.id == permission_id))).scalar_one_or_none()
+
+    if role and permission:
+        role.permissions.append(permission)
+        await db.commit()
+        await db.refresh(role)
+        cache.invalidate_permissions()  # Every holder of the role is affected
+        return role
+    return None
+
+async def get_effective_permissions(db: AsyncSession, user_id: UUID) -> FrozenSet[str]:
+    """
+    Return the names of the permissions a user holds through their roles.
+
+    The set is computed with a single query joining the user's roles to their
+    permissions, then cached in memory until the user's roles, a role's
+    permissions or the user change, so that later checks are set lookups.
+
+    Args:
+        db (AsyncSession): The database session to use for the operation.
+        user_id (UUID): The ID of the user.
+
+    Returns:
+        FrozenSet[str]: The names of the user's permissions.
+    """
+    permissions = cache.permission_cache.get(user_id)
+    if permissions is None:
+        result = await db.execute(
+            lambda_stmt(
+                lambda: select(Permission.name)
+                .join(Permission.roles)
+                .join(Role.users)
+                .where(User.id == user_id)
+                .distinct()
+            )
+        )
+        permissions = frozenset(result.scalars().all())
+        cache.permission_cache.set(user_id, permissions)
+    return permissions
+
 async def get_user(db: AsyncSession, user_id: UUID):
     """
     Retrieve a user by their ID, including their roles and groups.
@@ -234,7 +302,7 @@ async def get_user(db: AsyncSession, user_id: UUID):
         UserResponse | None: The user response model if found, None otherwise.
     """
     result = await db.execute(
-        select(User).options(selectinload(User.roles), selectinload(User.groups)).filter(User.id == user_id)
+        lambda_stmt(lambda: select(User).options(selectinload(User.roles), selectinload(User.groups)).filter(User.id == user_id))
     )
     user = result.scalar_one_or_none()
     if user is None:
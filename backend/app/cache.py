@@ -0,0 +1,85 @@
+"""
+In-process caches with a time-to-live and a least-recently-used bound.
+
+The caches live in the memory of one worker process: entries are not shared
+between processes, and a change made through another process is only seen
+once the entry expires. They are meant for small, hot lookups on the request
+path and are only used from the event loop thread, so they are not locked.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    A mapping whose entries expire after ttl seconds, holding at most maxsize entries.
+
+    When the cache is full, storing a new entry evicts the least recently used one.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """
+        Return the value stored under a key, or None if it is missing or has expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store a value under a key.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (V): The value to store.
+            ttl (Optional[float]): The lifetime of this entry in seconds, capped at the
+                lifetime of the cache. Defaults to the lifetime of the cache.
+        """
+        if self.maxsize <= 0:
+            return
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        if lifetime <= 0:
+            return
+        self._entries[key] = (time.monotonic() + lifetime, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> Optional[V]:
+        """
+        Remove the entry stored under a key and return its value, if any.
+        """
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        """
+        Remove every entry.
+        """
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """
+        Report the size of the cache and its hit and miss counts.
+        """
+        return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
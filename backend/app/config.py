@@ -25,8 +25,9 @@ Note:
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 import json
+from typing import Literal, Optional, Union
 from uuid import UUID
-from fastapi.encoders import jsonable_encoder
+from app import serialization
 
 # Load environment variables from a .env file
 load_dotenv()
@@ -37,7 +38,9 @@ class UUIDEncoder(json.JSONEncoder):
     Custom JSON Encoder for UUID objects.
 
     This class extends the default JSONEncoder to handle UUID objects by converting
-    them to their string representation when serializing to JSON.
+    them to their string representation when serializing to JSON. It is kept for
+    callers of the standard json module; the application itself serializes through
+    app.serialization, which handles UUIDs natively.
     """
 
     def default(self, obj):
@@ -50,8 +53,8 @@ def custom_jsonable_encoder(obj):
     """
     Custom JSONable encoder function.
 
-    This function serializes an object to JSON format using the custom UUIDEncoder
-    to ensure that UUIDs are properly converted to strings.
+    This function converts an object to its JSON-compatible form through the
+    application's serializer, so that UUIDs and datetimes become strings.
 
     Args:
         obj (Any): The object to serialize.
@@ -59,7 +62,7 @@ def custom_jsonable_encoder(obj):
     Returns:
         dict: The serialized object as a JSON-compatible dictionary.
     """
-    return json.loads(json.dumps(jsonable_encoder(obj), cls=UUIDEncoder))
+    return serialization.loads(serialization.dumps(obj))
 
 
 class Settings(BaseSettings):
@@ -101,6 +104,41 @@ class Settings(BaseSettings):
         TEST_USER (str): The username for testing purposes.
         TEST_PASSWORD (str): The password for testing purposes.
         TEST_DATABASE_URL (str): The database URL for testing purposes.
+        IMPORT_CHUNK_SIZE (int): The number of bytes read from an upload per chunk (default is 1 MiB).
+        IMPORT_BATCH_SIZE (int): The number of parsed rows written to storage per batch (default is 5000).
+        VALIDATION_BATCH_SIZE (int): The number of validation results inserted per batch (default is 5000).
+        VALIDATION_INLINE_RESULTS (int): The number of validation results returned in a validation report (default is 100).
+        IMPORT_PREVIEW_ROWS (int): The number of leading rows kept as the preview of an import (default is 10).
+        EXPORT_BATCH_SIZE (int): The number of rows encoded per chunk of a streamed response (default is 1000).
+        LAYOUT_SAMPLE_ROWS (int): The number of leading records used to locate the header and table columns (default is 50).
+        CSV_SNIFF_BYTES (int): The number of leading bytes used to detect the encoding and dialect of a CSV file (default is 64 KiB).
+        STORAGE_BACKEND (str): The storage format of new imports, "rows", "ndjson" or "parquet" (default is "rows").
+        STORAGE_CODEC (Optional[str]): The compression codec of "ndjson" payloads, "zlib", "lzma" or "zstd", or None to store them uncompressed (default is "zlib").
+            It only applies to the "ndjson" backend: with the default "rows" backend each row is a JSONB value,
+            which PostgreSQL compresses on its own only above about 2 kB, and "parquet" files always use zstd.
+        STORAGE_DIR (str): The directory holding the files of file-based storage formats (default is "storage").
+        JOB_MAX_CONCURRENCY (int): The number of background jobs allowed to run at the same time (default is 2).
+        JOB_PROGRESS_INTERVAL (float): The number of seconds between progress updates of a running job (default is 2.0).
+        PROCESS_POOL_WORKERS (Optional[int]): The number of worker processes for CPU-bound work; 0 runs it in threads instead (default is the number of CPUs).
+        PROCESS_POOL_START_METHOD (str): The multiprocessing start method of the worker processes (default is "spawn").
+        VALIDATION_PARTITION_SIZE (int): The number of rows validated per worker task (default is 10000).
+        DB_POOL_SIZE (int): The number of connections kept open in the database pool (default is 10).
+        DB_MAX_OVERFLOW (int): The number of connections opened beyond the pool size under load (default is 20).
+        DB_POOL_TIMEOUT (float): The number of seconds to wait for a free connection before failing (default is 30.0).
+        DB_POOL_RECYCLE (int): The age in seconds after which a connection is replaced; -1 keeps connections forever (default is 1800).
+        DB_POOL_PRE_PING (bool): Whether to test connections for liveness when they are checked out (default is True).
+        DB_ECHO (Union[bool, str]): Whether to log SQL statements; "debug" also logs result rows (default is False).
+        DB_STATEMENT_TIMEOUT (Optional[int]): The number of milliseconds after which the server cancels a statement, or None for no limit (default is None).
+        DB_PREPARED_STATEMENT_CACHE_SIZE (int): The number of prepared statements kept per connection by asyncpg; 0 disables the cache (default is 500).
+        DB_QUERY_CACHE_SIZE (int): The number of compiled SQL statements kept by SQLAlchemy (default is 1200).
+        AUTH_USER_CACHE_SIZE (int): The number of authenticated users kept in memory per process; 0 disables the cache (default is 1024).
+        AUTH_USER_CACHE_TTL (float): The number of seconds an authenticated user is kept in memory (default is 60.0).
+        AUTH_TOKEN_CACHE_SIZE (int): The number of verified access tokens kept in memory per process; 0 disables the cache (default is 4096).
+        AUTH_TOKEN_CACHE_TTL (float): The longest number of seconds a verified access token is kept in memory (default is 300.0).
+        AUTH_PERMISSION_CACHE_SIZE (int): The number of effective permission sets kept in memory per process; 0 disables the cache (default is 1024).
+        AUTH_PERMISSION_CACHE_TTL (float): The number of seconds an effective permission set is kept in memory (default is 300.0).
+        PASSWORD_HASH_WORKERS (int): The number of password hashes computed at the same time per process (default is 2).
+        PASSWORD_HASH_MAX_QUEUE (int): The number of password hashes allowed to wait for a free worker before rejecting requests (default is 64).
     """
     # Database configuration and application settings
     SECRET_KEY: str
@@ -134,6 +172,53 @@ class Settings(BaseSettings):
     TEST_USER: str
     TEST_PASSWORD: str
 
+    # Import pipeline tuning
+    IMPORT_CHUNK_SIZE: int = 1024 * 1024
+    IMPORT_BATCH_SIZE: int = 5000
+    VALIDATION_BATCH_SIZE: int = 5000
+    VALIDATION_INLINE_RESULTS: int = 100
+    IMPORT_PREVIEW_ROWS: int = 10
+    EXPORT_BATCH_SIZE: int = 1000
+    LAYOUT_SAMPLE_ROWS: int = 50
+    CSV_SNIFF_BYTES: int = 64 * 1024
+
+    # Storage of imported rows
+    STORAGE_BACKEND: str = "rows"
+    STORAGE_DIR: str = "storage"
+    STORAGE_CODEC: Optional[str] = "zlib"  # Only used by the "ndjson" backend
+
+    # Background job tuning
+    JOB_MAX_CONCURRENCY: int = 2
+    JOB_PROGRESS_INTERVAL: float = 2.0
+
+    # CPU-bound work offloading
+    PROCESS_POOL_WORKERS: Optional[int] = None
+    PROCESS_POOL_START_METHOD: str = "spawn"
+    VALIDATION_PARTITION_SIZE: int = 10000
+
+    # Database engine and connection pool
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: Union[bool, Literal["debug"]] = False
+    DB_STATEMENT_TIMEOUT: Optional[int] = None
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+    DB_QUERY_CACHE_SIZE: int = 1200
+
+    # Authentication caches
+    AUTH_USER_CACHE_SIZE: int = 1024
+    AUTH_USER_CACHE_TTL: float = 60.0
+    AUTH_TOKEN_CACHE_SIZE: int = 4096
+    AUTH_TOKEN_CACHE_TTL: float = 300.0
+    AUTH_PERMISSION_CACHE_SIZE: int = 1024
+    AUTH_PERMISSION_CACHE_TTL: float = 300.0
+
+    # Password hashing
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
     # Configuration for loading environment variables
     model_config = SettingsConfigDict(
         env_file=".env",  # Specify the .env file to load
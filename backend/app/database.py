@@ -1,12 +1,20 @@
 """
 This module sets up an asynchronous database connection using SQLAlchemy with asyncio support.
 It configures the database URL, creates an asynchronous engine, and provides a session factory
-for managing database sessions in an asynchronous context.
+for managing database sessions in an asynchronous context. The engine and its connection pool
+are configured from the DB_* settings, and the pool records how long checkouts wait.
 """
 
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import settings
+from app import serialization
 
 # Retrieve the database URL from the application settings.
 DATABASE_URL = settings.DATABASE_URL  # Updated to use config.settings
@@ -19,16 +27,114 @@ if not DATABASE_URL:
 if DATABASE_URL.startswith("postgresql://"):
     DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
 
-# Create an asynchronous database engine using the provided DATABASE_URL.
-# The 'echo' parameter enables logging of all SQL statements, and 'future' enables the use of
-# the future API for SQLAlchemy.
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+
+@dataclass
+class CheckoutStats:
+    """
+    Cumulative counters of connection checkouts from the pool.
+
+    Attributes:
+        checkouts (int): The number of connections handed out.
+        timeouts (int): The number of checkouts that gave up after DB_POOL_TIMEOUT seconds.
+        total_wait (float): The total number of seconds spent waiting for a connection.
+        max_wait (float): The longest wait for a connection, in seconds.
+    """
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+# Checkout counters of the application's pool, kept across pool re-creation by engine.dispose()
+checkout_stats = CheckoutStats()
+_checkout_stats_lock = threading.Lock()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Connection pool that records how long each checkout waits for a connection.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            with _checkout_stats_lock:
+                checkout_stats.timeouts += 1
+            raise
+        wait = time.perf_counter() - started
+        with _checkout_stats_lock:
+            checkout_stats.checkouts += 1
+            checkout_stats.total_wait += wait
+            checkout_stats.max_wait = max(checkout_stats.max_wait, wait)
+        return connection
+
+
+def engine_options() -> Dict[str, Any]:
+    """
+    Build the engine and pool options from the DB_* settings.
+
+    SQL logging is off unless DB_ECHO is set, since echoing every statement and its
+    parameters is costly under load. Compiled statements are cached by SQLAlchemy
+    and prepared statements by each asyncpg connection, so repeated queries skip
+    both compilation and server-side parsing and planning. The statement timeout
+    is applied as a server setting of every connection.
+
+    Returns:
+        Dict[str, Any]: The keyword arguments for create_async_engine.
+    """
+    options: Dict[str, Any] = {
+        "echo": settings.DB_ECHO,
+        "poolclass": InstrumentedPool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+        "connect_args": {"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE},
+        "json_serializer": serialization.dumps_str,
+        "json_deserializer": serialization.loads,
+    }
+    if settings.DB_STATEMENT_TIMEOUT is not None:
+        options["connect_args"]["server_settings"] = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT)}
+    return options
+
+
+# Create an asynchronous database engine using the provided DATABASE_URL and the pool settings.
+# JSON and JSONB columns are encoded and decoded with the application's serializer.
+engine = create_async_engine(DATABASE_URL, **engine_options())
 
 # Create a session factory that produces asynchronous database sessions.
 # The 'expire_on_commit' parameter is set to False to prevent instances from expiring
 # after a commit, allowing them to be reused within the same session.
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+
+def pool_status() -> Dict[str, Any]:
+    """
+    Report the state of the connection pool and the waits for connections.
+
+    Returns:
+        Dict[str, Any]: The pool size, the checked-in, checked-out and overflow
+        connections, and the checkout counters with the average and longest wait.
+    """
+    pool = engine.pool
+    with _checkout_stats_lock:
+        stats = CheckoutStats(**vars(checkout_stats))
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),  # Negative while the pool is not yet full
+        "checkouts": stats.checkouts,
+        "timeouts": stats.timeouts,
+        "average_wait_seconds": stats.total_wait / stats.checkouts if stats.checkouts else 0.0,
+        "max_wait_seconds": stats.max_wait,
+    }
+
 from typing import AsyncGenerator
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -42,4 +148,4 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session  # Yield the session for use in the calling context.
         finally:
-            await session.close()  # Ensure the session is closed after use.
\ No newline at end of file
+            await session.close()  # Ensure the session is closed after use.
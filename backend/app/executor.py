@@ -0,0 +1,112 @@
+"""
+This module provides a shared process pool for CPU-bound work such as file parsing
+and rule evaluation, so that it does not run on the event loop thread.
+
+The pool is created on first use and sized by the PROCESS_POOL_WORKERS setting.
+Setting PROCESS_POOL_WORKERS to 0 disables the pool, and work is run in the
+default thread pool instead, which keeps the event loop free without starting
+worker processes.
+
+Functions submitted to the pool, and their arguments and results, must be
+picklable: use module-level functions and plain data.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Generator, Iterable, Optional, TypeVar
+from app.config import settings
+
+T = TypeVar('T')
+
+# The shared process pool, created on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def pool_size() -> int:
+    """
+    Return the number of worker processes of the pool, or 0 if the pool is disabled.
+    """
+    if settings.PROCESS_POOL_WORKERS is None:
+        return os.cpu_count() or 1
+    return settings.PROCESS_POOL_WORKERS
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Return the shared process pool, creating it on first use.
+
+    Returns:
+        Optional[ProcessPoolExecutor]: The pool, or None if it is disabled.
+    """
+    global _process_pool
+    if _process_pool is None and pool_size() > 0:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=pool_size(),
+            mp_context=multiprocessing.get_context(settings.PROCESS_POOL_START_METHOD)
+        )
+    return _process_pool
+
+
+async def run_cpu_bound(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a CPU-bound function outside the event loop thread.
+
+    Args:
+        func (Callable[..., T]): A picklable, module-level function.
+        *args (Any): The picklable arguments of the function.
+
+    Returns:
+        T: The result of the function.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), partial(func, *args))
+
+
+async def iter_in_thread(batches: Generator[Iterable[T], None, None]) -> AsyncIterator[T]:
+    """
+    Produce the batches of a blocking generator in worker threads and yield their items.
+
+    The generator is closed in a worker thread when iteration stops, including
+    when the consumer stops early or is cancelled, so the files its finally
+    blocks release are closed right away rather than when it is garbage
+    collected. The close waits for a batch that is still being produced.
+
+    Args:
+        batches (Generator[Iterable[T], None, None]): A generator of batches; a batch of None ends it.
+
+    Yields:
+        T: Each item of each batch, in order.
+    """
+    lock = threading.Lock()
+
+    def produce():
+        with lock:
+            return next(batches, None)
+
+    def close():
+        with lock:
+            batches.close()
+
+    try:
+        while True:
+            batch = await asyncio.to_thread(produce)
+            if batch is None:
+                break
+            for item in batch:
+                yield item
+    finally:
+        await asyncio.to_thread(close)
+
+
+def shutdown_process_pool() -> None:
+    """
+    Shut down the shared process pool, waiting for running work to finish.
+    """
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=True)
+        _process_pool = None
@@ -0,0 +1,50 @@
+from typing import Any, Optional
+import uuid
+import datetime
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID, JSONB
+from sqlalchemy.orm import Mapped, declarative_base, mapped_column
+
+Base = declarative_base()
+
+
+class Job(Base):
+    """
+    Represents the 'jobs' table in the database.
+
+    This model tracks long-running work, such as imports and validations, that is
+    executed in the background after the request that started it has returned.
+
+    Attributes:
+        id (UUID): A unique identifier for the job, automatically generated.
+        kind (str): The kind of work the job performs, e.g. "import" or "validate".
+        status (str): The state of the job: "queued", "running", "completed" or "failed".
+        rows_processed (int): The number of rows processed so far.
+        rows_total (int): The total number of rows to process, when known in advance.
+        result (dict): A JSON summary of the outcome of a completed job.
+        error (str): The error message of a failed job.
+        created_at (datetime): The timestamp of when the job was submitted.
+        started_at (datetime): The timestamp of when the job started running.
+        finished_at (datetime): The timestamp of when the job completed or failed.
+    """
+    __tablename__ = "jobs"
+
+    # Unique identifier for the job
+    id: Mapped[uuid.UUID] = mapped_column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # Kind and state of the job, cannot be null
+    kind: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[str] = mapped_column(String, nullable=False, default="queued")
+
+    # Progress counters of the job
+    rows_processed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rows_total: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    # Outcome of the job, set once it has finished
+    result: Mapped[Optional[dict[str, Any]]] = mapped_column(JSONB, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+
+    # Lifecycle timestamps of the job
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=datetime.datetime.utcnow)
+    started_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, nullable=True)
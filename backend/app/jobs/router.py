@@ -0,0 +1,48 @@
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db
+from app.jobs import schemas, service
+
+# Create an instance of the FastAPI router
+router = APIRouter()
+
+@router.get("/{job_id}", response_model=schemas.Job)
+async def read_job(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    """
+    Retrieve a background job by its ID.
+
+    Args:
+        job_id (uuid.UUID): The ID of the job to retrieve.
+        db (AsyncSession): The database session dependency.
+
+    Returns:
+        schemas.Job: The job, including its status and, once finished, its result or error.
+
+    Raises:
+        HTTPException: If the job is not found.
+    """
+    job = await service.get_job(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return job
+
+@router.get("/{job_id}/progress", response_model=schemas.JobProgress)
+async def read_job_progress(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    """
+    Retrieve the progress of a background job.
+
+    Args:
+        job_id (uuid.UUID): The ID of the job.
+        db (AsyncSession): The database session dependency.
+
+    Returns:
+        schemas.JobProgress: The rows processed, throughput and estimated time remaining.
+
+    Raises:
+        HTTPException: If the job is not found.
+    """
+    progress = await service.get_job_progress(db, job_id)
+    if progress is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return progress
@@ -0,0 +1,63 @@
+from pydantic import BaseModel, ConfigDict
+import uuid
+from typing import Optional, Dict, Any
+from datetime import datetime
+
+class JobBase(BaseModel):
+    """
+    Base schema for a background job.
+
+    Attributes:
+        kind (str): The kind of work the job performs.
+        status (str): The state of the job: "queued", "running", "completed" or "failed".
+    """
+    kind: str
+    status: str
+
+class Job(JobBase):
+    """
+    Schema for a background job retrieved from the database.
+
+    Attributes:
+        id (uuid.UUID): The unique ID of the job.
+        rows_processed (int): The number of rows processed so far.
+        rows_total (Optional[int]): The total number of rows to process, when known.
+        result (Optional[Dict[str, Any]]): A summary of the outcome of a completed job.
+        error (Optional[str]): The error message of a failed job.
+        created_at (datetime): The timestamp of when the job was submitted.
+        started_at (Optional[datetime]): The timestamp of when the job started running.
+        finished_at (Optional[datetime]): The timestamp of when the job finished.
+    """
+    id: uuid.UUID
+    rows_processed: int = 0
+    rows_total: Optional[int] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class JobProgress(BaseModel):
+    """
+    Schema for the progress of a background job.
+
+    Attributes:
+        job_id (uuid.UUID): The unique ID of the job.
+        status (str): The state of the job.
+        rows_processed (int): The number of rows processed so far.
+        rows_total (Optional[int]): The total number of rows to process, when known.
+        percent_complete (Optional[float]): The estimated share of the work done, from 0 to 100.
+        elapsed_seconds (float): The time spent running so far.
+        rows_per_second (Optional[float]): The average throughput since the job started.
+        eta_seconds (Optional[float]): The estimated time until the job finishes.
+    """
+    job_id: uuid.UUID
+    status: str
+    rows_processed: int
+    rows_total: Optional[int] = None
+    percent_complete: Optional[float] = None
+    elapsed_seconds: float = 0.0
+    rows_per_second: Optional[float] = None
+    eta_seconds: Optional[float] = None
@@ -0,0 +1,266 @@
+import asyncio
+import datetime
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+from sqlalchemy import lambda_stmt, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.jobs import schemas
+from app.jobs.models import Job
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProgressTracker:
+    """
+    Live progress counters of a running job.
+
+    The work of a job updates these counters as it goes; they are cheap to
+    update and are copied to the 'jobs' table every JOB_PROGRESS_INTERVAL seconds.
+
+    Attributes:
+        rows_processed (int): The number of rows processed so far.
+        rows_total (Optional[int]): The total number of rows, when known in advance.
+        bytes_processed (int): The number of input bytes consumed so far.
+        bytes_total (Optional[int]): The size of the input in bytes, when known.
+    """
+    rows_processed: int = 0
+    rows_total: Optional[int] = None
+    bytes_processed: int = 0
+    bytes_total: Optional[int] = None
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """
+        The estimated share of the work done, from the row counts when the total
+        is known and from the consumed input bytes otherwise.
+        """
+        if self.rows_total:
+            return min(self.rows_processed / self.rows_total, 1.0)
+        if self.bytes_total:
+            return min(self.bytes_processed / self.bytes_total, 1.0)
+        return None
+
+
+# The work of a job receives its progress tracker and returns a JSON summary of its outcome
+JobWork = Callable[[ProgressTracker], Awaitable[Dict[str, Any]]]
+
+
+class JobRunner:
+    """
+    Run jobs as asyncio tasks in the current process, at most max_concurrency at a time.
+
+    Submitted jobs are recorded in the 'jobs' table as "queued" and wait for a
+    free slot; each job then runs with its own database sessions, since it
+    outlives the request that submitted it.
+    """
+
+    def __init__(self, max_concurrency: int, progress_interval: float):
+        self.progress_interval = progress_interval
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tasks: Dict[uuid.UUID, asyncio.Task] = {}
+        self._progress: Dict[uuid.UUID, ProgressTracker] = {}
+
+    async def submit(self, db: AsyncSession, kind: str, work: JobWork) -> Job:
+        """
+        Record a new job and schedule its work.
+
+        Args:
+            db (AsyncSession): The database session used to record the job.
+            kind (str): The kind of work the job performs.
+            work (JobWork): The coroutine function performing the work.
+
+        Returns:
+            Job: The recorded job, still queued.
+        """
+        job = Job(kind=kind, status="queued")
+        db.add(job)
+        await db.commit()
+        await db.refresh(job)
+
+        progress = ProgressTracker()
+        self._progress[job.id] = progress
+        task = asyncio.create_task(self._run(job.id, work, progress))
+        self._tasks[job.id] = task  # Keep a reference so the task is not garbage collected
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+        return job
+
+    def get_progress(self, job_id: uuid.UUID) -> Optional[ProgressTracker]:
+        """
+        Return the live progress of a job running in this process, if any.
+        """
+        return self._progress.get(job_id)
+
+    async def shutdown(self) -> None:
+        """
+        Cancel the jobs still queued or running, and wait until each has been recorded as failed.
+        """
+        job_ids = list(self._tasks)
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # A task cancelled before it started never ran, so its job is finished here
+        for job_id in job_ids:
+            self._progress.pop(job_id, None)
+        if job_ids:
+            await _fail_unfinished_jobs(Job.id.in_(job_ids), error="Interrupted by an application shutdown")
+
+    async def _run(self, job_id: uuid.UUID, work: JobWork, progress: ProgressTracker) -> None:
+        # The job is finished in every case, including a failed status write and cancellation,
+        # so it is never left "queued" or "running" and its progress entry is always removed
+        reporter = None
+        outcome: Dict[str, Any] = {"status": "failed", "error": "Job was interrupted"}
+        try:
+            async with self._semaphore:
+                await _update_job(job_id, status="running", started_at=datetime.datetime.utcnow())
+                reporter = asyncio.create_task(self._report_progress(job_id, progress))
+                result = await work(progress)
+                outcome = {"status": "completed", "result": result}
+        except Exception as e:
+            logger.exception("Job %s failed", job_id)
+            outcome = {"status": "failed", "error": str(e)}
+        except BaseException:
+            # Cancelled, e.g. by shutdown(), or the process is exiting
+            logger.warning("Job %s was interrupted", job_id)
+            raise
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+            try:
+                await _update_job(
+                    job_id,
+                    rows_processed=progress.rows_processed,
+                    rows_total=progress.rows_total,
+                    finished_at=datetime.datetime.utcnow(),
+                    **outcome
+                )
+            except Exception:
+                logger.exception("Could not record the outcome of job %s", job_id)
+            finally:
+                self._progress.pop(job_id, None)
+
+    async def _report_progress(self, job_id: uuid.UUID, progress: ProgressTracker) -> None:
+        # Copy the live counters to the database so every worker process can report them
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            await _update_job(job_id, rows_processed=progress.rows_processed, rows_total=progress.rows_total)
+
+
+async def _update_job(job_id: uuid.UUID, **values: Any) -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(update(Job).where(Job.id == job_id).values(**values))
+        await session.commit()
+
+
+# The job runner shared by the whole application
+job_runner = JobRunner(settings.JOB_MAX_CONCURRENCY, settings.JOB_PROGRESS_INTERVAL)
+
+
+async def _fail_unfinished_jobs(*criteria: Any, error: str) -> int:
+    # Mark the matching jobs that are still "queued" or "running" as failed
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            update(Job)
+            .where(Job.status.in_(["queued", "running"]), *criteria)
+            .values(status="failed", error=error, finished_at=datetime.datetime.utcnow())
+        )
+        await session.commit()
+    return result.rowcount
+
+
+async def fail_interrupted_jobs() -> int:
+    """
+    Mark the jobs left "queued" or "running" by a previous run of the application as failed.
+
+    Jobs run in the process that submitted them, so a job still queued or running
+    when the application starts was interrupted by a stop or a crash and will
+    never finish. This is meant to run at startup, before any job is submitted;
+    with several worker processes it also fails the jobs of workers that are
+    already running.
+
+    Returns:
+        int: The number of jobs marked as failed.
+    """
+    count = await _fail_unfinished_jobs(error="Interrupted by an application restart")
+    if count:
+        logger.warning("Marked %d interrupted jobs as failed", count)
+    return count
+
+
+async def get_job(db: AsyncSession, job_id: uuid.UUID) -> Optional[schemas.Job]:
+    """
+    Retrieve a job, with the live progress counters if it is running in this process.
+
+    Args:
+        db (AsyncSession): The database session used to query the database.
+        job_id (uuid.UUID): The ID of the job to retrieve.
+
+    Returns:
+        Optional[schemas.Job]: The job, or None if it does not exist.
+    """
+    job = (await db.execute(lambda_stmt(lambda: select(Job).filter(Job.id == job_id)))).scalar_one_or_none()
+    if job is None:
+        return None
+    job_schema = schemas.Job.model_validate(job)
+    progress = job_runner.get_progress(job_id)
+    if progress is not None and job_schema.status == "running":
+        job_schema.rows_processed = progress.rows_processed
+        job_schema.rows_total = progress.rows_total
+    return job_schema
+
+
+async def get_job_progress(db: AsyncSession, job_id: uuid.UUID) -> Optional[schemas.JobProgress]:
+    """
+    Compute the progress of a job: rows processed, throughput and estimated time remaining.
+
+    The estimate assumes the remaining work proceeds at the average throughput so
+    far. It is based on the row counts when the total is known, and on the share
+    of the input consumed otherwise.
+
+    Args:
+        db (AsyncSession): The database session used to query the database.
+        job_id (uuid.UUID): The ID of the job.
+
+    Returns:
+        Optional[schemas.JobProgress]: The progress of the job, or None if it does not exist.
+    """
+    job = await get_job(db, job_id)
+    if job is None:
+        return None
+
+    if job.started_at is None:
+        return schemas.JobProgress(job_id=job.id, status=job.status, rows_processed=0, rows_total=job.rows_total)
+
+    finished_at = job.finished_at or datetime.datetime.utcnow()
+    elapsed = max((finished_at - job.started_at).total_seconds(), 0.0)
+
+    if job.status == "completed":
+        fraction = 1.0
+    else:
+        progress = job_runner.get_progress(job_id)
+        if progress is not None:
+            fraction = progress.fraction
+        elif job.rows_total:
+            fraction = min(job.rows_processed / job.rows_total, 1.0)
+        else:
+            fraction = None
+
+    eta = None
+    if job.status == "running" and fraction:
+        eta = elapsed * (1 - fraction) / fraction
+
+    return schemas.JobProgress(
+        job_id=job.id,
+        status=job.status,
+        rows_processed=job.rows_processed,
+        rows_total=job.rows_total,
+        percent_complete=round(fraction * 100, 2) if fraction is not None else None,
+        elapsed_seconds=elapsed,
+        rows_per_second=job.rows_processed / elapsed if elapsed else None,
+        eta_seconds=eta
+    )
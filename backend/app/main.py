@@ -1,23 +1,47 @@
 from fastapi import FastAPI  # Importing the FastAPI framework to create the API application.
-from app.config import UUIDEncoder  # Importing the custom UUIDEncoder for JSON serialization of UUIDs.
-from fastapi.encoders import jsonable_encoder  # Importing the jsonable_encoder to convert objects to JSON-compatible formats.
+from app.serialization import ORJSONResponse  # Importing the response class rendering JSON with the application's serializer.
 from app.auth.router import router as auth_router  # Importing the authentication router for handling auth-related endpoints.
 from app.validator.router import router as validator_router  # Importing the validator router for handling validation-related endpoints.
+from app.jobs.router import router as jobs_router  # Importing the jobs router for tracking background jobs.
 # from app.normalizer.router import router as normalizer_router  # Importing the normalizer router (currently commented out).
 from app.config import settings  # Importing application settings for configuration.
+from app.executor import shutdown_process_pool  # Importing the process pool shutdown for the application lifespan.
+from app.auth.hashing import password_hasher  # Importing the password hashing pool for the application lifespan.
+from app.database import pool_status  # Importing the connection pool metrics.
+from app.jobs.service import fail_interrupted_jobs, job_runner  # Importing the background job runner for the application lifespan.
+from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 import os
 
 load_dotenv()
 database_url = os.getenv("DATABASE_URL")
-# Creating an instance of the FastAPI application with a title and a custom JSON encoder.
-app = FastAPI(title=settings.PROJECT_NAME, version=settings.PROJECT_VERSION, json_encoder=UUIDEncoder)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Manage application-wide resources.
+
+    The shared process pool and the password hashing pool are created on first use
+    and shut down when the application stops. Jobs interrupted by the previous stop
+    are marked as failed at startup, and jobs still running at shutdown are
+    cancelled and recorded as failed.
+    """
+    await fail_interrupted_jobs()
+    yield
+    await job_runner.shutdown()
+    shutdown_process_pool()
+    password_hasher.shutdown()
+
+# Creating an instance of the FastAPI application with a title, the orjson-backed default response class and the lifespan handler.
+app = FastAPI(title=settings.PROJECT_NAME, version=settings.PROJECT_VERSION, default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Including the authentication router with a specified prefix and tags for organization in the API documentation.
 app.include_router(auth_router, prefix="/api/v1/auth", tags=["auth"])
 # Including the validator router with a specified prefix and tags for organization in the API documentation.
 app.include_router(validator_router, prefix="/api/v1/validator", tags=["validator"])
+# Including the jobs router with a specified prefix and tags for organization in the API documentation.
+app.include_router(jobs_router, prefix="/api/v1/jobs", tags=["jobs"])
 # Including the normalizer router (currently commented out) with a specified prefix and tags for organization in the API documentation.
 # app.include_router(normalizer_router, prefix="/api/normalizer", tags=["normalizer"])
 
@@ -31,4 +55,17 @@ async def root():
     Returns:
         dict: A dictionary containing a welcome message.
     """
-    return {"message": "Welcome to the API"}  # Returning a welcome message as a JSON response.
\ No newline at end of file
+    return {"message": "Welcome to the API"}  # Returning a welcome message as a JSON response.
+
+@app.get("/api/v1/database/pool")  # Defining a GET endpoint reporting the state of the connection pool.
+async def database_pool():
+    """
+    Connection pool endpoint.
+
+    This endpoint reports the connections checked out of the database pool and
+    how long requests have waited for one.
+
+    Returns:
+        dict: The pool size, connection counts and checkout wait times.
+    """
+    return pool_status()  # Returning the pool metrics as a JSON response.
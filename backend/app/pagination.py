@@ -1,8 +1,14 @@
-from typing import Generic, TypeVar, List
+from typing import Any, Generic, Optional, Sequence, TypeVar, List
+import base64
+import binascii
+import datetime
+import uuid
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from fastapi import Query
+from sqlalchemy import Select, bindparam, select, func, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+from fastapi import HTTPException, Query, status
+from app import serialization
 
 # Define a type variable T that can be any type. This will be used for generic programming.
 T = TypeVar('T')
@@ -70,6 +76,138 @@ async def paginate(
         pages=pages
     )
 
+class CursorPage(BaseModel, Generic[T]):
+    """
+    A class to represent a page of a keyset-paginated response.
+
+    Attributes:
+        items (List[T]): A list of items of type T for the current page.
+        size (int): The maximum number of items per page.
+        next_cursor (Optional[str]): The opaque cursor of the next page, or None on the last page.
+        total (Optional[int]): The approximate number of matching items, when requested.
+    """
+    items: List[T]
+    size: int
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the ordering key of the last item of a page as an opaque cursor.
+
+    Args:
+        values (Sequence[Any]): The values of the ordering columns.
+
+    Returns:
+        str: A URL-safe cursor.
+    """
+    payload = serialization.dumps(list(values))
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str, order_by: Sequence[InstrumentedAttribute]) -> List[Any]:
+    """
+    Decode a cursor into the values of the ordering columns.
+
+    Args:
+        cursor (str): A cursor returned by encode_cursor.
+        order_by (Sequence[InstrumentedAttribute]): The ordering columns the cursor was built from.
+
+    Returns:
+        List[Any]: The values of the ordering columns, converted to their Python types.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
+    try:
+        values = serialization.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(order_by):
+            raise ValueError("cursor does not match the ordering")
+        decoded = []
+        for column, value in zip(order_by, values):
+            python_type = column.type.python_type
+            if value is not None and python_type is uuid.UUID:
+                value = uuid.UUID(value)
+            elif value is not None and python_type is datetime.datetime:
+                value = datetime.datetime.fromisoformat(value)
+            decoded.append(value)
+        return decoded
+    except (ValueError, TypeError, binascii.Error, NotImplementedError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+async def estimate_count(db: AsyncSession, query: Select) -> int:
+    """
+    Estimate the number of rows a query returns from the planner statistics.
+
+    The query is planned with EXPLAIN but not executed, so the cost does not grow
+    with the size of the table. The estimate is only as accurate as the table
+    statistics gathered by ANALYZE. The statement is rendered with its values
+    inlined and sent to the driver as is, so text such as ":name" inside a
+    value is not mistaken for a bind parameter.
+
+    Args:
+        db (AsyncSession): The database session to use for the query.
+        query (Select): The query to estimate.
+
+    Returns:
+        int: The estimated number of rows.
+    """
+    compiled = query.compile(bind=db.get_bind(), compile_kwargs={"literal_binds": True})
+    connection = await db.connection()
+    plan = (await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar()
+    if isinstance(plan, str):
+        plan = serialization.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+async def keyset_paginate(
+    db: AsyncSession,
+    query: Select,
+    order_by: Sequence[InstrumentedAttribute],
+    cursor: Optional[str] = None,
+    size: int = 10,
+    estimate_total: bool = False
+) -> CursorPage[T]:
+    """
+    Paginate the results of a query by keyset instead of by offset.
+
+    Each page continues after the ordering key of the last item of the previous
+    page, so with an index on the ordering columns every page costs the same no
+    matter how deep it is, and no COUNT(*) is run. The ordering columns must
+    identify items uniquely, e.g. by ending with the primary key, and are sorted
+    in ascending order.
+
+    Args:
+        db (AsyncSession): The database session to use for the query.
+        query (Select): The query selecting a single entity, with any filters applied.
+        order_by (Sequence[InstrumentedAttribute]): The columns of the ordering key.
+        cursor (Optional[str]): The next_cursor of the previous page, or None for the first page.
+        size (int, optional): The number of items per page. Defaults to 10.
+        estimate_total (bool, optional): Whether to include an approximate total from the
+            planner statistics. Defaults to False.
+
+    Returns:
+        CursorPage[T]: The items of the page and the cursor of the next page.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
+    total = await estimate_count(db, query) if estimate_total else None
+
+    page_query = query
+    if cursor is not None:
+        values = decode_cursor(cursor, order_by)
+        page_query = page_query.where(
+            tuple_(*order_by) > tuple_(*[bindparam(None, value, type_=column.type) for column, value in zip(order_by, values)])
+        )
+
+    # Fetch one extra item to find out whether there is a next page
+    items = (await db.execute(page_query.order_by(*order_by).limit(size + 1))).scalars().all()
+    next_cursor = None
+    if len(items) > size:
+        items = items[:size]
+        next_cursor = encode_cursor([getattr(items[-1], column.key) for column in order_by])
+
+    return CursorPage(items=items, size=size, next_cursor=next_cursor, total=total)
+
 # Usage example:
 # @app.get("/items", response_model=Page[Item])
 # async def read_items(
@@ -78,3 +216,11 @@ async def paginate(
 #     size: int = Query(10, ge=1, le=100)
 # ):
 #     return await paginate(db, Item, page, size)
+#
+# @app.get("/items/keyset", response_model=CursorPage[Item])
+# async def read_items_by_keyset(
+#     db: AsyncSession = Depends(get_db),
+#     cursor: Optional[str] = None,
+#     size: int = Query(10, ge=1, le=100)
+# ):
+#     return await keyset_paginate(db, select(Item), [Item.created_at, Item.id], cursor, size, estimate_total=True)
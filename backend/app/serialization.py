@@ -0,0 +1,95 @@
+"""
+Serialization Module
+
+This module is the single place where the application encodes and decodes JSON.
+It is backed by orjson, which serializes UUIDs, datetimes, dates, dataclasses and
+numpy values natively, so no Python-level encoder runs for the common types.
+
+It provides:
+- dumps / loads for payloads, stored rows and cursors
+- dumps_lines for newline-delimited JSON streams
+- dumps_str, the JSON serializer of the database engine for JSON and JSONB columns
+- ORJSONResponse, the default response class of the application
+"""
+
+from decimal import Decimal
+from typing import Any, Iterable
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# Options shared by every encoding: allow non-string keys and numpy values from pandas
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    # Only called for the types orjson does not serialize natively
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return jsonable_encoder(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON.
+
+    Args:
+        obj (Any): The object to serialize.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    return orjson.dumps(obj, default=_default, option=OPTIONS)
+
+
+def dumps_str(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj (Any): The object to serialize.
+
+    Returns:
+        str: The JSON document.
+    """
+    return orjson.dumps(obj, default=_default, option=OPTIONS).decode("utf-8")
+
+
+def dumps_lines(objs: Iterable[Any]) -> bytes:
+    """
+    Serialize objects to newline-delimited JSON, one object per line.
+
+    Args:
+        objs (Iterable[Any]): The objects to serialize.
+
+    Returns:
+        bytes: The UTF-8 encoded lines, each terminated by a newline.
+    """
+    return b"".join(orjson.dumps(obj, default=_default, option=OPTIONS | orjson.OPT_APPEND_NEWLINE) for obj in objs)
+
+
+def loads(data: Any) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data (Any): The document, as bytes, bytearray, memoryview or str.
+
+    Returns:
+        Any: The deserialized object.
+    """
+    return orjson.loads(data)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with the application's serializer.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -6,7 +6,10 @@ from .utils import (
     validate_required,
     validate_email,
     validate_country_code,
-    validate_field
+    validate_field,
+    compile_rules,
+    check_value,
+    regex_cache_info
 )
 
 __all__ = [
@@ -17,5 +20,8 @@ __all__ = [
     "validate_required",
     "validate_email",
     "validate_country_code",
-    "validate_field"
+    "validate_field",
+    "compile_rules",
+    "check_value",
+    "regex_cache_info"
 ]
\ No newline at end of file
@@ -0,0 +1,122 @@
+import lzma
+import zlib
+from typing import Iterable, Iterator, List, Optional
+
+try:
+    import zstandard
+except ImportError:  # The zstd codec is optional
+    zstandard = None
+
+# Codecs supported for stored import payloads, in order of preference
+CODECS = ("zstd", "zlib", "lzma")
+
+
+def available_codecs() -> List[str]:
+    """
+    Return the codecs that can be used in this environment.
+    """
+    return [codec for codec in CODECS if codec != "zstd" or zstandard is not None]
+
+
+def _check_codec(codec: str) -> None:
+    if codec not in CODECS:
+        raise ValueError(f"Unsupported compression codec: {codec}")
+    if codec == "zstd" and zstandard is None:
+        raise RuntimeError("The zstd codec requires the zstandard package")
+
+
+def compressor(codec: str):
+    """
+    Create a streaming compressor for a codec.
+
+    Args:
+        codec (str): The name of the codec: "zlib", "lzma" or "zstd".
+
+    Returns:
+        An object whose compress(data) method returns the next compressed bytes
+        and whose flush() method returns the final ones.
+
+    Raises:
+        ValueError: If the codec is not supported.
+        RuntimeError: If the codec's package is not installed.
+    """
+    _check_codec(codec)
+    if codec == "zlib":
+        return zlib.compressobj()
+    if codec == "lzma":
+        return lzma.LZMACompressor()
+    return zstandard.ZstdCompressor().compressobj()
+
+
+def decompressor(codec: str):
+    """
+    Create a streaming decompressor for a codec.
+
+    Args:
+        codec (str): The name of the codec: "zlib", "lzma" or "zstd".
+
+    Returns:
+        An object whose decompress(data) method returns the next decompressed bytes.
+
+    Raises:
+        ValueError: If the codec is not supported.
+        RuntimeError: If the codec's package is not installed.
+    """
+    _check_codec(codec)
+    if codec == "zlib":
+        return zlib.decompressobj()
+    if codec == "lzma":
+        return lzma.LZMADecompressor()
+    return zstandard.ZstdDecompressor().decompressobj()
+
+
+def iter_decompressed(data: bytes, codec: Optional[str], chunk_size: int) -> Iterator[bytes]:
+    """
+    Decompress a payload piece by piece.
+
+    The payload is fed to the decompressor in slices of chunk_size bytes, so the
+    decompressed payload is never held in memory as a whole.
+
+    Args:
+        data (bytes): The stored payload.
+        codec (Optional[str]): The codec of the payload, or None if it is not compressed.
+        chunk_size (int): The number of stored bytes decompressed at a time.
+
+    Yields:
+        bytes: The next piece of the decompressed payload.
+    """
+    view = memoryview(data)
+    if codec is None:
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size].tobytes()
+        return
+    stream = decompressor(codec)
+    for start in range(0, len(view), chunk_size):
+        piece = stream.decompress(view[start:start + chunk_size])
+        if piece:
+            yield piece
+    if codec != "lzma":
+        piece = stream.flush()
+        if piece:
+            yield piece
+
+
+def iter_lines(pieces: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Split a stream of byte pieces into newline-terminated lines.
+
+    Args:
+        pieces (Iterable[bytes]): The pieces of the stream.
+
+    Yields:
+        bytes: Each non-empty line, without its newline.
+    """
+    pending = b""
+    for piece in pieces:
+        lines = (pending + piece).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            if line:
+                yield line
+    if pending:
+        yield pending
@@ -0,0 +1,8 @@
+import re
+
+# Maximum number of distinct compiled regular expressions kept by the validator's pattern cache
+REGEX_CACHE_SIZE = 512
+
+# Pattern used to validate email addresses, compiled once at import time
+EMAIL_REGEX = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+EMAIL_PATTERN = re.compile(EMAIL_REGEX)
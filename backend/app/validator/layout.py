@@ -0,0 +1,112 @@
+import math
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+# Share of the typical row width that a record must span to be taken as the header
+HEADER_FILL_RATIO = 0.8
+
+
+class TableLayout(NamedTuple):
+    """
+    The position of a table within a sheet of raw records.
+
+    Attributes:
+        header_row (int): The index of the header record.
+        first_column (int): The index of the first column of the table.
+        last_column (int): The index just past the last column of the table.
+    """
+    header_row: int
+    first_column: int
+    last_column: int
+
+
+def is_blank(value: Any) -> bool:
+    """
+    Check whether a cell is empty: None, or a string of whitespace.
+    """
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _is_numeric(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return True
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def detect_layout(sample: Sequence[Sequence[Any]]) -> Optional[TableLayout]:
+    """
+    Find the header row and the column window of the table in a sampled prefix of records.
+
+    Banner rows such as titles, notes and report dates span only a few cells,
+    while the header and data rows span the width of the table. The typical
+    width is the most common span, from the first to the last filled cell,
+    among the records with at least two filled cells, so blank header names
+    and blank values do not narrow it. The header is the first record that
+    spans most of that width with mostly non-numeric cells, and the column
+    window covers the filled cells of the header and of the sampled records
+    below it.
+
+    Args:
+        sample (Sequence[Sequence[Any]]): The first records of the file.
+
+    Returns:
+        Optional[TableLayout]: The layout of the table, or None if the sample is blank.
+    """
+    filled = [[position for position, value in enumerate(record) if not is_blank(value)] for record in sample]
+    spans = [positions[-1] - positions[0] + 1 if len(positions) >= 2 else 0 for positions in filled]
+    widths = Counter(span for span in spans if span)
+
+    if widths:
+        # Prefer the wider table when two widths are equally common
+        width = max(widths, key=lambda span: (widths[span], span))
+        threshold = max(2, math.ceil(width * HEADER_FILL_RATIO))
+        candidates = [index for index, span in enumerate(spans) if span >= threshold]
+        header_row = next(
+            (
+                index for index in candidates
+                if sum(_is_numeric(sample[index][position]) for position in filled[index]) * 2 < len(filled[index])
+            ),
+            candidates[0]
+        )
+    else:
+        # A single-column table starts at its first filled record
+        header_row = next((index for index, positions in enumerate(filled) if positions), None)
+        if header_row is None:
+            return None
+
+    region = [positions for positions in filled[header_row:] if positions]
+    return TableLayout(
+        header_row=header_row,
+        first_column=min(positions[0] for positions in region),
+        last_column=max(positions[-1] for positions in region) + 1
+    )
+
+
+def column_names(values: Sequence[Any]) -> List[str]:
+    """
+    Build column names from the header cells of a table, the way pandas does:
+    blank names become "Unnamed: <position>" and repeated names get a ".<n>" suffix.
+
+    Args:
+        values (Sequence[Any]): The header cells within the column window.
+
+    Returns:
+        List[str]: One unique name per column.
+    """
+    names = []
+    seen: Dict[str, int] = {}
+    for position, value in enumerate(values):
+        name = f"Unnamed: {position}" if is_blank(value) else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
@@ -1,9 +1,9 @@
 from typing import Optional
 from sqlalchemy.orm import relationship, declarative_base
-from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID, JSONB
 import uuid
 import datetime
-from sqlalchemy import DateTime, LargeBinary, String, ForeignKey
+from sqlalchemy import BigInteger, DateTime, Index, Integer, LargeBinary, String, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
 Base = declarative_base()
@@ -20,7 +20,17 @@ class ImportedData(Base):
         id (UUID): A unique identifier for the imported data, automatically generated.
         file_name (str): The name of the file that was uploaded.
         uploaded_at (datetime): The timestamp indicating when the file was uploaded.
-        data_content (bytes): The binary content of the uploaded file, stored as large binary data.
+        data_content (bytes): The stored payload of the import, as large binary data: a JSON
+                              document for legacy imports, or newline-delimited JSON rows.
+        data_codec (str): The compression codec of data_content, or null if it is not compressed.
+        row_count (int): The number of rows stored for this import.
+        storage_format (str): Where the rows are stored: "json" for a blob in data_content,
+                              "ndjson" for newline-delimited rows in data_content,
+                              "rows" for the 'imported_rows' table, or "parquet" for a columnar file.
+        storage_path (str): The path of the columnar file, relative to the storage directory.
+        columns (list): The column names of the imported table.
+        byte_size (int): The size of the uploaded file in bytes.
+        preview (list): The first rows of the import.
     """
     __tablename__ = "imported_data"
 
@@ -36,9 +46,59 @@ class ImportedData(Base):
     # Binary content of the uploaded file, can be null
     data_content: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
 
+    # Compression codec of the binary content, null if it is stored uncompressed
+    data_codec: Mapped[str | None] = mapped_column(String, nullable=True)
+
+    # Number of rows stored for the import, null for legacy JSON blob imports
+    row_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    # Storage format of the rows, defaults to the legacy JSON blob
+    storage_format: Mapped[str] = mapped_column(String, nullable=False, default="json")
+
+    # Path of the columnar file relative to the storage directory, can be null
+    storage_path: Mapped[str | None] = mapped_column(String, nullable=True)
+
+    # Column names, upload size and first rows of the import, used to describe it without reading its rows
+    columns: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    byte_size: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    preview: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+
+    # Relationship to the ImportedRow model, holding one entry per imported row
+    rows: Mapped[list["ImportedRow"]] = relationship("ImportedRow", back_populates="imported_data", passive_deletes=True)
+
     # Relationship to the ValidationResult model, indicating validation results for this imported data
     validation_results: Mapped[list["ValidationResult"]] = relationship("ValidationResult", back_populates="imported_data")
 
+    # Relationship to the ValidationSummary model, holding the per-field counts of each validation run
+    validation_summaries: Mapped[list["ValidationSummary"]] = relationship("ValidationSummary", back_populates="imported_data")
+
+
+class ImportedRow(Base):
+    """
+    Represents the 'imported_rows' table in the database.
+
+    This model stores the imported data one row at a time, so that large imports
+    can be read, paged and validated without materializing the whole document.
+
+    Attributes:
+        imported_data_id (UUID): A foreign key referencing the ImportedData model, linking the row to its import.
+        row_index (int): The zero-based position of the row within the imported file.
+        data (dict): The content of the row, keyed by column name.
+    """
+    __tablename__ = "imported_rows"
+
+    # Foreign key linking to the imported data, part of the primary key
+    imported_data_id: Mapped[uuid.UUID] = mapped_column(PostgresUUID(as_uuid=True), ForeignKey("imported_data.id", ondelete="CASCADE"), primary_key=True)
+
+    # Position of the row within the imported file, part of the primary key
+    row_index: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    # Content of the row, stored as JSONB
+    data: Mapped[dict] = mapped_column(JSONB, nullable=False)
+
+    # Relationship to the ImportedData model, linking back to the imported data
+    imported_data: Mapped["ImportedData"] = relationship("ImportedData", back_populates="rows")
+
 
 class ValidationResult(Base):
     """
@@ -51,10 +111,17 @@ class ValidationResult(Base):
         id (UUID): A unique identifier for the validation result, automatically generated.
         imported_data_id (UUID): A foreign key referencing the ImportedData model, linking the result to the corresponding imported data.
         field_name (str): The name of the specific field that was validated.
+        row_index (int): The index of the imported row the field belongs to.
         validation_status (str): The status of the validation, indicating whether it is "valid" or "invalid".
         error_message (str): An error message providing details if the validation failed.
     """
     __tablename__ = "validation_results"
+    __table_args__ = (
+        # Serve the listing of the results of an import filtered by status and field, in row order
+        Index("ix_validation_results_import_status_field", "imported_data_id", "validation_status", "field_name", "row_index"),
+        # Serve the unfiltered listing and row ranges of the results of an import
+        Index("ix_validation_results_import_row", "imported_data_id", "row_index"),
+    )
 
     # Unique identifier for the validation result
     id: Mapped[uuid.UUID] = mapped_column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -65,6 +132,9 @@ class ValidationResult(Base):
     # Name of the field that was validated, cannot be null
     field_name: Mapped[str] = mapped_column(String, nullable=False)
 
+    # Index of the imported row the validated field belongs to, can be null
+    row_index: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
     # Status of the validation, cannot be null
     validation_status: Mapped[str] = mapped_column(String, nullable=False)
 
@@ -72,4 +142,47 @@ class ValidationResult(Base):
     error_message: Mapped[Optional[str]] = mapped_column(String)
 
     # Relationship to the ImportedData model, linking back to the imported data
-    imported_data: Mapped["ImportedData"] = relationship("ImportedData", back_populates="validation_results")
\ No newline at end of file
+    imported_data: Mapped["ImportedData"] = relationship("ImportedData", back_populates="validation_results")
+
+
+class ValidationSummary(Base):
+    """
+    Represents the 'validation_summaries' table in the database.
+
+    This model stores the aggregate counts of one field for one validation run,
+    so that valid values do not need a row each in 'validation_results'.
+
+    Attributes:
+        id (UUID): A unique identifier for the summary, automatically generated.
+        imported_data_id (UUID): A foreign key referencing the ImportedData model, linking the summary to the corresponding imported data.
+        field_name (str): The name of the validated field.
+        valid_count (int): The number of non-empty values that passed every rule.
+        invalid_count (int): The number of values that failed at least one rule.
+        missing_count (int): The number of rows where the field is absent, null or empty and no rule failed.
+        storage_mode (str): The result storage mode of the run, either "all" or "failures_only".
+        created_at (datetime): The timestamp of the validation run.
+    """
+    __tablename__ = "validation_summaries"
+
+    # Unique identifier for the summary
+    id: Mapped[uuid.UUID] = mapped_column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # Foreign key linking to the imported data, cannot be null
+    imported_data_id: Mapped[uuid.UUID] = mapped_column(PostgresUUID(as_uuid=True), ForeignKey("imported_data.id"), nullable=False)
+
+    # Name of the field that was validated, cannot be null
+    field_name: Mapped[str] = mapped_column(String, nullable=False)
+
+    # Aggregate counts of the field, cannot be null
+    valid_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    invalid_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    missing_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Result storage mode used by the validation run, cannot be null
+    storage_mode: Mapped[str] = mapped_column(String, nullable=False)
+
+    # Timestamp of the validation run, defaults to the current UTC time
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=datetime.datetime.utcnow)
+
+    # Relationship to the ImportedData model, linking back to the imported data
+    imported_data: Mapped["ImportedData"] = relationship("ImportedData", back_populates="validation_summaries")
@@ -0,0 +1,655 @@
+import asyncio
+import csv
+import codecs
+import collections
+import datetime
+import io
+import logging
+from typing import Any, AsyncIterable, AsyncIterator, BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
+import chardet
+import openpyxl
+import pandas as pd
+from fastapi import UploadFile
+from app.executor import iter_in_thread, pool_size, run_cpu_bound
+from . import layout
+
+T = TypeVar('T')
+
+logger = logging.getLogger(__name__)
+
+# Delimiters considered when sniffing the dialect of a CSV file
+SNIFF_DELIMITERS = ",;\t|"
+
+# Byte order marks, longest first since the UTF-32 LE mark starts with the UTF-16 LE mark
+BYTE_ORDER_MARKS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
+# Encoding used for the rest of a file sniffed as UTF-8 once an invalid byte turns up past the sample
+FALLBACK_ENCODING = "cp1252"
+
+
+class CsvDecodeError(ValueError):
+    """
+    Raised when a CSV file cannot be decoded with its detected encoding.
+    """
+
+
+class CsvFormat(NamedTuple):
+    """
+    The encoding and dialect of a CSV file.
+
+    Attributes:
+        encoding (str): The text encoding; BOM-aware codecs strip the byte order mark.
+        delimiter (str): The field delimiter.
+        quotechar (str): The character quoting fields that contain special characters.
+        skipinitialspace (bool): Whether whitespace following a delimiter is ignored.
+    """
+    encoding: str = "utf-8"
+    delimiter: str = ","
+    quotechar: str = '"'
+    skipinitialspace: bool = False
+
+    def reader_options(self) -> Dict[str, Any]:
+        """
+        Return the keyword arguments for csv.reader.
+        """
+        return {"delimiter": self.delimiter, "quotechar": self.quotechar, "skipinitialspace": self.skipinitialspace}
+
+
+async def iter_upload_chunks(file: UploadFile, chunk_size: int) -> AsyncIterator[bytes]:
+    """
+    Read an uploaded file in fixed-size chunks.
+
+    Args:
+        file (UploadFile): The uploaded file to read.
+        chunk_size (int): The maximum number of bytes to read per chunk.
+
+    Yields:
+        bytes: The next chunk of the file, until the file is exhausted.
+    """
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def detect_encoding(sample: bytes) -> str:
+    """
+    Detect the text encoding of a file from a sample of its first bytes.
+
+    A byte order mark decides the encoding. Otherwise UTF-8 is used when the
+    sample is valid UTF-8, allowing a character cut off at the end of the
+    sample, and chardet is consulted for anything else.
+
+    Args:
+        sample (bytes): The first bytes of the file.
+
+    Returns:
+        str: The name of the encoding.
+    """
+    for mark, encoding in BYTE_ORDER_MARKS:
+        if sample.startswith(mark):
+            return encoding
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    try:
+        return codecs.lookup(chardet.detect(sample)["encoding"]).name
+    except (LookupError, TypeError):
+        return "latin-1"  # Decodes any byte sequence
+
+
+def sniff_csv_format(sample: bytes) -> CsvFormat:
+    """
+    Detect the encoding and dialect of a CSV file from a sample of its first bytes.
+
+    The dialect is sniffed from the complete records of the decoded sample. When
+    it cannot be determined, the standard comma-separated dialect is assumed.
+
+    Args:
+        sample (bytes): The first bytes of the file.
+
+    Returns:
+        CsvFormat: The detected encoding and dialect.
+    """
+    encoding = detect_encoding(sample)
+    text = codecs.getincrementaldecoder(encoding)(errors="replace").decode(sample)
+    end = text.rfind("\n")
+    if end > 0:
+        text = text[:end]  # Drop the record cut off at the end of the sample
+    try:
+        dialect = csv.Sniffer().sniff(text, delimiters=SNIFF_DELIMITERS)
+    except csv.Error:
+        return CsvFormat(encoding=encoding)
+    return CsvFormat(
+        encoding=encoding,
+        delimiter=dialect.delimiter,
+        quotechar=dialect.quotechar or '"',
+        skipinitialspace=dialect.skipinitialspace
+    )
+
+
+async def sniff_csv(chunks: AsyncIterable[bytes], sample_size: int) -> Tuple[CsvFormat, AsyncIterator[bytes]]:
+    """
+    Detect the format of a CSV stream from its first sample_size bytes.
+
+    The chunks read for the sample are replayed in front of the remaining ones,
+    so the upload is still read only once.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The raw chunks of the CSV file.
+        sample_size (int): The number of leading bytes to inspect.
+
+    Returns:
+        Tuple[CsvFormat, AsyncIterator[bytes]]: The detected format and the complete stream of chunks.
+    """
+    chunks = chunks.__aiter__()
+    buffered = []
+    buffered_size = 0
+    async for chunk in chunks:
+        buffered.append(chunk)
+        buffered_size += len(chunk)
+        if buffered_size >= sample_size:
+            break
+    sample = b"".join(buffered)[:sample_size]
+    csv_format = await run_cpu_bound(sniff_csv_format, sample)
+
+    async def replay() -> AsyncIterator[bytes]:
+        for chunk in buffered:
+            yield chunk
+        async for chunk in chunks:
+            yield chunk
+
+    return csv_format, replay()
+
+
+class FallbackDecoder:
+    """
+    Incrementally decode a file with its detected encoding, falling back when that guess proves wrong.
+
+    The encoding is detected from a sample of the first bytes, so a file sniffed
+    as UTF-8 may still hold legacy single-byte text further down, such as an
+    accented Latin-1 name after thousands of ASCII rows. At the first invalid
+    byte, the rest of such a file is decoded as FALLBACK_ENCODING; the valid
+    text before it is kept as decoded. Other encodings have no safe fallback,
+    and invalid bytes raise CsvDecodeError naming the encoding and the offset.
+
+    Attributes:
+        encoding (str): The encoding currently used to decode.
+    """
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._offset = 0  # The number of bytes passed to the decoder so far
+
+    def decode(self, data: bytes, final: bool = False) -> str:
+        """
+        Decode the next bytes of the file.
+
+        Args:
+            data (bytes): The next bytes.
+            final (bool): Whether these are the last bytes of the file.
+
+        Returns:
+            str: The decoded text.
+
+        Raises:
+            CsvDecodeError: If the bytes are invalid in an encoding without a fallback.
+        """
+        buffered = self._decoder.getstate()[0]  # Bytes of a character split across chunks
+        try:
+            text = self._decoder.decode(data, final)
+        except UnicodeDecodeError as e:
+            if codecs.lookup(self.encoding).name != "utf-8":
+                position = self._offset - len(buffered) + e.start
+                raise CsvDecodeError(
+                    f"The file could not be decoded as {self.encoding}: invalid byte at offset {position}"
+                ) from e
+            logger.warning("Invalid UTF-8 at byte %d, decoding the rest of the file as %s", self._offset - len(buffered) + e.start, FALLBACK_ENCODING)
+            pending = buffered + data
+            valid = pending[:e.start].decode(self.encoding)
+            self.encoding = FALLBACK_ENCODING
+            # The few bytes cp1252 leaves undefined are replaced rather than failing the import
+            self._decoder = codecs.getincrementaldecoder(FALLBACK_ENCODING)(errors="replace")
+            text = valid + self._decoder.decode(pending[e.start:], final)
+        self._offset += len(data)
+        return text
+
+
+class RecordBoundaryScanner:
+    """
+    Find the ends of complete CSV records in a stream of decoded text.
+
+    A newline only terminates a record when it is not inside a quoted field. As
+    in the csv module, a quote character only opens a quoted field at the start
+    of a field, so a quote inside an unquoted value, such as an inch mark, is a
+    literal character. The quoting state is carried from one piece of text to
+    the next, so every character is scanned once no matter how long a record is.
+
+    Attributes:
+        csv_format (CsvFormat): The dialect of the stream.
+    """
+
+    def __init__(self, csv_format: CsvFormat = CsvFormat()):
+        self.csv_format = csv_format
+        self._in_quotes = False
+        self._quote_pending = False  # A quote ended the previous piece inside a quoted field
+        self._previous = "\n"  # The last character that decides whether a field starts, initially a record end
+
+    def _at_field_start(self, text: str, position: int, start: int) -> bool:
+        # Whether a quote at position opens a field: it follows a delimiter, a line end or the start of the stream
+        index = position - 1
+        if self.csv_format.skipinitialspace:
+            while index >= start and text[index] == " ":
+                index -= 1
+        previous = text[index] if index >= start else self._previous
+        return previous in (self.csv_format.delimiter, "\n", "\r")
+
+    def feed(self, text: str) -> int:
+        """
+        Scan the next piece of the stream.
+
+        Args:
+            text (str): The text following the previously scanned pieces.
+
+        Returns:
+            int: The offset in text just past the last record end found in it,
+                 or 0 if the piece does not end any record.
+        """
+        quotechar = self.csv_format.quotechar
+        boundary = 0
+        position = 0
+        if self._quote_pending and text:
+            self._quote_pending = False
+            if text[0] == quotechar:
+                position = 1  # An escaped quote, still inside the quoted field
+            else:
+                self._in_quotes = False  # The quote closed the field
+        while position < len(text):
+            quote = text.find(quotechar, position)
+            if self._in_quotes:
+                if quote == -1:
+                    break
+                if quote + 1 == len(text):
+                    self._quote_pending = True  # Decided by the first character of the next piece
+                    break
+                if text[quote + 1] == quotechar:
+                    position = quote + 2  # An escaped quote
+                else:
+                    self._in_quotes = False
+                    position = quote + 1
+                continue
+            stop = len(text) if quote == -1 else quote
+            newline = text.rfind("\n", position, stop)
+            if newline != -1:
+                boundary = newline + 1
+            if quote == -1:
+                break
+            self._in_quotes = self._at_field_start(text, quote, 0)
+            position = quote + 1
+
+        # Remember the last character deciding whether the next piece starts a field
+        tail = text.rstrip(" ") if self.csv_format.skipinitialspace else text
+        if tail:
+            self._previous = tail[-1]
+        return boundary
+
+
+def find_record_boundary(text: str, csv_format: CsvFormat = CsvFormat()) -> int:
+    """
+    Find the end of the last complete CSV record in a block of text.
+
+    Args:
+        text (str): The decoded text to inspect, starting at the start of a record.
+        csv_format (CsvFormat): The dialect of the text.
+
+    Returns:
+        int: The offset just past the last complete record, or 0 if the text
+             does not yet contain a complete record.
+    """
+    return RecordBoundaryScanner(csv_format).feed(text)
+
+
+async def iter_csv_blocks(chunks: AsyncIterable[bytes], csv_format: CsvFormat = CsvFormat()) -> AsyncIterator[str]:
+    """
+    Decode byte chunks into blocks of text that end on CSV record boundaries.
+
+    An incremental decoder is used so multi-byte characters split across chunks
+    are decoded correctly, falling back to FALLBACK_ENCODING when a file sniffed
+    as UTF-8 turns out not to be, and only the trailing partial record is carried over
+    to the next chunk. Each chunk is scanned for record ends once, so a long
+    record does not make later chunks slower to scan.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The raw chunks of the CSV file.
+        csv_format (CsvFormat): The encoding and dialect of the file.
+
+    Yields:
+        str: A block of text containing only complete CSV records.
+    """
+    decoder = FallbackDecoder(csv_format.encoding)
+    scanner = RecordBoundaryScanner(csv_format)
+    pending: List[str] = []  # The pieces of the trailing partial record
+    async for chunk in chunks:
+        text = decoder.decode(chunk)
+        boundary = scanner.feed(text)  # Only the new text is scanned
+        if boundary:
+            pending.append(text[:boundary])
+            yield "".join(pending)
+            pending = [text[boundary:]]
+        else:
+            pending.append(text)
+    pending.append(decoder.decode(b"", final=True))
+    block = "".join(pending)
+    if block:
+        yield block
+
+
+def parse_csv_block(block: str, csv_format: CsvFormat = CsvFormat()) -> List[List[str]]:
+    """
+    Parse a block of complete CSV records into lists of values.
+
+    Args:
+        block (str): The text of the records.
+        csv_format (CsvFormat): The dialect of the records.
+
+    Returns:
+        List[List[str]]: The values of each record.
+    """
+    return list(csv.reader(io.StringIO(block, newline=""), **csv_format.reader_options()))
+
+
+async def iter_csv_records(chunks: AsyncIterable[bytes], csv_format: CsvFormat = CsvFormat()) -> AsyncIterator[List[str]]:
+    """
+    Parse raw CSV records incrementally from a stream of byte chunks.
+
+    Blocks are parsed by parse_csv_block in the process pool to keep the event
+    loop responsive. Up to one block per worker is in flight at a time, so the
+    blocks are parsed on several cores while the next ones are read, and the
+    records are yielded in file order.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The raw chunks of the CSV file.
+        csv_format (CsvFormat): The encoding and dialect of the file.
+
+    Yields:
+        List[str]: The values of each record.
+    """
+    max_in_flight = max(pool_size(), 1)
+    in_flight = collections.deque()
+    try:
+        async for block in iter_csv_blocks(chunks, csv_format):
+            in_flight.append(asyncio.ensure_future(run_cpu_bound(parse_csv_block, block, csv_format)))
+            if len(in_flight) > max_in_flight:
+                for record in await in_flight.popleft():
+                    yield record
+        while in_flight:
+            for record in await in_flight.popleft():
+                yield record
+    finally:
+        for parsing in in_flight:
+            parsing.cancel()  # The records are no longer needed when iteration stops early
+
+
+class TableRows:
+    """
+    Locate the table in a stream of raw records and iterate over its rows.
+
+    The first sample_size records are buffered and passed to detect_layout to find
+    the header row and the column window, so banner rows above the table and
+    cells outside it are skipped without reading the file twice. Rows that are
+    blank within the window are skipped, and short rows are padded with None.
+    The records are closed when iteration stops, even when it stops early.
+
+    Attributes:
+        columns (Optional[List[str]]): The header names of the table, set once the
+            layout has been detected, also when the table has no rows; empty if no
+            table was found.
+    """
+
+    def __init__(self, records: AsyncIterable[Sequence[Any]], sample_size: int):
+        self.columns: Optional[List[str]] = None
+        self._rows = self._iter_rows(records.__aiter__(), sample_size)
+
+    def __aiter__(self) -> "TableRows":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        return await self._rows.__anext__()
+
+    async def aclose(self) -> None:
+        """
+        Stop the iteration and close the records.
+        """
+        await self._rows.aclose()
+
+    async def _iter_rows(self, records: AsyncIterator[Sequence[Any]], sample_size: int) -> AsyncIterator[Dict[str, Any]]:
+        try:
+            sample = []
+            async for record in records:
+                sample.append(record)
+                if len(sample) >= sample_size:
+                    break
+
+            table_layout = layout.detect_layout(sample)
+            if table_layout is None:
+                self.columns = []
+                return
+            header_row, first_column, last_column = table_layout
+            header = layout.column_names(list(sample[header_row][first_column:last_column]))
+            self.columns = header
+            empty_row = dict.fromkeys(header)
+
+            def to_row(record: Sequence[Any]) -> Optional[Dict[str, Any]]:
+                values = record[first_column:last_column]
+                if all(layout.is_blank(value) for value in values):
+                    return None
+                row = empty_row.copy()
+                row.update(zip(header, values))
+                return row
+
+            for record in sample[header_row + 1:]:
+                row = to_row(record)
+                if row is not None:
+                    yield row
+            async for record in records:
+                row = to_row(record)
+                if row is not None:
+                    yield row
+        finally:
+            if hasattr(records, "aclose"):
+                await records.aclose()  # Release the file now, rather than when the records are garbage collected
+
+
+def iter_table_rows(records: AsyncIterable[Sequence[Any]], sample_size: int) -> TableRows:
+    """
+    Locate the table in a stream of raw records and iterate over its rows.
+
+    Args:
+        records (AsyncIterable[Sequence[Any]]): The raw records of the sheet.
+        sample_size (int): The number of leading records used to detect the layout.
+
+    Returns:
+        TableRows: One dictionary per table row, keyed by the header names, with
+        the header names in its columns attribute.
+    """
+    return TableRows(records, sample_size)
+
+
+def iter_csv_rows(
+    chunks: AsyncIterable[bytes],
+    csv_format: CsvFormat = CsvFormat(),
+    sample_size: int = 50
+) -> TableRows:
+    """
+    Parse CSV rows incrementally from a stream of byte chunks.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The raw chunks of the CSV file.
+        csv_format (CsvFormat): The encoding and dialect of the file, as detected by sniff_csv.
+        sample_size (int): The number of leading records used to detect the layout.
+
+    Returns:
+        TableRows: One dictionary per table row, keyed by the header names.
+    """
+    return iter_table_rows(iter_csv_records(chunks, csv_format), sample_size)
+
+
+def _xlsx_value(value: Any) -> Any:
+    """
+    Convert a cell value to a JSON-compatible value; dates and times become ISO 8601 strings.
+    """
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+def read_xlsx_batches(file: BinaryIO, batch_size: int) -> Iterator[List[List[Any]]]:
+    """
+    Read the raw records of the first worksheet of an XLSX workbook, in batches.
+
+    The workbook is opened in read-only mode, which parses the worksheet XML as
+    it is iterated instead of loading the whole sheet.
+
+    Args:
+        file (BinaryIO): A seekable file containing the workbook.
+        batch_size (int): The maximum number of records per batch.
+
+    Yields:
+        List[List[Any]]: The next batch of records, with JSON-compatible values.
+    """
+    workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        sheet.reset_dimensions()  # Ignore the stored sheet size, which some writers get wrong
+        batch = []
+        for values in sheet.iter_rows(values_only=True):
+            batch.append([_xlsx_value(value) for value in values])
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    finally:
+        workbook.close()
+
+
+def iter_xlsx_records(file: BinaryIO, batch_size: int) -> AsyncIterator[List[Any]]:
+    """
+    Stream the raw records of an XLSX workbook without blocking the event loop.
+
+    Each batch is parsed by read_xlsx_batches in a worker thread, so the first
+    records are available before the whole worksheet has been read. The
+    workbook is closed as soon as iteration stops, even when it stops early.
+
+    Args:
+        file (BinaryIO): A seekable file containing the workbook.
+        batch_size (int): The maximum number of records parsed per batch.
+
+    Returns:
+        AsyncIterator[List[Any]]: The values of each worksheet row.
+    """
+    return iter_in_thread(read_xlsx_batches(file, batch_size))
+
+
+def iter_xlsx_rows(file: BinaryIO, batch_size: int, sample_size: int = 50) -> TableRows:
+    """
+    Stream the table rows of an XLSX workbook.
+
+    Args:
+        file (BinaryIO): A seekable file containing the workbook.
+        batch_size (int): The maximum number of records parsed per batch.
+        sample_size (int): The number of leading records used to detect the layout.
+
+    Returns:
+        TableRows: One dictionary per table row, keyed by the header names.
+    """
+    return iter_table_rows(iter_xlsx_records(file, batch_size), sample_size)
+
+
+def read_xls_records(content: bytes) -> List[List[Any]]:
+    """
+    Read the raw records of the first worksheet of a legacy XLS workbook.
+
+    The sheet is read without a header row, so the table can be located by
+    iter_table_rows like the sheets of other formats.
+
+    Args:
+        content (bytes): The content of the workbook file.
+
+    Returns:
+        List[List[Any]]: The values of each worksheet row, with empty cells as None
+        and dates and times as ISO 8601 strings.
+    """
+    frame = pd.read_excel(io.BytesIO(content), header=None)
+    frame = frame.astype(object).where(frame.notna(), None)  # Store empty cells as null rather than NaN
+    return [[_xlsx_value(value) for value in record] for record in frame.itertuples(index=False, name=None)]
+
+
+async def iter_rows(rows: Iterable[T]) -> AsyncIterator[T]:
+    """
+    Expose an in-memory iterable of rows as an asynchronous iterator.
+
+    Args:
+        rows (Iterable[T]): The rows or raw records to yield.
+
+    Yields:
+        T: Each row in turn.
+    """
+    for row in rows:
+        yield row
+
+
+async def iter_batches(rows: AsyncIterable[T], batch_size: int) -> AsyncIterator[List[T]]:
+    """
+    Group a stream of rows into lists of at most batch_size rows.
+
+    Args:
+        rows (AsyncIterable[T]): The rows to group.
+        batch_size (int): The maximum number of rows per batch.
+
+    Yields:
+        List[T]: The next batch of rows.
+    """
+    batch = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class RowCounter:
+    """
+    Wrap an asynchronous iterable of rows and count the rows taken from it.
+
+    The count can be read at any time while the rows are being consumed, which
+    makes it usable both for final totals and for progress reporting.
+
+    Attributes:
+        count (int): The number of rows yielded so far.
+    """
+
+    def __init__(self, rows: AsyncIterable[T]):
+        self._rows = rows.__aiter__()
+        self.count = 0
+
+    def __aiter__(self) -> "RowCounter":
+        return self
+
+    async def __anext__(self) -> T:
+        row = await self._rows.__anext__()
+        self.count += 1
+        return row
@@ -1,11 +1,13 @@
-from typing import List
+from typing import List, Literal, Optional, Union
 import uuid
-from fastapi import APIRouter, Depends, UploadFile, File
-from fastapi.encoders import jsonable_encoder
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, UploadFile, File, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.validator import models, schemas, service
+from app.validator import models, readers, schemas, service
 from app.config import settings
+from app.jobs import schemas as job_schemas
+from app.pagination import CursorPage
 
 # Create an instance of the FastAPI router
 router = APIRouter()
@@ -41,44 +43,214 @@ async def create_validation_result(validation_result: schemas.ValidationResultCr
     # Return the created validation result
     return db_validation_result
 
-@router.post("/import/", response_model=schemas.ImportedDataResponse)
-async def import_data(file: UploadFile = File(...), db: Session = Depends(get_db)):
+@router.post("/import/", response_model=Union[schemas.ImportedDataResponse, job_schemas.Job])
+async def import_data(
+    response: Response,
+    file: UploadFile = File(...),
+    background: bool = False,
+    db: Session = Depends(get_db)
+):
     """
     Import data from an uploaded file.
 
     This endpoint allows users to upload a file, which will be processed
     to import data into the system. The file must be provided in the
-    request body.
+    request body. With background=true the import runs as a background job
+    and the queued job is returned immediately with status 202.
 
     Args:
+        response (Response): The response, whose status code is set for background imports.
         file (UploadFile): The file to be uploaded and processed.
+        background (bool): Whether to run the import as a background job. Defaults to False.
         db (Session, optional): The database session dependency. Defaults to Depends(get_db).
 
     Returns:
-        schemas.ImportedDataResponse: The response containing the result of the import operation.
+        Union[schemas.ImportedDataResponse, job_schemas.Job]: The result of the import operation, or the queued job.
+
+    Raises:
+        HTTPException: If a CSV file cannot be decoded with its detected encoding.
     """
+    if background:
+        response.status_code = status.HTTP_202_ACCEPTED
+        return await service.submit_import_job(db, file)
+
     # Call the service to handle the import logic
-    result = await service.import_data(db, file)
+    try:
+        result = await service.import_data(db, file)
+    except readers.CsvDecodeError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     # Return the result of the import operation
     return result
 
-@router.post("/validate/", response_model=List[schemas.ValidationResult])
-async def validate_data(validation_data: schemas.ValidationResultCreate, db: Session = Depends(get_db)):
+@router.get("/imports/{imported_data_id}/rows")
+async def read_imported_rows(imported_data_id: uuid.UUID, db: Session = Depends(get_db)):
+    """
+    Stream the rows of an import.
+
+    The rows are sent as newline-delimited JSON, one object per row in file
+    order, and are read from storage while the response is being sent.
+
+    Args:
+        imported_data_id (uuid.UUID): The ID of the import.
+        db (Session, optional): The database session dependency. Defaults to Depends(get_db).
+
+    Returns:
+        StreamingResponse: The rows of the import as newline-delimited JSON.
+
+    Raises:
+        HTTPException: If the import is not found.
+    """
+    imported_data = await service.get_imported_data(db, imported_data_id)
+    if imported_data is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Imported data not found")
+    return StreamingResponse(service.stream_imported_rows(db, imported_data), media_type="application/x-ndjson")
+
+@router.get("/imports/{imported_data_id}/results", response_model=CursorPage[schemas.ValidationResult])
+async def read_validation_results(
+    imported_data_id: uuid.UUID,
+    field_name: Optional[str] = None,
+    validation_status: Optional[str] = None,
+    row_start: Optional[int] = Query(None, ge=0),
+    row_end: Optional[int] = Query(None, ge=0),
+    cursor: Optional[str] = None,
+    size: int = Query(50, ge=1, le=1000),
+    estimate_total: bool = False,
+    db: Session = Depends(get_db)
+):
+    """
+    List the validation results of an import, one page at a time.
+
+    The results can be filtered by field, by status and by a range of row
+    indexes, e.g. validation_status=invalid to drill into the failures of a
+    run. Each page carries a next_cursor to pass back to get the following
+    page; it is null on the last page. With estimate_total=true the page also
+    carries an approximate number of matching results.
+
+    Args:
+        imported_data_id (uuid.UUID): The ID of the import.
+        field_name (Optional[str]): Only list the results of this field.
+        validation_status (Optional[str]): Only list the results with this status.
+        row_start (Optional[int]): Only list the results of rows at or after this index.
+        row_end (Optional[int]): Only list the results of rows before this index.
+        cursor (Optional[str]): The next_cursor of the previous page.
+        size (int): The number of results per page. Defaults to 50.
+        estimate_total (bool): Whether to include an approximate total. Defaults to False.
+        db (Session, optional): The database session dependency. Defaults to Depends(get_db).
+
+    Returns:
+        CursorPage[schemas.ValidationResult]: The page of results and the cursor of the next page.
+
+    Raises:
+        HTTPException: If the import is not found or the cursor is malformed.
+    """
+    if not await service.imported_data_exists(db, imported_data_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Imported data not found")
+    return await service.list_validation_results(
+        db,
+        imported_data_id,
+        field_name=field_name,
+        validation_status=validation_status,
+        row_start=row_start,
+        row_end=row_end,
+        cursor=cursor,
+        size=size,
+        estimate_total=estimate_total
+    )
+
+@router.get("/imports/{imported_data_id}/results/export")
+async def export_validation_results(
+    imported_data_id: uuid.UUID,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    field_name: Optional[str] = None,
+    validation_status: Optional[str] = None,
+    row_start: Optional[int] = Query(None, ge=0),
+    row_end: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db)
+):
+    """
+    Stream the validation results of an import as newline-delimited JSON or CSV.
+
+    The results are sent in row order while they are read from the database,
+    so exports of any size start right away and use constant memory. They can
+    be filtered the same way as the paginated listing.
+
+    Args:
+        imported_data_id (uuid.UUID): The ID of the import.
+        format (str): The output format, either "ndjson" or "csv". Defaults to "ndjson".
+        field_name (Optional[str]): Only export the results of this field.
+        validation_status (Optional[str]): Only export the results with this status.
+        row_start (Optional[int]): Only export the results of rows at or after this index.
+        row_end (Optional[int]): Only export the results of rows before this index.
+        db (Session, optional): The database session dependency. Defaults to Depends(get_db).
+
+    Returns:
+        StreamingResponse: The validation results in the requested format.
+
+    Raises:
+        HTTPException: If the import is not found.
+    """
+    if not await service.imported_data_exists(db, imported_data_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Imported data not found")
+    results = service.export_validation_results(
+        db,
+        imported_data_id,
+        export_format=format,
+        field_name=field_name,
+        validation_status=validation_status,
+        row_start=row_start,
+        row_end=row_end
+    )
+    if format == "csv":
+        return StreamingResponse(
+            results,
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="validation_results_{imported_data_id}.csv"'}
+        )
+    return StreamingResponse(results, media_type="application/x-ndjson")
+
+@router.post("/validate/", response_model=Union[schemas.ValidationReport, job_schemas.Job])
+async def validate_data(
+    validation_data: schemas.ValidationRequest,
+    request: Request,
+    response: Response,
+    background: bool = False,
+    db: Session = Depends(get_db)
+):
     """
     Validate data based on the provided validation rules.
 
-    This endpoint processes the validation data and returns a list of
-    validation results based on the specified rules. The validation data
-    must include the imported data ID and the validation rules.
+    This endpoint processes the validation data and returns a report with the
+    aggregate counts of each field, the first validation results and the URL
+    listing every stored result, based on the specified rules. The validation data
+    must include the imported data ID and the validation rules, and may select
+    the validation engine and the result storage mode. In "failures_only" mode
+    the report contains the per-field summaries instead of one result per cell.
+    With background=true the validation runs as a background job and the queued
+    job is returned immediately with status 202.
 
     Args:
-        validation_data (schemas.ValidationResultCreate): The data containing the imported data ID and validation rules.
+        validation_data (schemas.ValidationRequest): The data containing the imported data ID and validation rules.
+        request (Request): The request, used to build the URL of the stored results.
+        response (Response): The response, whose status code is set for background validations.
+        background (bool): Whether to run the validation as a background job. Defaults to False.
         db (Session, optional): The database session dependency. Defaults to Depends(get_db).
 
     Returns:
-        List[schemas.ValidationResult]: A list of validation results.
+        Union[schemas.ValidationReport, job_schemas.Job]: The per-field summaries and first validation results, or the queued job.
     """
-    # Call the service to validate the data and retrieve the results
-    validation_results = await service.validate_data(db, validation_data.imported_data_id, validation_data.validation_rules)
-    # Return the validation results as a JSON-serializable object
-    return jsonable_encoder(validation_results)
\ No newline at end of file
+    if background:
+        response.status_code = status.HTTP_202_ACCEPTED
+        return await service.submit_validation_job(db, validation_data)
+
+    # Call the service to validate the data and retrieve the report
+    validation_report = await service.validate_data(
+        db,
+        validation_data.imported_data_id,
+        validation_data.validation_rules,
+        engine=validation_data.engine,
+        storage_mode=validation_data.storage_mode
+    )
+    # Point to the paged listing of every stored result
+    validation_report.results_url = str(request.url_for("read_validation_results", imported_data_id=str(validation_data.imported_data_id)))
+    # Return the validation report, serialized through the response model
+    return validation_report
\ No newline at end of file
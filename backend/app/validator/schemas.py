@@ -1,6 +1,6 @@
 from pydantic import BaseModel, field_validator
 import uuid
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Literal
 from datetime import datetime
 from pydantic import ConfigDict
 from sqlalchemy import UUID
@@ -21,10 +21,12 @@ class ValidationResultBase(BaseModel):
                                  the validation was successful or failed.
         error_message (Optional[str]): An optional error message providing details
                                        if the validation failed.
+        row_index (Optional[int]): The index of the imported row the field belongs to.
     """
     field_name: str
     validation_status: str
     error_message: Optional[str]
+    row_index: Optional[int] = None
 
 class ValidationResultCreate(ValidationResultBase):
     """
@@ -47,6 +49,26 @@ class ValidationResultCreate(ValidationResultBase):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+class ValidationRequest(BaseModel):
+    """
+    Schema for a request to validate imported data.
+
+    Attributes:
+        imported_data_id (str): The ID of the imported data to validate.
+        validation_rules (Dict[str, Dict[str, Any]]): The validation rules to apply,
+                                                      keyed by field name.
+        engine (str): The validation engine to use. "python" checks each value in
+                      turn, "pandas" evaluates each rule column-wise over batches
+                      of rows.
+        storage_mode (str): How results are stored. "all" stores one result per
+                            checked cell, "failures_only" stores only invalid cells
+                            and relies on the per-field summaries for the rest.
+    """
+    imported_data_id: str
+    validation_rules: Dict[str, Dict[str, Any]]
+    engine: Literal["python", "pandas"] = "python"
+    storage_mode: Literal["all", "failures_only"] = "all"
+
 class ValidationResultUpdate(ValidationResultBase):
     """
     Schema for updating a validation result.
@@ -76,6 +98,49 @@ class ValidationResult(ValidationResultBase):
 
     model_config = ConfigDict(arbitrary_types_allowed=True, from_attributes=True)
         
+class FieldSummary(BaseModel):
+    """
+    Schema for the aggregate validation counts of one field.
+
+    Every row of the import is counted exactly once per field.
+
+    Attributes:
+        field_name (str): The name of the validated field.
+        valid_count (int): The number of non-empty values that passed every rule.
+        invalid_count (int): The number of values that failed at least one rule.
+        missing_count (int): The number of rows where the field is absent, null or
+                             empty and no rule failed.
+    """
+    field_name: str
+    valid_count: int = 0
+    invalid_count: int = 0
+    missing_count: int = 0
+
+class ValidationReport(BaseModel):
+    """
+    Schema for the outcome of validating an import.
+
+    Attributes:
+        imported_data_id (uuid.UUID): The ID of the validated imported data.
+        rows_processed (int): The number of rows that were validated.
+        storage_mode (str): The result storage mode used for the run.
+        summaries (List[FieldSummary]): The aggregate counts of each validated field.
+        results (List[ValidationResult]): The first VALIDATION_INLINE_RESULTS validation results.
+                                          Empty in "failures_only" mode, where the
+                                          summaries replace the per-cell results.
+        results_truncated (bool): Whether more results were stored than the report carries.
+        results_url (Optional[str]): The URL listing every stored result page by page.
+    """
+    imported_data_id: uuid.UUID
+    rows_processed: int
+    storage_mode: str = "all"
+    summaries: List[FieldSummary]
+    results: List[ValidationResult] = []
+    results_truncated: bool = False
+    results_url: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+        
 class ImportedDataBase(BaseModel):
     """
     Base schema for imported data.
@@ -136,18 +201,25 @@ class ImportedDataResponse(BaseModel):
 
     This class defines the structure of the response that will be returned
     when imported data is retrieved. It includes the unique ID, file name,
-    upload timestamp, and content of the imported data.
+    upload timestamp, and a description of the imported rows; the rows
+    themselves are streamed from the rows endpoint.
 
     Attributes:
         id (uuid.UUID): The unique ID of the imported data.
         file_name (str): The name of the file that has been uploaded.
         uploaded_at (datetime): The timestamp indicating when the data was uploaded.
-        data_content (str): The content of the uploaded data.
+        row_count (int): The number of imported rows.
+        columns (List[str]): The column names of the imported table.
+        byte_size (int): The size of the uploaded file in bytes.
+        preview (List[Dict[str, Any]]): The first rows of the import.
     """
     id: uuid.UUID
     file_name: str
     uploaded_at: datetime
-    data_content: str
+    row_count: int = 0
+    columns: List[str] = []
+    byte_size: int = 0
+    preview: List[Dict[str, Any]] = []
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -1,86 +1,258 @@
-import csv
-from typing import Dict, Any, List
-from sqlalchemy import select
+from typing import Dict, Any, List, AsyncIterable, AsyncIterator, Optional, Tuple
+from sqlalchemy import Select, insert, lambda_stmt, select
 from sqlalchemy.orm import Session
 from app.validator import models, schemas
-import pandas as pd
+import asyncio
+import collections
+import csv
 import io
+import tempfile
 from fastapi import UploadFile
 from app.database import AsyncSessionLocal
-from .utils import validate_field
-from .models import ImportedData, ValidationResult
-from .schemas import ValidationResultCreate
+from .utils import FieldCheck, FieldPlan, check_rows, compile_rules
+from . import readers, storage
+from .models import ImportedData, ImportedRow, ValidationResult, ValidationSummary
 import uuid
-import json
-from app.config import UUIDEncoder
+from app import serialization
+from app.config import settings
+from app.jobs.models import Job
+from app.jobs.service import ProgressTracker, job_runner
+from app.executor import pool_size, run_cpu_bound
+from app.pagination import CursorPage, keyset_paginate
 from sqlalchemy.ext.asyncio import AsyncSession
 
-async def validate_data(db: AsyncSession, imported_data_id: uuid.UUID, validation_rules: Dict[str, Dict[str, Any]]) -> List[ValidationResult]:
+# Bulk insert of validation results, built once and executed with a list of parameter sets
+INSERT_VALIDATION_RESULTS = insert(ValidationResult.__table__)
+
+def _imported_data_by_id(imported_data_id: uuid.UUID):
+    # A lambda statement is built and compiled once; later calls only bind the ID
+    return lambda_stmt(lambda: select(ImportedData).filter(ImportedData.id == imported_data_id))
+
+def _imported_data_id_by_id(imported_data_id: uuid.UUID):
+    # Selects only the key, so checking an import does not load its data_content
+    return lambda_stmt(lambda: select(ImportedData.id).filter(ImportedData.id == imported_data_id))
+
+async def validate_data(
+    db: AsyncSession,
+    imported_data_id: uuid.UUID,
+    validation_rules: Dict[str, Dict[str, Any]],
+    engine: str = "python",
+    storage_mode: str = "all",
+    progress: Optional[ProgressTracker] = None
+) -> schemas.ValidationReport:
     """
     Validate imported data based on the provided validation rules.
 
-    This function retrieves the imported data using the provided ID and validates
-    its fields against the specified validation rules. It returns a list of 
-    ValidationResult objects indicating the validation status of each field.
+    This function retrieves the imported data using the provided ID, streams every
+    row of it in a single pass and validates the fields of each row against the
+    specified validation rules. Each validation result records the index of the
+    row it belongs to, and the counts of valid, invalid and missing values are
+    aggregated per field along the way. Results are written with Core bulk
+    inserts of VALIDATION_BATCH_SIZE rows, and the per-field counts are stored
+    as one summary row per field.
+
+    The report carries the summaries and, in "all" storage mode, at most
+    VALIDATION_INLINE_RESULTS of the stored results, flagged as truncated when
+    there are more; the full results are read page by page from the results
+    endpoint. In "failures_only" storage mode only invalid cells are stored, and
+    the report carries the summaries without per-cell results.
 
     Args:
         db (AsyncSession): The database session used to query the database.
         imported_data_id (uuid.UUID): The ID of the imported data to validate.
         validation_rules (Dict[str, Dict[str, Any]]): A dictionary of validation rules for each field.
+        engine (str): The validation engine to use, either "python" or "pandas".
+        storage_mode (str): The result storage mode, either "all" or "failures_only".
+        progress (Optional[ProgressTracker]): The tracker updated with the number of rows validated, when run as a job.
 
     Returns:
-        List[ValidationResult]: A list of ValidationResult objects indicating the validation status.
+        schemas.ValidationReport: The per-field summaries and the first validation results.
     """
     # Fetch the imported data from the database using the provided ID
-    imported_data = await db.execute(select(ImportedData).filter(ImportedData.id == imported_data_id))
+    imported_data = await db.execute(_imported_data_by_id(imported_data_id))
     imported_data = imported_data.scalar_one_or_none()
     
     # Raise an error if no imported data is found
     if not imported_data:
         raise ValueError(f"No imported data found with id {imported_data_id}")
 
+    if progress is not None:
+        progress.rows_total = imported_data.row_count
+
+    failures_only = storage_mode == "failures_only"
+    inline_limit = 0 if failures_only else settings.VALIDATION_INLINE_RESULTS
     validation_results = []
+    results_truncated = False
+    pending_results = []
 
-    # Assuming data_content is a JSON string, parse it into a Python dictionary
-    data_content = json.loads(imported_data.data_content.decode('utf-8'))
-
-    # Validate each field in the data content against the provided validation rules
-    for field_name, field_value in data_content.items():
-        if field_name in validation_rules:
-            # Validate the field and collect any errors
-            field_errors = validate_field(field_name, field_value, validation_rules[field_name])
-            
-            if field_errors:
-                # Create a ValidationResult for each error found
-                for error_message in field_errors.values():
-                    validation_result = ValidationResultCreate(
-                        imported_data_id=imported_data_id,
-                        field_name=field_name,
-                        validation_status="invalid",
-                        error_message=error_message
-                    )
-                    # Create a database model instance for the validation result
-                    db_validation_result = ValidationResult(**{k: v for k, v in validation_result.model_dump().items() if k != "validation_rules"})
-                    db.add(db_validation_result)  # Add the validation result to the session
-                    validation_results.append(db_validation_result)  # Append to results list
-            else:
-                # Create a ValidationResult for valid fields
-                validation_result = ValidationResultCreate(
-                    imported_data_id=imported_data_id,
-                    field_name=field_name,
-                    validation_status="valid",
-                    error_message=None
-                )
-                db_validation_result = ValidationResult(**{k: v for k, v in validation_result.model_dump().items() if k != "validation_rules"})
-                db.add(db_validation_result)  # Add the valid result to the session
-                validation_results.append(db_validation_result)  # Append to results list
+    # Compile the rules once so every row is checked against the same precompiled plan
+    plan = compile_rules(validation_rules)
+    valid_counts = dict.fromkeys(plan, 0)
+    invalid_counts = dict.fromkeys(plan, 0)
+
+    # Validate each field of every row against the provided validation rules
+    rows = readers.RowCounter(iter_imported_rows(db, imported_data, columns=list(plan)))
+    async for row_index, field_name, error_message, empty in iter_field_checks(rows, plan, engine):
+        if progress is not None:
+            progress.rows_processed = rows.count
+
+        if error_message:
+            invalid_counts[field_name] += 1
+        elif not empty:
+            valid_counts[field_name] += 1
 
+        if failures_only and not error_message:
+            continue  # Valid cells are only reflected in the summaries
+
+        # Build the result as a plain row, without pydantic or ORM objects
+        validation_result = {
+            "id": uuid.uuid4(),
+            "imported_data_id": imported_data.id,
+            "field_name": field_name,
+            "row_index": row_index,
+            "validation_status": "invalid" if error_message else "valid",
+            "error_message": error_message
+        }
+        if len(validation_results) < inline_limit:
+            validation_results.append(validation_result)  # Keep the first results for the report
+        elif not failures_only:
+            results_truncated = True  # Further results are only stored
+        pending_results.append(validation_result)  # Queue the result for the next bulk insert
+        if len(pending_results) >= settings.VALIDATION_BATCH_SIZE:
+            await db.execute(INSERT_VALIDATION_RESULTS, pending_results)
+            pending_results = []
+
+    if pending_results:
+        await db.execute(INSERT_VALIDATION_RESULTS, pending_results)  # Insert the final partial batch
+
+    # Empty values that passed every rule, and rows without the field, count as missing
+    summaries = [
+        schemas.FieldSummary(
+            field_name=field_name,
+            valid_count=valid_counts[field_name],
+            invalid_count=invalid_counts[field_name],
+            missing_count=rows.count - valid_counts[field_name] - invalid_counts[field_name]
+        )
+        for field_name in plan
+    ]
+    if summaries:
+        # Store one summary row per field for this validation run
+        await db.execute(
+            insert(ValidationSummary.__table__),
+            [
+                {"id": uuid.uuid4(), "imported_data_id": imported_data.id, "storage_mode": storage_mode, **summary.model_dump()}
+                for summary in summaries
+            ]
+        )
     await db.commit()  # Commit the transaction to save changes
-    return validation_results  # Return the list of validation results
+
+    return schemas.ValidationReport.model_validate({
+        "imported_data_id": imported_data_id,
+        "rows_processed": rows.count,
+        "storage_mode": storage_mode,
+        "summaries": summaries,
+        "results": validation_results,
+        "results_truncated": results_truncated
+    }, from_attributes=True)
+
+async def iter_field_checks(
+    rows: AsyncIterable[Tuple[int, Dict[str, Any]]],
+    plan: Dict[str, FieldPlan],
+    engine: str = "python"
+) -> AsyncIterator[FieldCheck]:
+    """
+    Check every planned field of every row.
+
+    Rows are split into partitions of VALIDATION_PARTITION_SIZE rows that are
+    checked by check_rows in the process pool. Up to one partition per worker is
+    in flight at a time, so a validation uses several cores while reading the
+    next rows, and the outcomes are yielded in row order.
+
+    Args:
+        rows (AsyncIterable[Tuple[int, Dict[str, Any]]]): The index and content of each row.
+        plan (Dict[str, FieldPlan]): The compiled plan of each field.
+        engine (str): The validation engine to use, either "python" or "pandas".
+
+    Yields:
+        FieldCheck: The outcome of each checked cell.
+    """
+    max_in_flight = max(pool_size(), 1)
+    in_flight = collections.deque()
+    async for partition in readers.iter_batches(rows, settings.VALIDATION_PARTITION_SIZE):
+        in_flight.append(asyncio.ensure_future(run_cpu_bound(check_rows, plan, engine, partition)))
+        if len(in_flight) > max_in_flight:
+            for check in await in_flight.popleft():
+                yield check
+    while in_flight:
+        for check in await in_flight.popleft():
+            yield check
+
+async def iter_imported_rows(
+    db: AsyncSession,
+    imported_data: ImportedData,
+    columns: Optional[List[str]] = None
+) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Stream the rows of an import in file order.
+
+    Rows are read from the 'imported_rows' table through a server-side cursor, so
+    only one fetch batch is held in memory at a time. Rows stored in a Parquet
+    file are read through a memory map, loading only the requested columns, and
+    newline-delimited payloads are decompressed piece by piece. Both are decoded
+    in batches of IMPORT_BATCH_SIZE rows in a worker thread. Imports that predate
+    row-level storage are read from their JSON blob instead, which is parsed as a
+    whole in a worker thread.
+
+    Args:
+        db (AsyncSession): The database session used to query the database.
+        imported_data (ImportedData): The import whose rows should be read.
+        columns (Optional[List[str]]): The columns needed by the caller, or None for all of them.
+            Storage formats that cannot read columns selectively return whole rows.
+
+    Yields:
+        Tuple[int, Dict[str, Any]]: The index and content of each row.
+    """
+    if imported_data.storage_format == "parquet":
+        if imported_data.storage_path is None:
+            return  # Imports without rows have no file
+        rows = storage.iter_parquet_rows(storage.storage_file(imported_data.storage_path), columns, settings.IMPORT_BATCH_SIZE)
+        row_index = 0
+        async for row in rows:
+            yield row_index, row
+            row_index += 1
+        return
+
+    if imported_data.storage_format == "ndjson":
+        rows = storage.iter_blob_rows(
+            imported_data.data_content or b"", imported_data.data_codec, settings.IMPORT_CHUNK_SIZE, settings.IMPORT_BATCH_SIZE
+        )
+        row_index = 0
+        async for row in rows:
+            yield row_index, row
+            row_index += 1
+        return
+
+    if imported_data.storage_format == "json":
+        # Legacy imports hold a single JSON document, which is decompressed and parsed in a worker thread
+        rows = await asyncio.to_thread(
+            storage.read_json_rows, imported_data.data_content or b"", imported_data.data_codec, settings.IMPORT_CHUNK_SIZE
+        )
+        for row_index, row in enumerate(rows):
+            yield row_index, row
+        return
+
+    rows = await db.stream(
+        select(ImportedRow.row_index, ImportedRow.data)
+        .filter(ImportedRow.imported_data_id == imported_data.id)
+        .order_by(ImportedRow.row_index)
+        .execution_options(yield_per=settings.IMPORT_BATCH_SIZE)
+    )
+    async for row_index, row in rows:
+        yield row_index, row
 
 def serialize_data(data):
     """
-    Serialize data to JSON format using a custom UUID encoder.
+    Serialize data to JSON format, with UUIDs and datetimes as strings.
 
     Args:
         data (Any): The data to serialize.
@@ -88,50 +260,417 @@ def serialize_data(data):
     Returns:
         str: The serialized JSON string.
     """
-    return json.dumps(data, cls=UUIDEncoder)
+    return serialization.dumps_str(data)
 
-async def import_data(db: Session, file: UploadFile) -> schemas.ImportedDataResponse:
+async def spool_upload(file: UploadFile) -> UploadFile:
     """
-    Import data from an uploaded file and store it in the database.
+    Copy an uploaded file to an anonymous temporary file.
 
-    This function reads the content of the uploaded file, determines its format,
-    and processes it accordingly. The imported data is then saved to the database.
+    The request's upload is closed once the response has been sent, so a job that
+    processes the upload later needs its own copy. The copy is deleted when it is closed.
 
     Args:
-        db (Session): The database session used to perform the operation.
+        file (UploadFile): The uploaded file to copy.
+
+    Returns:
+        UploadFile: An upload backed by the temporary copy, positioned at its start.
+    """
+    spooled = tempfile.TemporaryFile()
+    size = 0
+    async for chunk in readers.iter_upload_chunks(file, settings.IMPORT_CHUNK_SIZE):
+        await asyncio.to_thread(spooled.write, chunk)
+        size += len(chunk)
+    spooled.seek(0)
+    return UploadFile(spooled, size=size, filename=file.filename, headers=file.headers)
+
+async def submit_import_job(db: AsyncSession, file: UploadFile) -> Job:
+    """
+    Import an uploaded file in a background job.
+
+    Args:
+        db (AsyncSession): The database session used to record the job.
         file (UploadFile): The uploaded file containing the data.
 
     Returns:
-        schemas.ImportedDataResponse: The response containing the result of the import operation.
+        Job: The queued job; its result holds the ID and row count of the import.
+    """
+    spooled = await spool_upload(file)
+
+    async def work(progress: ProgressTracker) -> Dict[str, Any]:
+        try:
+            async with AsyncSessionLocal() as session:
+                imported_data = await store_import(session, spooled, progress)
+        finally:
+            await spooled.close()  # Delete the temporary copy of the upload
+        return {
+            "imported_data_id": str(imported_data.id),
+            "file_name": imported_data.file_name,
+            "row_count": imported_data.row_count
+        }
+
+    return await job_runner.submit(db, "import", work)
+
+async def submit_validation_job(db: AsyncSession, validation_request: schemas.ValidationRequest) -> Job:
+    """
+    Validate imported data in a background job.
+
+    Args:
+        db (AsyncSession): The database session used to record the job.
+        validation_request (schemas.ValidationRequest): The imported data ID, rules and options.
+
+    Returns:
+        Job: The queued job; its result holds the validation report without per-cell results.
+    """
+    async def work(progress: ProgressTracker) -> Dict[str, Any]:
+        async with AsyncSessionLocal() as session:
+            validation_report = await validate_data(
+                session,
+                validation_request.imported_data_id,
+                validation_request.validation_rules,
+                engine=validation_request.engine,
+                storage_mode=validation_request.storage_mode,
+                progress=progress
+            )
+        # Per-cell results stay in the 'validation_results' table rather than in the job
+        return validation_report.model_dump(mode="json", exclude={"results"})
+
+    return await job_runner.submit(db, "validate", work)
+
+class TableRowWriter:
+    """
+    Write batches of rows to the 'imported_rows' table with Core bulk inserts.
+    """
+
+    def __init__(self, db: AsyncSession, imported_data_id: uuid.UUID):
+        self.db = db
+        self.imported_data_id = imported_data_id
+
+    async def write(self, rows: List[Dict[str, Any]], start_index: int) -> None:
+        """
+        Insert a batch of rows, numbered from start_index.
+        """
+        await self.db.execute(
+            insert(ImportedRow),
+            [
+                {"imported_data_id": self.imported_data_id, "row_index": start_index + offset, "data": row}
+                for offset, row in enumerate(rows)
+            ]
+        )
+
+    async def close(self) -> None:
+        """
+        Finish writing; the rows are committed with the import.
+        """
+
+    async def abort(self) -> None:
+        """
+        Discard the written rows; they are rolled back with the import.
+        """
+
+def open_row_writer(db: AsyncSession, imported_data: ImportedData):
+    """
+    Open a writer for the rows of an import, according to its storage format.
+
+    Args:
+        db (AsyncSession): The database session used to perform the operation.
+        imported_data (ImportedData): The flushed import whose rows will be written.
+
+    Returns:
+        TableRowWriter | storage.BlobRowWriter | storage.ParquetRowWriter: A writer with asynchronous write, close and abort methods.
+
+    Raises:
+        ValueError: If the storage format is not supported.
+    """
+    if imported_data.storage_format == "rows":
+        return TableRowWriter(db, imported_data.id)
+    if imported_data.storage_format == "ndjson":
+        return storage.BlobRowWriter(imported_data, settings.STORAGE_CODEC)
+    if imported_data.storage_format == "parquet":
+        imported_data.storage_path = f"{imported_data.id}.parquet"
+        return storage.ParquetRowWriter(storage.storage_file(imported_data.storage_path))
+    raise ValueError(f"Unsupported storage format: {imported_data.storage_format}")
+
+async def store_import(db: AsyncSession, file: UploadFile, progress: Optional[ProgressTracker] = None) -> ImportedData:
+    """
+    Parse an uploaded file and store its rows in the database.
+
+    This function determines the format of the uploaded file and processes it
+    accordingly. CSV files are read in fixed-size chunks and parsed incrementally
+    with the encoding and dialect sniffed from their first CSV_SNIFF_BYTES bytes,
+    XLSX worksheets are streamed row by row, and the table is located from the
+    first LAYOUT_SAMPLE_ROWS records so banner rows above it are skipped. Rows
+    are written to the 'imported_rows' table in batches, so the upload is never
+    held in memory as a whole.
+
+    Args:
+        db (AsyncSession): The database session used to perform the operation.
+        file (UploadFile): The uploaded file containing the data.
+        progress (Optional[ProgressTracker]): The tracker updated with the rows consumed, and the bytes consumed for CSV files, when run as a job.
+
+    Returns:
+        ImportedData: The stored import, with its row count.
     """
-    content = await file.read()  # Read the content of the uploaded file
     file_extension = file.filename.split('.')[-1].lower()  # Get the file extension
-    
+    # Only CSV uploads are read front to back, so only their read position measures progress;
+    # workbooks are zip archives whose reader jumps around the file
+    track_bytes = progress is not None and file_extension == 'csv'
+    if track_bytes:
+        progress.bytes_total = file.size
+
     # Process the file based on its extension
     if file_extension == 'csv':
-        csv_content = content.decode('utf-8')  # Decode CSV content
-        csv_reader = csv.DictReader(io.StringIO(csv_content))  # Create a CSV reader
-        data_content = [row for row in csv_reader]  # Read data into a list of dictionaries
-    elif file_extension in ['xlsx', 'xls']:
-        data_content = pd.read_excel(io.BytesIO(content)).to_dict(orient='records')  # Read Excel file
+        # Stream the upload in fixed-size chunks and parse rows incrementally
+        chunks = readers.iter_upload_chunks(file, settings.IMPORT_CHUNK_SIZE)
+        # Detect the encoding and dialect from the first bytes of the upload
+        csv_format, chunks = await readers.sniff_csv(chunks, settings.CSV_SNIFF_BYTES)
+        rows = readers.iter_csv_rows(chunks, csv_format, sample_size=settings.LAYOUT_SAMPLE_ROWS)
+    elif file_extension == 'xlsx':
+        # Stream the worksheet row by row in read-only mode
+        rows = readers.iter_xlsx_rows(file.file, settings.IMPORT_BATCH_SIZE, sample_size=settings.LAYOUT_SAMPLE_ROWS)
+    elif file_extension == 'xls':
+        content = await file.read()  # Read the content of the uploaded file
+        records = await run_cpu_bound(readers.read_xls_records, content)  # Parse the workbook in the process pool
+        rows = readers.iter_table_rows(readers.iter_rows(records), settings.LAYOUT_SAMPLE_ROWS)
     else:
         raise ValueError("Unsupported file format. Please upload a CSV or XLSX file.")  # Raise error for unsupported formats
-    
-    # Create an ImportedData instance with the file name and serialized content
-    imported_data = models.ImportedData(
-        file_name=file.filename,
-        data_content=json.dumps(data_content).encode('utf-8')  # Serialize and encode the data content
-    )
+
+    # Create the ImportedData instance first so its rows can reference it
+    imported_data = models.ImportedData(file_name=file.filename, storage_format=settings.STORAGE_BACKEND)
     db.add(imported_data)  # Add the imported data to the session
+    await db.flush()  # Flush to insert the imported data before its rows
+    writer = open_row_writer(db, imported_data)
+
+    # Write the rows batch by batch so only one batch of parsed rows is held at a time
+    row_count = 0
+    imported_data.preview = []
+    try:
+        async for batch in readers.iter_batches(rows, settings.IMPORT_BATCH_SIZE):
+            if row_count == 0:
+                imported_data.preview = batch[:settings.IMPORT_PREVIEW_ROWS]
+            await writer.write(batch, row_count)
+            row_count += len(batch)
+            if progress is not None:
+                progress.rows_processed = row_count
+            if track_bytes:
+                progress.bytes_processed = file.file.tell()
+        await writer.close()
+    except BaseException:
+        await rows.aclose()  # Release the open workbook or upload reader right away
+        await writer.abort()  # Do not leave partially written files behind
+        raise
+
+    imported_data.columns = rows.columns or []  # The detected header, also for a table without rows
+    imported_data.row_count = row_count  # Record the number of stored rows
+    imported_data.byte_size = file.size if file.size is not None else file.file.seek(0, 2)  # Record the size of the upload
+    if isinstance(writer, storage.ParquetRowWriter) and row_count == 0:
+        imported_data.storage_path = None  # Nothing was written, so no file exists
     await db.commit()  # Commit the transaction to save changes
     await db.refresh(imported_data)  # Refresh the instance to get the latest data
+    return imported_data
+
+async def import_data(db: Session, file: UploadFile) -> schemas.ImportedDataResponse:
+    """
+    Import data from an uploaded file and store it in the database.
+
+    The rows are stored by store_import. The response describes the import with
+    its row count, columns, size and a short preview; the rows themselves are
+    served by stream_imported_rows.
+
+    Args:
+        db (Session): The database session used to perform the operation.
+        file (UploadFile): The uploaded file containing the data.
+
+    Returns:
+        schemas.ImportedDataResponse: The response containing the result of the import operation.
+    """
+    imported_data = await store_import(db, file)
+
+    return schemas.ImportedDataResponse.model_validate(imported_data)  # Validate and return the response
+
+async def get_imported_data(db: AsyncSession, imported_data_id: uuid.UUID) -> Optional[ImportedData]:
+    """
+    Retrieve an import by its ID.
+
+    Args:
+        db (AsyncSession): The database session used to query the database.
+        imported_data_id (uuid.UUID): The ID of the import.
+
+    Returns:
+        Optional[ImportedData]: The import, or None if it does not exist.
+    """
+    result = await db.execute(_imported_data_by_id(imported_data_id))
+    return result.scalar_one_or_none()
+
+async def imported_data_exists(db: AsyncSession, imported_data_id: uuid.UUID) -> bool:
+    """
+    Check whether an import exists without loading its stored content.
+
+    Args:
+        db (AsyncSession): The database session used to query the database.
+        imported_data_id (uuid.UUID): The ID of the import.
+
+    Returns:
+        bool: Whether the import exists.
+    """
+    result = await db.execute(_imported_data_id_by_id(imported_data_id))
+    return result.scalar_one_or_none() is not None
 
-    # Prepare the response dictionary ensuring the ID is a UUID
-    imported_data_dict = {
-        "id": str(imported_data.id),  # Convert UUID to string for the response
-        "file_name": imported_data.file_name,
-        "uploaded_at": imported_data.uploaded_at,
-        "data_content": imported_data.data_content.decode('utf-8')  # Decode the data content for the response
-    }
+async def stream_imported_rows(db: AsyncSession, imported_data: ImportedData) -> AsyncIterator[bytes]:
+    """
+    Encode the rows of an import as newline-delimited JSON, one batch at a time.
+
+    The rows are read in a session of their own on the same engine as db, since a
+    streamed response body outlives the session of the request that started it.
+
+    Args:
+        db (AsyncSession): The session of the request, whose engine is used.
+        imported_data (ImportedData): The import whose rows should be streamed.
+
+    Yields:
+        bytes: The next EXPORT_BATCH_SIZE rows, one JSON object per line.
+    """
+    async with AsyncSession(db.bind, expire_on_commit=False) as session:
+        rows = iter_imported_rows(session, imported_data)
+        async for batch in readers.iter_batches(rows, settings.EXPORT_BATCH_SIZE):
+            yield serialization.dumps_lines(row for _, row in batch)
+
+def filter_validation_results(
+    query: Select,
+    imported_data_id: uuid.UUID,
+    field_name: Optional[str] = None,
+    validation_status: Optional[str] = None,
+    row_start: Optional[int] = None,
+    row_end: Optional[int] = None
+) -> Select:
+    """
+    Restrict a query on 'validation_results' to the results of an import matching the given filters.
+
+    Args:
+        query (Select): The query to restrict.
+        imported_data_id (uuid.UUID): The ID of the import.
+        field_name (Optional[str]): Only keep the results of this field.
+        validation_status (Optional[str]): Only keep the results with this status.
+        row_start (Optional[int]): Only keep the results of rows at or after this index.
+        row_end (Optional[int]): Only keep the results of rows before this index.
+
+    Returns:
+        Select: The restricted query.
+    """
+    query = query.where(ValidationResult.imported_data_id == imported_data_id)
+    if field_name is not None:
+        query = query.where(ValidationResult.field_name == field_name)
+    if validation_status is not None:
+        query = query.where(ValidationResult.validation_status == validation_status)
+    if row_start is not None:
+        query = query.where(ValidationResult.row_index >= row_start)
+    if row_end is not None:
+        query = query.where(ValidationResult.row_index < row_end)
+    return query
+
+async def list_validation_results(
+    db: AsyncSession,
+    imported_data_id: uuid.UUID,
+    field_name: Optional[str] = None,
+    validation_status: Optional[str] = None,
+    row_start: Optional[int] = None,
+    row_end: Optional[int] = None,
+    cursor: Optional[str] = None,
+    size: int = 50,
+    estimate_total: bool = False
+) -> CursorPage[schemas.ValidationResult]:
+    """
+    List one page of the validation results of an import, filtered on the server.
+
+    The results are ordered by row index, then by ID, and paged by keyset so that
+    a page deep into a large run costs the same as the first one. Results without
+    a row index cannot be ordered this way and are not listed.
+
+    Args:
+        db (AsyncSession): The database session used to query the database.
+        imported_data_id (uuid.UUID): The ID of the import.
+        field_name (Optional[str]): Only list the results of this field.
+        validation_status (Optional[str]): Only list the results with this status.
+        row_start (Optional[int]): Only list the results of rows at or after this index.
+        row_end (Optional[int]): Only list the results of rows before this index.
+        cursor (Optional[str]): The next_cursor of the previous page, or None for the first page.
+        size (int): The number of results per page. Defaults to 50.
+        estimate_total (bool): Whether to include an approximate number of matching results.
 
-    return schemas.ImportedDataResponse.model_validate(imported_data_dict)  # Validate and return the response
\ No newline at end of file
+    Returns:
+        CursorPage[schemas.ValidationResult]: The page of results and the cursor of the next page.
+    """
+    query = filter_validation_results(
+        select(ValidationResult).where(ValidationResult.row_index.is_not(None)),
+        imported_data_id, field_name, validation_status, row_start, row_end
+    )
+
+    page = await keyset_paginate(
+        db, query, [ValidationResult.row_index, ValidationResult.id], cursor, size, estimate_total=estimate_total
+    )
+    return CursorPage[schemas.ValidationResult](
+        items=[schemas.ValidationResult.model_validate(item) for item in page.items],
+        size=page.size,
+        next_cursor=page.next_cursor,
+        total=page.total
+    )
+
+# Columns of the validation results export, in output order
+EXPORT_COLUMNS = ("id", "imported_data_id", "field_name", "row_index", "validation_status", "error_message")
+
+def _export_ndjson(batch: List[Dict[str, Any]]) -> bytes:
+    return serialization.dumps_lines(batch)
+
+def _export_csv(batch: List[Dict[str, Any]], header: bool) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    if header:
+        writer.writeheader()
+    writer.writerows(batch)
+    return buffer.getvalue()
+
+async def export_validation_results(
+    db: AsyncSession,
+    imported_data_id: uuid.UUID,
+    export_format: str = "ndjson",
+    field_name: Optional[str] = None,
+    validation_status: Optional[str] = None,
+    row_start: Optional[int] = None,
+    row_end: Optional[int] = None
+) -> AsyncIterator[bytes]:
+    """
+    Encode the validation results of an import as newline-delimited JSON or CSV, one batch at a time.
+
+    The results are read through a server-side cursor, EXPORT_BATCH_SIZE rows at
+    a time, so memory stays constant and the first batch is sent before the
+    query has been read to the end. They are read in a session of their own on
+    the same engine as db, since a streamed response body outlives the session
+    of the request that started it.
+
+    Args:
+        db (AsyncSession): The session of the request, whose engine is used.
+        imported_data_id (uuid.UUID): The ID of the import.
+        export_format (str): The output format, either "ndjson" or "csv". Defaults to "ndjson".
+        field_name (Optional[str]): Only export the results of this field.
+        validation_status (Optional[str]): Only export the results with this status.
+        row_start (Optional[int]): Only export the results of rows at or after this index.
+        row_end (Optional[int]): Only export the results of rows before this index.
+
+    Yields:
+        bytes: The next EXPORT_BATCH_SIZE results, preceded by the header line in CSV.
+    """
+    query = filter_validation_results(
+        select(*(getattr(ValidationResult, column) for column in EXPORT_COLUMNS)),
+        imported_data_id, field_name, validation_status, row_start, row_end
+    ).order_by(ValidationResult.row_index, ValidationResult.id)
+
+    if export_format == "csv":
+        yield _export_csv([], header=True).encode("utf-8")  # Send the header before the first batch is fetched
+
+    async with AsyncSession(db.bind, expire_on_commit=False) as session:
+        result = await session.stream(query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+        async for partition in result.mappings().partitions():
+            batch = [dict(row) for row in partition]
+            if export_format == "csv":
+                yield _export_csv(batch, header=False).encode("utf-8")
+            else:
+                yield _export_ndjson(batch)
@@ -0,0 +1,239 @@
+import asyncio
+import os
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
+from app.config import settings
+from app import serialization
+from app.executor import iter_in_thread
+from . import compression
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # The Parquet storage backend is optional
+    pa = None
+    pq = None
+
+
+def storage_file(storage_path: str) -> str:
+    """
+    Return the absolute location of a stored file.
+
+    Args:
+        storage_path (str): The path of the file relative to STORAGE_DIR.
+
+    Returns:
+        str: The path of the file within STORAGE_DIR.
+    """
+    return os.path.join(settings.STORAGE_DIR, storage_path)
+
+
+def _as_text(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+class ParquetRowWriter:
+    """
+    Write batches of rows to a Parquet file, one row group per batch.
+
+    Every column is stored as nullable text, as it appears in the source file;
+    the columns are taken from the keys of the first row. Row groups are
+    compressed with zstd, and each column is stored contiguously, so readers can
+    load only the columns they need. Encoding and writing run in a worker thread.
+    """
+
+    def __init__(self, path: str):
+        if pq is None:
+            raise RuntimeError("The Parquet storage backend requires the pyarrow package")
+        self.path = path
+        self._writer = None
+        self._schema = None
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        if self._writer is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._schema = pa.schema([(column, pa.string()) for column in rows[0]])
+            self._writer = pq.ParquetWriter(self.path, self._schema, compression="zstd")
+        columns = {
+            column: pa.array([_as_text(row.get(column)) for row in rows], type=pa.string())
+            for column in self._schema.names
+        }
+        self._writer.write_table(pa.table(columns, schema=self._schema))
+
+    async def write(self, rows: List[Dict[str, Any]], start_index: int) -> None:
+        """
+        Append a batch of rows to the file.
+
+        Args:
+            rows (List[Dict[str, Any]]): The rows to write, all with the same keys.
+            start_index (int): The index of the first row; rows are stored in order.
+        """
+        if rows:
+            await asyncio.to_thread(self._write, rows)
+
+    async def close(self) -> None:
+        """
+        Finish the file, writing its footer.
+        """
+        if self._writer is not None:
+            await asyncio.to_thread(self._writer.close)
+
+    async def abort(self) -> None:
+        """
+        Discard the partially written file.
+        """
+        await self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class BlobRowWriter:
+    """
+    Write batches of rows as compressed newline-delimited JSON into the
+    data_content column of an import.
+
+    Each batch is encoded and fed to a streaming compressor in a worker thread
+    as it arrives, so only the compressed payload is accumulated. The payload
+    and its codec are set on the import when the writer is closed.
+    """
+
+    def __init__(self, imported_data, codec: Optional[str]):
+        self.imported_data = imported_data
+        self.codec = codec
+        self._compressor = compression.compressor(codec) if codec is not None else None
+        self._parts: List[bytes] = []
+
+    async def write(self, rows: List[Dict[str, Any]], start_index: int) -> None:
+        """
+        Append a batch of rows to the payload.
+
+        Args:
+            rows (List[Dict[str, Any]]): The rows to write.
+            start_index (int): The index of the first row; rows are stored in order.
+        """
+        self._parts.append(await asyncio.to_thread(self._encode, rows))
+
+    def _encode(self, rows: List[Dict[str, Any]]) -> bytes:
+        encoded = serialization.dumps_lines(rows)
+        return self._compressor.compress(encoded) if self._compressor is not None else encoded
+
+    async def close(self) -> None:
+        """
+        Finish the payload and store it on the import.
+        """
+        if self._compressor is not None:
+            self._parts.append(await asyncio.to_thread(self._compressor.flush))
+        self.imported_data.data_content = b"".join(self._parts)
+        self.imported_data.data_codec = self.codec
+        self._parts = []
+
+    async def abort(self) -> None:
+        """
+        Discard the payload.
+        """
+        self._parts = []
+
+
+def read_blob_batches(data: bytes, codec: Optional[str], chunk_size: int, batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Read the rows of a newline-delimited JSON payload in batches, decompressing it piece by piece.
+
+    Args:
+        data (bytes): The stored payload.
+        codec (Optional[str]): The codec of the payload, or None if it is not compressed.
+        chunk_size (int): The number of stored bytes decompressed at a time.
+        batch_size (int): The maximum number of rows per batch.
+
+    Yields:
+        List[Dict[str, Any]]: The next batch of rows, in order.
+    """
+    batch = []
+    for line in compression.iter_lines(compression.iter_decompressed(data, codec, chunk_size)):
+        batch.append(serialization.loads(line))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_blob_rows(data: bytes, codec: Optional[str], chunk_size: int, batch_size: int) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream the rows of a newline-delimited JSON payload without blocking the event loop.
+
+    Each batch is decompressed and parsed by read_blob_batches in a worker thread.
+
+    Args:
+        data (bytes): The stored payload.
+        codec (Optional[str]): The codec of the payload, or None if it is not compressed.
+        chunk_size (int): The number of stored bytes decompressed at a time.
+        batch_size (int): The maximum number of rows per batch.
+
+    Returns:
+        AsyncIterator[Dict[str, Any]]: Each row, in order.
+    """
+    return iter_in_thread(read_blob_batches(data, codec, chunk_size, batch_size))
+
+
+def read_json_rows(data: bytes, codec: Optional[str], chunk_size: int) -> List[Dict[str, Any]]:
+    """
+    Read the rows of a legacy import stored as a single JSON document.
+
+    A JSON document cannot be parsed incrementally, so it is decompressed and
+    parsed as a whole; call this in a worker thread.
+
+    Args:
+        data (bytes): The stored document, holding either a single object or a list of rows.
+        codec (Optional[str]): The codec of the document, or None if it is not compressed.
+        chunk_size (int): The number of stored bytes decompressed at a time.
+
+    Returns:
+        List[Dict[str, Any]]: The rows of the document.
+    """
+    document = b"".join(compression.iter_decompressed(data, codec, chunk_size))
+    rows = serialization.loads(document) if document else []
+    return [rows] if isinstance(rows, dict) else rows
+
+
+def read_parquet_batches(
+    path: str,
+    columns: Optional[Sequence[str]],
+    batch_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Read the rows of a Parquet file in batches through a memory map.
+
+    Args:
+        path (str): The location of the file.
+        columns (Optional[Sequence[str]]): The columns to read, or None for all of them.
+            Columns missing from the file are ignored.
+        batch_size (int): The maximum number of rows per batch.
+
+    Yields:
+        List[Dict[str, Any]]: The next batch of rows, keyed by column name.
+    """
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    if columns is not None:
+        columns = [column for column in columns if column in parquet_file.schema_arrow.names]
+    for record_batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+        yield record_batch.to_pylist()
+
+
+def iter_parquet_rows(
+    path: str,
+    columns: Optional[Sequence[str]],
+    batch_size: int
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream the rows of a Parquet file without blocking the event loop.
+
+    Each batch is decoded by read_parquet_batches in a worker thread.
+
+    Args:
+        path (str): The location of the file.
+        columns (Optional[Sequence[str]]): The columns to read, or None for all of them.
+        batch_size (int): The maximum number of rows per batch.
+
+    Returns:
+        AsyncIterator[Dict[str, Any]]: Each row, keyed by column name.
+    """
+    return iter_in_thread(read_parquet_batches(path, columns, batch_size))
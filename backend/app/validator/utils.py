@@ -1,5 +1,9 @@
 import re
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+from .constants import EMAIL_PATTERN, REGEX_CACHE_SIZE
 
 def validate_min_length(value: str, min_length: int) -> bool:
     """
@@ -27,18 +31,60 @@ def validate_max_length(value: str, max_length: int) -> bool:
     """
     return len(value) <= max_length
 
-def validate_regex(value: str, pattern: str) -> bool:
+@lru_cache(maxsize=REGEX_CACHE_SIZE)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """
+    Compile a regular expression through a bounded LRU cache.
+
+    Unlike the small internal cache of the re module, this cache is sized for
+    rule sets with many distinct patterns, and its hit and miss counters can be
+    inspected with regex_cache_info.
+
+    Args:
+        pattern (str): The regular expression pattern to compile.
+
+    Returns:
+        re.Pattern: The compiled pattern.
+    """
+    return re.compile(pattern)
+
+def regex_cache_info():
+    """
+    Report the statistics of the compiled pattern cache.
+
+    Returns:
+        functools._CacheInfo: The hits, misses, maximum size and current size of the cache.
+    """
+    return compile_pattern.cache_info()
+
+def get_pattern(pattern: Union[str, re.Pattern]) -> re.Pattern:
+    """
+    Return a compiled pattern, compiling and caching it if it is a string.
+
+    Args:
+        pattern (Union[str, re.Pattern]): A pattern string or an already compiled pattern.
+
+    Returns:
+        re.Pattern: The compiled pattern.
+    """
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    return compile_pattern(pattern)
+
+def validate_regex(value: str, pattern: Union[str, re.Pattern]) -> bool:
     """
     Validate if the given string matches the specified regular expression pattern.
 
     Args:
         value (str): The string value to validate.
-        pattern (str): The regular expression pattern to match against.
+        pattern (Union[str, re.Pattern]): The regular expression pattern to match against.
+                                          Precompiled patterns are used as is, pattern
+                                          strings are compiled through the pattern cache.
 
     Returns:
         bool: True if the string matches the pattern, False otherwise.
     """
-    return bool(re.match(pattern, value))
+    return get_pattern(pattern).match(value) is not None
 
 def validate_required(value: Any) -> bool:
     """
@@ -62,8 +108,7 @@ def validate_email(value: str) -> bool:
     Returns:
         bool: True if the string is a valid email format, False otherwise.
     """
-    email_regex = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return validate_regex(value, email_regex)
+    return validate_regex(value, EMAIL_PATTERN)
 
 def validate_country_code(value: str) -> bool:
     """
@@ -79,10 +124,256 @@ def validate_country_code(value: str) -> bool:
     """
     return len(value) == 2 and value.isalpha()
 
+class CompiledRule(NamedTuple):
+    """
+    A single validation rule bound to its check and pre-parsed arguments.
+
+    Attributes:
+        check (Callable[..., bool]): The validation function to call.
+        args (Tuple[Any, ...]): Pre-parsed arguments passed to the check after the value.
+        message (str): The pre-formatted error message reported when the check fails.
+        on_text (bool): Whether the check receives the value converted to a string
+                        rather than the raw value.
+    """
+    check: Callable[..., bool]
+    args: Tuple[Any, ...]
+    message: str
+    on_text: bool = True
+
+
+# A precompiled sequence of rules for one field, applied in the order they were declared
+FieldPlan = Tuple[CompiledRule, ...]
+
+
+def compile_field_rules(rules: Dict[str, Any]) -> FieldPlan:
+    """
+    Compile the validation rules of a single field into a field plan.
+
+    Rule values are parsed once here instead of once per validated value, regular
+    expressions are compiled through the pattern cache and error messages are
+    formatted ahead of time.
+    Unknown rule types are ignored, as they are by validate_field.
+
+    Args:
+        rules (Dict[str, Any]): A dictionary of validation rules to apply.
+
+    Returns:
+        FieldPlan: The compiled rules, in declaration order.
+
+    Raises:
+        ValueError: If a length rule is not an integer.
+        re.error: If a regex rule is not a valid regular expression.
+    """
+    plan = []
+    for rule_type, rule_value in rules.items():
+        if rule_type == "min_length":
+            plan.append(CompiledRule(validate_min_length, (int(rule_value),), f"Minimum length of {rule_value} characters required"))
+        elif rule_type == "max_length":
+            plan.append(CompiledRule(validate_max_length, (int(rule_value),), f"Maximum length of {rule_value} characters exceeded"))
+        elif rule_type == "regex":
+            plan.append(CompiledRule(validate_regex, (get_pattern(rule_value),), "Invalid format"))
+        elif rule_type == "required":
+            plan.append(CompiledRule(validate_required, (), "This field is required", on_text=False))
+        elif rule_type == "email":
+            plan.append(CompiledRule(validate_email, (), "Invalid email format"))
+        elif rule_type == "country_code":
+            plan.append(CompiledRule(validate_country_code, (), "Invalid country code"))
+    return tuple(plan)
+
+def compile_rules(validation_rules: Dict[str, Dict[str, Any]]) -> Dict[str, FieldPlan]:
+    """
+    Compile a validation rules mapping into a field plan per field.
+
+    The result is meant to be built once per validation request and then applied
+    to every row with check_value.
+
+    Args:
+        validation_rules (Dict[str, Dict[str, Any]]): A dictionary of validation rules for each field.
+
+    Returns:
+        Dict[str, FieldPlan]: The compiled plan of each field named in the rules.
+    """
+    return {field_name: compile_field_rules(rules) for field_name, rules in validation_rules.items()}
+
+def check_value(plan: FieldPlan, value: Any) -> Optional[str]:
+    """
+    Apply a field plan to a value.
+
+    When several rules fail, the message of the last failing rule is returned,
+    matching the behaviour of validate_field.
+
+    Args:
+        plan (FieldPlan): The compiled rules of the field.
+        value (Any): The value of the field to validate.
+
+    Returns:
+        Optional[str]: The error message if the value is invalid, None otherwise.
+    """
+    text = str(value)
+    error_message = None
+    for check, args, message, on_text in plan:
+        if not check(text if on_text else value, *args):
+            error_message = message
+    return error_message
+
+def _column_min_length(text: pd.Series, min_length: int) -> pd.Series:
+    """Column-wise counterpart of validate_min_length."""
+    return text.str.len() >= min_length
+
+def _column_max_length(text: pd.Series, max_length: int) -> pd.Series:
+    """Column-wise counterpart of validate_max_length."""
+    return text.str.len() <= max_length
+
+def _column_regex(text: pd.Series, pattern: re.Pattern) -> pd.Series:
+    """Column-wise counterpart of validate_regex."""
+    return text.str.match(pattern).astype(bool)
+
+def _column_required(column: pd.Series) -> pd.Series:
+    """Column-wise counterpart of validate_required."""
+    return column.notna() & column.ne("")
+
+def _column_email(text: pd.Series) -> pd.Series:
+    """Column-wise counterpart of validate_email."""
+    return _column_regex(text, EMAIL_PATTERN)
+
+def _column_country_code(text: pd.Series) -> pd.Series:
+    """Column-wise counterpart of validate_country_code."""
+    return text.str.len().eq(2) & text.str.isalpha()
+
+# Column-wise counterparts of the scalar checks used in compiled rules
+COLUMN_CHECKS = {
+    validate_min_length: _column_min_length,
+    validate_max_length: _column_max_length,
+    validate_regex: _column_regex,
+    validate_required: _column_required,
+    validate_email: _column_email,
+    validate_country_code: _column_country_code,
+}
+
+def check_column(plan: FieldPlan, column: pd.Series) -> pd.Series:
+    """
+    Apply a field plan to a whole column at once.
+
+    Each rule is evaluated as a vectorized operation over the column. Values are
+    converted to strings with astype(str), which matches the str(value) used by
+    check_value, and as with check_value the message of the last failing rule
+    is kept.
+
+    Args:
+        plan (FieldPlan): The compiled rules of the field.
+        column (pd.Series): The values of the field, with object dtype.
+
+    Returns:
+        pd.Series: The error message of each value, or None where the value is valid.
+    """
+    text = column.astype(str)
+    error_messages = np.full(len(column), None, dtype=object)
+    for check, args, message, on_text in plan:
+        values = text if on_text else column
+        column_check = COLUMN_CHECKS.get(check)
+        if column_check is not None:
+            passed = column_check(values, *args)
+        else:
+            passed = values.map(lambda value: check(value, *args))
+        error_messages[~passed.to_numpy(dtype=bool)] = message
+    return pd.Series(error_messages, index=column.index)
+
+def validate_frame(plan: Dict[str, FieldPlan], frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Validate the columns of a DataFrame against a compiled rules plan.
+
+    Args:
+        plan (Dict[str, FieldPlan]): The compiled plan of each field, as returned by compile_rules.
+        frame (pd.DataFrame): The data to validate, with one column per field.
+
+    Returns:
+        pd.DataFrame: A frame with the same index holding the error message of each
+                      cell, or None where the cell is valid, for every planned field
+                      present in the frame.
+    """
+    return pd.DataFrame(
+        {field_name: check_column(field_plan, frame[field_name]) for field_name, field_plan in plan.items() if field_name in frame.columns},
+        index=frame.index
+    )
+
+# Placeholder for keys that are absent from a row when rows are loaded into a DataFrame
+_ABSENT = object()
+
+class FieldCheck(NamedTuple):
+    """
+    The outcome of checking one field of one row.
+
+    Attributes:
+        row_index (int): The index of the row the field belongs to.
+        field_name (str): The name of the checked field.
+        error_message (Optional[str]): The error message, or None if the value is valid.
+        empty (bool): Whether the value is null or an empty string.
+    """
+    row_index: int
+    field_name: str
+    error_message: Optional[str]
+    empty: bool
+
+def check_rows(plan: Dict[str, FieldPlan], engine: str, rows: List[Tuple[int, Dict[str, Any]]]) -> List[FieldCheck]:
+    """
+    Check every planned field of a partition of rows.
+
+    The "python" engine applies the field plan to one value at a time. The
+    "pandas" engine loads the planned columns of the rows into a DataFrame and
+    evaluates every rule column-wise. Both engines skip fields a row does not
+    contain and report the same messages.
+
+    This function only takes and returns plain data, so partitions can be
+    checked in worker processes.
+
+    Args:
+        plan (Dict[str, FieldPlan]): The compiled plan of each field.
+        engine (str): The validation engine to use, either "python" or "pandas".
+        rows (List[Tuple[int, Dict[str, Any]]]): The index and content of each row.
+
+    Returns:
+        List[FieldCheck]: The outcome of each checked cell, in row order.
+    """
+    checks = []
+    if engine == "pandas":
+        field_names = list(plan)
+        row_indices = [row_index for row_index, _ in rows]
+        # Mark absent keys with a sentinel so they can be told apart from null values
+        frame = pd.DataFrame(
+            {field_name: [row.get(field_name, _ABSENT) for _, row in rows] for field_name in field_names},
+            index=row_indices,
+            dtype=object
+        )
+        present = frame.ne(_ABSENT)
+        frame = frame.where(present, None)
+        empty = frame.isna() | frame.eq("")
+        error_messages = validate_frame(plan, frame)
+        for row_index, row_messages, row_present, row_empty in zip(
+            row_indices,
+            error_messages.itertuples(index=False),
+            present.itertuples(index=False),
+            empty.itertuples(index=False)
+        ):
+            for field_name, error_message, is_present, is_empty in zip(field_names, row_messages, row_present, row_empty):
+                if is_present:
+                    checks.append(FieldCheck(row_index, field_name, error_message, bool(is_empty)))
+        return checks
+
+    for row_index, row in rows:
+        for field_name, field_value in row.items():
+            field_plan = plan.get(field_name)
+            if field_plan is not None:
+                checks.append(FieldCheck(row_index, field_name, check_value(field_plan, field_value), field_value is None or field_value == ""))
+    return checks
+
 def validate_field(field_name: str, value: Any, rules: Dict[str, Any]) -> Dict[str, str]:
     """
     Validate a field based on the specified rules and return any validation errors.
 
+    This is a convenience wrapper that compiles the rules on every call. When the
+    same rules are applied to many values, compile them once with compile_rules
+    and use check_value instead.
+
     Args:
         field_name (str): The name of the field being validated.
         value (Any): The value of the field to validate.
@@ -91,20 +382,5 @@ def validate_field(field_name: str, value: Any, rules: Dict[str, Any]) -> Dict[s
     Returns:
         Dict[str, str]: A dictionary containing validation error messages, if any.
     """
-    errors = {}
-
-    for rule_type, rule_value in rules.items():
-        if rule_type == "min_length" and not validate_min_length(str(value), int(rule_value)):
-            errors[field_name] = f"Minimum length of {rule_value} characters required"
-        elif rule_type == "max_length" and not validate_max_length(str(value), int(rule_value)):
-            errors[field_name] = f"Maximum length of {rule_value} characters exceeded"
-        elif rule_type == "regex" and not validate_regex(str(value), rule_value):
-            errors[field_name] = "Invalid format"
-        elif rule_type == "required" and not validate_required(value):
-            errors[field_name] = "This field is required"
-        elif rule_type == "email" and not validate_email(str(value)):
-            errors[field_name] = "Invalid email format"
-        elif rule_type == "country_code" and not validate_country_code(str(value)):
-            errors[field_name] = "Invalid country code"
-
-    return errors
\ No newline at end of file
+    error_message = check_value(compile_field_rules(rules), value)
+    return {field_name: error_message} if error_message else {}
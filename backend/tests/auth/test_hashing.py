@@ -0,0 +1,51 @@
+import asyncio  # Importing asyncio to run hashes concurrently
+import threading  # Importing threading to check where hashes run
+import pytest  # Importing pytest for testing functionalities
+from app.auth import exceptions  # Importing the exception raised when the queue is full
+from app.auth.hashing import PasswordHashExecutor, hash_password, verify_password  # Importing the hashing pool under test
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_off_the_event_loop():
+    """
+    Test that passwords are hashed and verified in the pool, not on the event loop thread.
+    """
+    hashed = await hash_password("secret")
+    assert hashed.startswith("$argon2")
+    assert await verify_password("secret", hashed)
+    assert not await verify_password("wrong", hashed)
+
+    hasher = PasswordHashExecutor(workers=1, max_queue=1)
+    try:
+        assert await hasher.run(threading.get_ident) != threading.get_ident()
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded_and_measured():
+    """
+    Test that at most max_queue hashes wait for a worker, that further ones are
+    rejected with 503, and that the queue depth is recorded.
+    """
+    hasher = PasswordHashExecutor(workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        running = asyncio.ensure_future(hasher.run(release.wait))  # Occupies the only worker
+        await asyncio.sleep(0.05)
+        queued = asyncio.ensure_future(hasher.run(lambda: "done"))  # Waits for the worker
+        await asyncio.sleep(0)
+        assert hasher.stats()["running"] == 1 and hasher.stats()["queued"] == 1
+
+        with pytest.raises(exceptions.PasswordHashingBusyException) as exc_info:
+            await hasher.run(lambda: "rejected")
+        assert exc_info.value.status_code == 503
+
+        release.set()
+        assert await queued == "done"
+        await running
+        stats = hasher.stats()
+        assert (stats["completed"], stats["rejected"], stats["max_queued"], stats["queued"]) == (2, 1, 1, 0)
+    finally:
+        release.set()
+        hasher.shutdown()
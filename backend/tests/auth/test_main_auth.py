@@ -213,4 +213,46 @@ async def test_delete_user(test_app, db_session, test_user):
 
     # Clean up the second user
     await db_session.delete(second_user)
-    await db_session.commit()
\ No newline at end of file
+    await db_session.commit()
+
+@pytest.mark.asyncio
+async def test_current_user_is_cached_until_updated(test_app, db_session, test_user, monkeypatch):
+    """
+    Test that authenticated requests reuse the cached user instead of querying
+    the database, and that updating the user invalidates the cached snapshot.
+
+    Args:
+        test_app: The FastAPI test application instance.
+        db_session: The database session used for the test.
+        test_user: The user to authenticate as.
+        monkeypatch: The pytest fixture used to count user lookups.
+    """
+    from app.auth import service as app_auth_service  # The module used by get_current_user
+
+    lookups = []
+    get_user_by_email = app_auth_service.get_user_by_email
+
+    async def counting_get_user_by_email(db, email):
+        lookups.append(email)
+        return await get_user_by_email(db, email)
+
+    monkeypatch.setattr(app_auth_service, "get_user_by_email", counting_get_user_by_email)
+
+    async with test_app() as app:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            login_data = {"username": test_user.email, "password": "testpassword"}
+            login_response = await client.post(f"{settings.API_V1_STR}/auth/jwt/login", data=login_data)
+            headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+            # Only the first request looks the user up
+            for _ in range(3):
+                response = await client.get(f"{settings.API_V1_STR}/auth/users/me", headers=headers)
+                assert response.status_code == 200
+            assert lookups == [test_user.email]
+
+            # Updating the user drops the cached snapshot
+            response = await client.patch(f"{settings.API_V1_STR}/auth/users/{test_user.id}", json={"first_name": "Cached"}, headers=headers)
+            assert response.status_code == 200
+            response = await client.get(f"{settings.API_V1_STR}/auth/users/me", headers=headers)
+            assert response.json()["first_name"] == "Cached"
+            assert len(lookups) == 2
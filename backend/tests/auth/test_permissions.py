@@ -0,0 +1,59 @@
+import pytest  # Importing pytest for testing functionalities
+from app.auth import cache, exceptions, service  # Importing the permission resolver under test
+from app.auth.dependencies import require_permission  # Importing the authorization dependency under test
+from app.auth.schemas import PermissionCreate, UserResponse  # Importing schemas to build test data
+
+
+@pytest.mark.asyncio
+async def test_effective_permissions_are_cached_and_invalidated(db_session, test_user, test_role, test_permission):
+    """
+    Test that a user's permissions are resolved through their roles, served from
+    the cache afterwards, and recomputed when a role or a membership changes.
+
+    Args:
+        db_session: The database session used for the test.
+        test_user: The user whose permissions are resolved.
+        test_role: The role granted to the user.
+        test_permission: The permission granted to the role.
+    """
+    assert await service.get_effective_permissions(db_session, test_user.id) == frozenset()
+
+    # Granting a role to the user drops the user's cached set
+    await service.assign_permission_to_role(db_session, test_role.id, test_permission.id)
+    await service.assign_role_to_user(db_session, test_user.id, test_role.id)
+    assert await service.get_effective_permissions(db_session, test_user.id) == frozenset({"test_permission"})
+
+    # Cached sets are served without querying the database
+    assert await service.get_effective_permissions(None, test_user.id) == frozenset({"test_permission"})
+
+    # Granting a permission to a role drops every cached set
+    other = await service.create_permission(db_session, PermissionCreate(name="other_permission"))
+    await service.assign_permission_to_role(db_session, test_role.id, other.id)
+    assert cache.permission_cache.get(test_user.id) is None
+    assert await service.get_effective_permissions(db_session, test_user.id) == frozenset({"test_permission", "other_permission"})
+
+
+@pytest.mark.asyncio
+async def test_require_permission(db_session, test_user, test_role, test_permission):
+    """
+    Test that the dependency lets through holders of the permission and
+    superusers, and rejects other users with 403.
+
+    Args:
+        db_session: The database session used for the test.
+        test_user: The user to authorize.
+        test_role: The role granted to the user.
+        test_permission: The permission granted to the role.
+    """
+    await service.assign_permission_to_role(db_session, test_role.id, test_permission.id)
+    await service.assign_role_to_user(db_session, test_user.id, test_role.id)
+    current_user = UserResponse.model_validate(test_user, from_attributes=True)
+
+    assert await require_permission("test_permission")(current_user=current_user, db=db_session) is current_user
+
+    with pytest.raises(exceptions.PermissionDeniedException) as exc_info:
+        await require_permission("missing_permission")(current_user=current_user, db=db_session)
+    assert exc_info.value.status_code == 403
+
+    superuser = current_user.model_copy(update={"is_superuser": True})
+    assert await require_permission("missing_permission")(current_user=superuser, db=None) is superuser
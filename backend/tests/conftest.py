@@ -190,11 +190,34 @@ async def clear_database(db_session: AsyncSession):
     """
     async with db_session.begin():
         # List all your tables here
-        tables = ["users", "roles", "permissions", "user_role", "role_permission", "user_group", "groups", "imported_data", "validation_results"]
+        tables = ["users", "roles", "permissions", "user_role", "role_permission", "user_group", "groups", "imported_data", "imported_rows", "validation_results", "validation_summaries", "jobs"]
         for table in tables:
             await db_session.execute(text(f"TRUNCATE TABLE {table} CASCADE"))
     await db_session.commit()
 
+@pytest_asyncio.fixture(scope="function", autouse=True)
+async def dispose_app_engine():
+    """
+    Dispose the application's engine after each test.
+
+    Pooled asyncpg connections belong to the event loop of the test that opened
+    them, so they must not be reused by tests that use the application's own
+    database, such as tests of background jobs.
+    """
+    yield
+    from app.database import engine as app_engine
+    await app_engine.dispose()
+
+@pytest.fixture(autouse=True)
+def clear_auth_cache():
+    """
+    Empty the authentication caches after each test, since users are recreated
+    with the same emails but new IDs by every test.
+    """
+    yield
+    from app.auth import cache as auth_cache
+    auth_cache.clear()
+
 @pytest_asyncio.fixture(scope="function")
 async def async_client():
     async with AsyncClient(
@@ -0,0 +1,179 @@
+import asyncio  # Importing asyncio to wait between status polls
+import pytest  # Importing pytest for testing functionalities
+from httpx import ASGITransport, AsyncClient  # Importing AsyncClient for making asynchronous HTTP requests
+from backend.app.main import app  # Importing the FastAPI application instance
+
+
+async def _wait_for_job(client: AsyncClient, job_id: str) -> dict:
+    """
+    Poll a job until it has finished.
+
+    Args:
+        client (AsyncClient): The client used to query the API.
+        job_id (str): The ID of the job to wait for.
+
+    Returns:
+        dict: The finished job.
+    """
+    for _ in range(100):
+        response = await client.get(f"/api/v1/jobs/{job_id}")
+        assert response.status_code == 200
+        job = response.json()
+        if job["status"] in ("completed", "failed"):
+            return job
+        await asyncio.sleep(0.05)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+@pytest.mark.asyncio
+async def test_background_import_and_validation():
+    """
+    Test that imports and validations submitted with background=true run as jobs.
+
+    Steps:
+        1. Submit a background import and check that a queued job is returned.
+        2. Wait for the import job and read the import ID from its result.
+        3. Submit a background validation of the import and wait for it.
+        4. Check the validation summary and the progress of the finished job.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        csv_content = "name,email\nJohn,john@email.com\nJane,invalid"
+        files = {"file": ("test.csv", csv_content, "text/csv")}
+        response = await client.post("/api/v1/validator/import/?background=true", files=files)
+
+        assert response.status_code == 202  # The job is accepted rather than completed
+        assert response.json()["kind"] == "import"
+
+        import_job = await _wait_for_job(client, response.json()["id"])
+        assert import_job["status"] == "completed"
+        assert import_job["result"]["row_count"] == 2  # Both rows were stored
+
+        data = {
+            "imported_data_id": import_job["result"]["imported_data_id"],
+            "validation_rules": {"email": {"email": True}}
+        }
+        response = await client.post("/api/v1/validator/validate/?background=true", json=data)
+        assert response.status_code == 202
+
+        validation_job = await _wait_for_job(client, response.json()["id"])
+        assert validation_job["status"] == "completed"
+        assert validation_job["rows_processed"] == 2
+        assert validation_job["result"]["summaries"] == [
+            {"field_name": "email", "valid_count": 1, "invalid_count": 1, "missing_count": 0}
+        ]
+        assert "results" not in validation_job["result"]  # Per-cell results stay in their table
+
+        response = await client.get(f"/api/v1/jobs/{validation_job['id']}/progress")
+        assert response.status_code == 200
+        progress = response.json()
+        assert progress["percent_complete"] == 100.0
+        assert progress["eta_seconds"] is None  # Nothing is left to do
+
+
+@pytest.mark.asyncio
+async def test_unknown_job_returns_404():
+    """
+    Test that requesting an unknown job returns a 404 status code.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/v1/jobs/00000000-0000-0000-0000-000000000000")
+
+    assert response.status_code == 404
+
+
+async def _read_job(job_id):
+    """
+    Read a job row with the application's own session factory.
+
+    Args:
+        job_id: The ID of the job to read.
+    """
+    from app.database import AsyncSessionLocal  # Importing the session factory used by the job runner
+    from app.jobs.models import Job  # Importing the job model
+
+    async with AsyncSessionLocal() as session:
+        return await session.get(Job, job_id)
+
+
+@pytest.mark.asyncio
+async def test_job_runner_shutdown_fails_running_jobs():
+    """
+    Test that shutting down the runner cancels running and queued jobs, records
+    them as failed and drops their progress.
+    """
+    from app.database import AsyncSessionLocal  # Importing the session factory used to submit jobs
+    from app.jobs.service import JobRunner  # Importing the runner under test
+
+    runner = JobRunner(max_concurrency=1, progress_interval=60)
+    started = asyncio.Event()
+
+    async def work(progress):
+        started.set()
+        await asyncio.sleep(3600)
+
+    async with AsyncSessionLocal() as session:
+        running = await runner.submit(session, "test", work)
+        queued = await runner.submit(session, "test", work)
+    await asyncio.wait_for(started.wait(), 5)
+
+    await runner.shutdown()
+
+    for job in (running, queued):
+        stored = await _read_job(job.id)
+        assert stored.status == "failed"
+        assert stored.finished_at is not None
+        assert runner.get_progress(job.id) is None
+
+
+@pytest.mark.asyncio
+async def test_job_runner_finishes_job_when_start_write_fails(monkeypatch):
+    """
+    Test that a job whose "running" status cannot be written is still recorded as failed.
+
+    Args:
+        monkeypatch: The fixture used to make the first status write fail.
+    """
+    from app.database import AsyncSessionLocal  # Importing the session factory used to submit jobs
+    from app.jobs import service as job_service  # Importing the job service to patch its status writes
+
+    update_job = job_service._update_job
+
+    async def failing_update_job(job_id, **values):
+        if values.get("status") == "running":
+            raise RuntimeError("database unavailable")
+        await update_job(job_id, **values)
+
+    monkeypatch.setattr(job_service, "_update_job", failing_update_job)
+    runner = job_service.JobRunner(max_concurrency=1, progress_interval=60)
+
+    async def work(progress):
+        return {}
+
+    async with AsyncSessionLocal() as session:
+        job = await runner.submit(session, "test", work)
+    await asyncio.gather(*runner._tasks.values(), return_exceptions=True)
+
+    stored = await _read_job(job.id)
+    assert stored.status == "failed"
+    assert stored.error == "database unavailable"
+    assert runner.get_progress(job.id) is None
+
+
+@pytest.mark.asyncio
+async def test_fail_interrupted_jobs():
+    """
+    Test that jobs left queued or running by a previous run are marked as failed at startup.
+    """
+    from app.database import AsyncSessionLocal  # Importing the session factory used to store jobs
+    from app.jobs.models import Job  # Importing the job model
+    from app.jobs.service import fail_interrupted_jobs  # Importing the startup cleanup under test
+
+    async with AsyncSessionLocal() as session:
+        jobs = [Job(kind="test", status=status) for status in ("queued", "running", "completed")]
+        session.add_all(jobs)
+        await session.commit()
+
+    assert await fail_interrupted_jobs() >= 2
+
+    assert [(await _read_job(job.id)).status for job in jobs] == ["failed", "failed", "completed"]
+    assert (await _read_job(jobs[1].id)).error == "Interrupted by an application restart"
@@ -0,0 +1,41 @@
+import time  # Importing time to move the clock forward
+from app.cache import TTLCache  # Importing the cache under test
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    """
+    Test that entries expire after the cache lifetime, or after their own shorter lifetime.
+    """
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=5)
+    cache.set("c", 3, ttl=600)  # Capped at the cache lifetime
+
+    now[0] += 10
+    assert cache.get("a") == 1
+    assert cache.get("b") is None  # Expired after its own lifetime
+
+    now[0] += 55
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+    assert cache.stats() == {"size": 0, "maxsize": 10, "hits": 1, "misses": 3}
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """
+    Test that a full cache evicts its least recently used entry, and that a cache of size 0 stores nothing.
+    """
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used entry
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.pop("a") == 1 and len(cache) == 1
+
+    disabled = TTLCache(maxsize=0, ttl=60)
+    disabled.set("a", 1)
+    assert disabled.get("a") is None
@@ -0,0 +1,49 @@
+import pytest  # Importing pytest for testing functionalities
+from httpx import ASGITransport, AsyncClient  # Importing AsyncClient for making asynchronous HTTP requests
+from sqlalchemy import text  # Importing text to run a raw statement
+from app import database  # Importing the engine configuration under test
+from app.config import settings  # Importing settings to configure the engine
+from app.main import app  # Importing the FastAPI application instance
+
+
+def test_engine_options_follow_settings(monkeypatch):
+    """
+    Test that the engine options are read from the DB_* settings, with SQL echo
+    off by default, the prepared statement cache size passed to asyncpg and the
+    statement timeout passed as a server setting.
+    """
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 3)
+    monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT", 5000)
+    options = database.engine_options()
+
+    assert options["echo"] is False
+    assert options["pool_size"] == 3
+    assert options["poolclass"] is database.InstrumentedPool
+    assert options["connect_args"] == {
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        "server_settings": {"statement_timeout": "5000"}
+    }
+
+    monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT", None)
+    assert "server_settings" not in database.engine_options()["connect_args"]
+
+
+@pytest.mark.asyncio
+async def test_pool_endpoint_reports_checkouts():
+    """
+    Test that checkouts are counted and that the pool endpoint reports them.
+    """
+    checkouts = database.checkout_stats.checkouts
+    async with database.AsyncSessionLocal() as session:
+        await session.execute(text("SELECT 1"))
+        assert database.pool_status()["checked_out"] == 1
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/v1/database/pool")
+
+    assert response.status_code == 200
+    status = response.json()
+    assert status["checkouts"] > checkouts
+    assert status["checked_out"] == 0
+    assert status["pool_size"] == settings.DB_POOL_SIZE
+    assert status["max_wait_seconds"] >= status["average_wait_seconds"] >= 0
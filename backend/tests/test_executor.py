@@ -0,0 +1,69 @@
+import os  # Importing os to read the process ID of the worker
+import pytest  # Importing pytest for testing functionalities
+from app import executor  # Importing the process pool layer under test
+from app.config import settings  # Importing settings to configure the pool
+from app.validator.utils import FieldCheck, compile_rules  # Importing the rule compiler
+from app.validator import readers, service  # Importing the partitioned validation under test
+
+
+@pytest.mark.asyncio
+async def test_run_cpu_bound_uses_worker_process(monkeypatch):
+    """
+    Test that work submitted to the pool runs in another process, and in the
+    current process when the pool is disabled.
+    """
+    monkeypatch.setattr(settings, "PROCESS_POOL_WORKERS", 1)
+    try:
+        assert await executor.run_cpu_bound(os.getpid) != os.getpid()  # Ran in a worker process
+    finally:
+        executor.shutdown_process_pool()
+
+    monkeypatch.setattr(settings, "PROCESS_POOL_WORKERS", 0)
+    assert executor.get_process_pool() is None
+    assert await executor.run_cpu_bound(os.getpid) == os.getpid()  # Ran in a thread instead
+
+
+@pytest.mark.asyncio
+async def test_iter_in_thread_closes_generator_when_stopped_early():
+    """
+    Test that the blocking generator is closed as soon as the consumer stops,
+    without waiting for it to be garbage collected.
+    """
+    closed = []
+
+    def batches():
+        try:
+            for start in range(0, 100, 10):
+                yield list(range(start, start + 10))
+        finally:
+            closed.append(True)
+
+    items = executor.iter_in_thread(batches())
+    assert [await items.__anext__() for _ in range(15)] == list(range(15))
+    assert closed == []
+
+    await items.aclose()
+
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("engine", ["python", "pandas"])
+async def test_partitioned_checks_keep_row_order(monkeypatch, engine):
+    """
+    Test that checks split across several partitions are yielded in row order
+    with the same outcome as a single partition.
+
+    Args:
+        engine: The validation engine to use.
+    """
+    monkeypatch.setattr(settings, "PROCESS_POOL_WORKERS", 0)
+    monkeypatch.setattr(settings, "VALIDATION_PARTITION_SIZE", 3)
+    plan = compile_rules({"code": {"min_length": 2}})
+    rows = [(index, {"code": "x" * (index % 3)}) for index in range(10)]
+
+    checks = [check async for check in service.iter_field_checks(readers.iter_rows(rows), plan, engine)]
+
+    assert [check.row_index for check in checks] == list(range(10))
+    assert checks[0] == FieldCheck(0, "code", "Minimum length of 2 characters required", True)
+    assert checks[2] == FieldCheck(2, "code", None, False)
@@ -0,0 +1,65 @@
+import pytest  # Importing pytest for testing functionalities
+from fastapi import HTTPException  # Importing HTTPException to check cursor errors
+from sqlalchemy import select  # Importing select to build the paginated query
+from app.pagination import decode_cursor, encode_cursor, estimate_count, keyset_paginate  # Importing the keyset pagination under test
+from app.validator.models import ImportedData, ImportedRow, ValidationResult  # Importing models to paginate
+
+
+@pytest.mark.asyncio
+async def test_keyset_paginate_walks_all_pages(db_session):
+    """
+    Test that following next_cursor visits every item exactly once, in order,
+    and that the last page has no cursor.
+
+    Args:
+        db_session: The database session used for the test.
+    """
+    imported_data = ImportedData(file_name="test.csv", storage_format="rows")
+    db_session.add(imported_data)
+    await db_session.flush()
+    db_session.add_all(
+        ImportedRow(imported_data_id=imported_data.id, row_index=index, data={"n": index}) for index in range(7)
+    )
+    await db_session.commit()
+
+    query = select(ImportedRow).where(ImportedRow.imported_data_id == imported_data.id)
+    order_by = [ImportedRow.imported_data_id, ImportedRow.row_index]
+    seen, cursor = [], None
+    while True:
+        page = await keyset_paginate(db_session, query, order_by, cursor, size=3, estimate_total=True)
+        assert page.total is not None and page.total >= 0  # The planner always returns an estimate
+        seen.extend(row.row_index for row in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == list(range(7))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", ["Time%20:start", "a :b", "50%", "it's"])
+async def test_estimate_count_keeps_literal_values(db_session, value):
+    """
+    Test that filter values resembling bind parameters, percent signs or quotes
+    are kept as literals in the planned statement.
+
+    Args:
+        db_session: The database session used for the test.
+        value: The filtered field name.
+    """
+    query = select(ValidationResult).where(ValidationResult.field_name == value)
+
+    assert await estimate_count(db_session, query) >= 0
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor([1, 2, 3]), encode_cursor({"a": 1})])
+def test_decode_cursor_rejects_malformed_cursors(cursor):
+    """
+    Test that malformed cursors, or cursors built for another ordering, are rejected.
+
+    Args:
+        cursor: The cursor to decode.
+    """
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, [ImportedRow.imported_data_id, ImportedRow.row_index])
+    assert exc_info.value.status_code == 400
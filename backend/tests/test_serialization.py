@@ -0,0 +1,46 @@
+import datetime  # Importing datetime to build values serialized natively
+import uuid  # Importing uuid to build values serialized natively
+from decimal import Decimal  # Importing Decimal to exercise the fallback hook
+from pydantic import BaseModel  # Importing BaseModel to exercise the fallback hook
+from app import serialization  # Importing the serializer under test
+from app.main import app  # Importing the application to check its response class
+
+
+class Item(BaseModel):
+    name: str
+    id: uuid.UUID
+
+
+def test_dumps_handles_uuid_datetime_and_models():
+    """
+    Test that UUIDs, datetimes, decimals, sets and pydantic models are serialized
+    and that the result round-trips through loads.
+    """
+    item_id = uuid.uuid4()
+    moment = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    data = {"id": item_id, "at": moment, "price": Decimal("1.50"), "tags": {"a"}, "item": Item(name="x", id=item_id)}
+
+    assert serialization.loads(serialization.dumps(data)) == {
+        "id": str(item_id),
+        "at": "2024-01-02T03:04:05",
+        "price": "1.50",
+        "tags": ["a"],
+        "item": {"name": "x", "id": str(item_id)}
+    }
+    assert serialization.dumps_str({1: "a"}) == '{"1":"a"}'  # Non-string keys are allowed
+
+
+def test_dumps_lines_writes_one_object_per_line():
+    """
+    Test that dumps_lines writes newline-delimited JSON, one object per line.
+    """
+    encoded = serialization.dumps_lines([{"a": 1}, {"a": 2}])
+    assert encoded == b'{"a":1}\n{"a":2}\n'
+    assert serialization.dumps_lines([]) == b""
+
+
+def test_application_renders_with_orjson():
+    """
+    Test that the application renders its responses with the orjson-backed response class.
+    """
+    assert app.router.default_response_class is serialization.ORJSONResponse
@@ -0,0 +1,308 @@
+import csv  # Importing csv to compare against the standard DictReader
+import io  # Importing io for in-memory text buffers
+import pytest  # Importing pytest for testing functionalities
+from backend.app.validator import readers  # Importing the streaming readers under test
+
+
+async def _chunked(data: bytes, size: int):
+    """
+    Yield the given bytes in chunks of the given size.
+
+    Args:
+        data (bytes): The data to split.
+        size (int): The size of each chunk.
+    """
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def _collect(rows):
+    """
+    Collect an asynchronous iterator into a list.
+
+    Args:
+        rows: The asynchronous iterator to collect.
+    """
+    return [row async for row in rows]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 4096])
+async def test_iter_csv_rows_matches_dict_reader(chunk_size):
+    """
+    Test that chunked CSV parsing matches csv.DictReader.
+
+    The content includes a quoted field with an embedded newline, escaped
+    quotes and a multi-byte character, so small chunk sizes split records
+    and characters at every possible position.
+
+    Args:
+        chunk_size: The number of bytes per chunk.
+    """
+    csv_content = 'name,note\nJohn,"line one\nline two"\nJane,"say ""hi"""\nZoë,plain\n'
+    expected = list(csv.DictReader(io.StringIO(csv_content, newline="")))
+
+    rows = await _collect(readers.iter_csv_rows(_chunked(csv_content.encode("utf-8"), chunk_size)))
+
+    assert rows == expected  # Ensure the streamed rows match the reference parser
+    assert rows[0]["note"] == "line one\nline two"  # Check the embedded newline survived
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_records_parses_blocks_concurrently_in_order(monkeypatch):
+    """
+    Test that up to one block per worker is parsed at a time, and that the
+    records still come out in file order.
+
+    Args:
+        monkeypatch: The fixture used to size the pool and track the parsing.
+    """
+    import asyncio  # Importing asyncio to let the parsing overlap
+
+    running, peak = 0, 0
+
+    async def run_cpu_bound(func, *args):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return func(*args)
+
+    monkeypatch.setattr(readers, "pool_size", lambda: 3)
+    monkeypatch.setattr(readers, "run_cpu_bound", run_cpu_bound)
+    csv_content = "".join(f"{index},value {index}\n" for index in range(200))
+
+    records = await _collect(readers.iter_csv_records(_chunked(csv_content.encode("utf-8"), 64)))
+
+    assert records == list(csv.reader(io.StringIO(csv_content, newline="")))
+    assert peak == 4  # Three blocks in flight while the next one is submitted
+
+@pytest.mark.asyncio
+async def test_iter_batches():
+    """
+    Test that rows are grouped into batches of the requested size.
+    """
+    batches = await _collect(readers.iter_batches(readers.iter_rows([{"i": i} for i in range(5)]), 2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]  # Check the batch sizes
+    assert batches[-1] == [{"i": 4}]  # Check the final partial batch
+
+
+@pytest.mark.asyncio
+async def test_iter_xlsx_rows_streams_worksheet():
+    """
+    Test that XLSX rows are streamed with pandas-style headers, dates as ISO
+    strings, blank cells as None and blank rows skipped.
+    """
+    import datetime  # Importing datetime to write a date cell
+    import openpyxl  # Importing openpyxl to build the workbook
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["name", None, "name"])
+    sheet.append(["John", datetime.datetime(2024, 1, 2, 3, 4, 5), 1])
+    sheet.append([None, None, None])
+    sheet.append(["Jane", None, None])
+    content = io.BytesIO()
+    workbook.save(content)
+    content.seek(0)
+
+    rows = await _collect(readers.iter_xlsx_rows(content, batch_size=1))
+
+    assert rows == [
+        {"name": "John", "Unnamed: 1": "2024-01-02T03:04:05", "name.1": 1},
+        {"name": "Jane", "Unnamed: 1": None, "name.1": None},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_xlsx_rows_closes_workbook_when_stopped_early(monkeypatch):
+    """
+    Test that the worksheet reader, and so the workbook, is closed as soon as
+    the consumer of the rows stops early.
+
+    Args:
+        monkeypatch: The fixture used to track the worksheet reader.
+    """
+    closed = []
+
+    def read_xlsx_batches(file, batch_size):
+        try:
+            yield [["name"], ["John"], ["Jane"]]
+            yield [["Zoe"]]
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(readers, "read_xlsx_batches", read_xlsx_batches)
+
+    rows = readers.iter_xlsx_rows(io.BytesIO(), batch_size=3, sample_size=2)
+    assert await rows.__anext__() == {"name": "John"}
+    await rows.aclose()
+
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_read_xls_records_locates_table(monkeypatch):
+    """
+    Test that a legacy XLS sheet is read without a header row, so the table is
+    located past its banner rows like in CSV and XLSX files.
+
+    Args:
+        monkeypatch: The fixture used to stand in for the XLS engine.
+    """
+    import datetime  # Importing datetime to provide a date cell
+    import pandas as pd  # Importing pandas to build the sheet read by pd.read_excel
+
+    sheet = pd.DataFrame([
+        ["Supplier report", None, None],
+        [None, None, None],
+        [None, "name", "joined"],
+        [None, "John", datetime.datetime(2024, 1, 2)],
+        [None, "Jane", None],
+    ])
+
+    def read_excel(content, header="infer"):
+        assert header is None  # The header row is located by the layout detection
+        return sheet
+
+    monkeypatch.setattr(readers.pd, "read_excel", read_excel)
+
+    records = readers.read_xls_records(b"")
+    rows = await _collect(readers.iter_table_rows(readers.iter_rows(records), sample_size=50))
+
+    assert rows == [
+        {"name": "John", "joined": "2024-01-02T00:00:00"},
+        {"name": "Jane", "joined": None},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_rows_skips_banner_rows():
+    """
+    Test that a table that does not start at A1 is located from the sampled
+    prefix: banner rows above it and empty columns before it are skipped.
+    """
+    csv_content = (
+        "Supplier report,,,\n"
+        ",Generated 2024-01-31,,\n"
+        ",,,\n"
+        ",name,email,amount\n"
+        ",John,john@email.com,10\n"
+        ",Jane,,20\n"
+        ",,,\n"
+        ",Zoe,zoe@email.com\n"
+    )
+
+    rows = await _collect(readers.iter_csv_rows(_chunked(csv_content.encode("utf-8"), 16), sample_size=5))
+
+    assert rows == [
+        {"name": "John", "email": "john@email.com", "amount": "10"},
+        {"name": "Jane", "email": "", "amount": "20"},
+        {"name": "Zoe", "email": "zoe@email.com", "amount": None},  # Read after the sample, padded with None
+    ]
+
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("csv_content, expected_columns", [
+    (",,\n,name,email\n", ["name", "email"]),  # A header without data rows
+    (",,\n,name,email\n,John,john@email.com\n", ["name", "email"]),
+    ("", []),  # No table at all
+])
+async def test_table_rows_expose_detected_header(csv_content, expected_columns):
+    """
+    Test that the header found by the layout detection is exposed once the rows
+    have been read, also when the table has no data rows.
+
+    Args:
+        csv_content: The content of the CSV file.
+        expected_columns: The header names that should be detected.
+    """
+    rows = readers.iter_csv_rows(_chunked(csv_content.encode("utf-8"), 4))
+    assert rows.columns is None  # Nothing has been read yet
+
+    await _collect(rows)
+
+    assert rows.columns == expected_columns
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding, expected_encoding", [
+    ("utf-8", "utf-8"),
+    ("utf-8-sig", "utf-8-sig"),
+    ("utf-16", "utf-16"),
+    ("cp1252", None),
+])
+async def test_sniff_csv_detects_encoding_and_dialect(encoding, expected_encoding):
+    """
+    Test that the encoding, byte order mark and delimiter are sniffed from a
+    sample, and that the rows parse the same as a comma-separated UTF-8 file.
+
+    Args:
+        encoding: The encoding used to write the file.
+        expected_encoding: The encoding that should be detected, or None for any
+                           encoding that decodes the file correctly.
+    """
+    csv_content = "name;city;note\n" + "José;Zürich;\"a;b\"\nJane;Oslo;Crème brûlée\n" * 20
+    data = csv_content.encode(encoding)
+
+    csv_format, chunks = await readers.sniff_csv(_chunked(data, 64), 256)
+    rows = await _collect(readers.iter_csv_rows(chunks, csv_format))
+
+    if expected_encoding:
+        assert csv_format.encoding == expected_encoding
+    assert csv_format.delimiter == ";"
+    assert len(rows) == 40  # Every row is read, including the sampled ones
+    assert rows[0] == {"name": "José", "city": "Zürich", "note": "a;b"}
+    assert rows[1] == {"name": "Jane", "city": "Oslo", "note": "Crème brûlée"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 4096])
+async def test_iter_csv_blocks_treat_quotes_inside_unquoted_fields_as_literal(chunk_size):
+    """
+    Test that a quote inside an unquoted field, such as an inch mark, does not
+    hide the record ends that follow it, so blocks keep ending on every chunk.
+
+    Args:
+        chunk_size: The number of bytes per chunk.
+    """
+    csv_content = 'code,item\nA1,12" steel pipe\nA2,"quoted, ""with"" quotes"\nA3,5\' 6"\n' + "B,plain\n" * 200
+    expected = list(csv.DictReader(io.StringIO(csv_content, newline="")))
+
+    blocks = await _collect(readers.iter_csv_blocks(_chunked(csv_content.encode("utf-8"), chunk_size)))
+    rows = await _collect(readers.iter_csv_rows(_chunked(csv_content.encode("utf-8"), chunk_size)))
+
+    assert rows == expected  # The literal quotes are kept as the csv module does
+    assert rows[0]["item"] == '12" steel pipe'
+    assert max(len(block) for block in blocks) <= chunk_size + 64  # No block accumulates the rest of the file
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_rows_falls_back_after_the_sample():
+    """
+    Test that a file sniffed as UTF-8 from its sample, but holding a Latin-1
+    byte further down, is decoded to the end instead of failing mid-import.
+    """
+    csv_content = "name,city\n" + "John,Paris\n" * 8000
+    data = csv_content.encode("ascii") + "Jean,Montréal\n".encode("latin-1")
+    assert len(csv_content) > 64 * 1024  # The accented byte is past the sniffed sample
+
+    csv_format, chunks = await readers.sniff_csv(_chunked(data, 4096), 64 * 1024)
+    rows = await _collect(readers.iter_csv_rows(chunks, csv_format))
+
+    assert csv_format.encoding == "utf-8"
+    assert len(rows) == 8001
+    assert rows[-1] == {"name": "Jean", "city": "Montréal"}
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_rows_reports_undecodable_bytes():
+    """
+    Test that invalid bytes in an encoding without a fallback raise CsvDecodeError naming the encoding.
+    """
+    data = "name\n".encode("utf-16-le") + b"\x00\xd8"  # An unpaired surrogate at the end of the file
+
+    with pytest.raises(readers.CsvDecodeError, match="utf-16-le"):
+        await _collect(readers.iter_csv_rows(_chunked(data, 4), readers.CsvFormat(encoding="utf-16-le")))
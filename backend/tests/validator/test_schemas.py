@@ -2,7 +2,7 @@ import json  # Importing the json module for handling JSON data
 import pytest  # Importing pytest for testing functionalities
 import httpx  # Importing httpx for making HTTP requests
 from httpx import ASGITransport, AsyncClient  # Importing AsyncClient for making asynchronous HTTP requests
-from backend.app.validator.schemas import ImportedData, ValidationResult  # Importing schemas for validation
+from backend.app.validator.schemas import ImportedDataResponse, ValidationResult  # Importing schemas for validation
 from datetime import datetime  # Importing datetime for handling date and time
 import uuid  # Importing uuid for generating unique identifiers
 from backend.app.main import app  # Importing the FastAPI application instance
@@ -11,18 +11,19 @@ from backend.app.validator.models import ImportedData  # Importing the ImportedD
 @pytest.mark.asyncio
 async def test_imported_data_schema():
     """
-    Test the ImportedData schema.
+    Test the ImportedDataResponse schema.
 
-    This test verifies that the ImportedData schema correctly validates
+    This test verifies that the ImportedDataResponse schema correctly validates
     the response from the API when importing a CSV file. It checks that
-    the response data can be correctly deserialized into the ImportedData
-    schema and that the data matches the expected format.
+    the response describes the import without echoing its content, and
+    that the content can be streamed from the rows endpoint.
 
     Steps:
         1. Send a POST request to import a CSV file.
         2. Validate the response status code.
-        3. Deserialize the response data into the ImportedData schema.
+        3. Deserialize the response data into the ImportedDataResponse schema.
         4. Validate the attributes of the deserialized schema.
+        5. Stream the rows of the import and validate them.
     """
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -45,34 +46,41 @@ async def test_imported_data_schema():
         print("Response Data:", response_data)
         
         # Validate the response using the Pydantic schema
-        imported_data_schema = ImportedData(**response_data)
-        imported_data_schema.id = uuid.UUID(imported_data_schema.id)  # Convert id to UUID
-        imported_data_schema.uploaded_at = datetime.fromisoformat(imported_data_schema.uploaded_at)  # Convert uploaded_at to datetime
-        
+        imported_data_schema = ImportedDataResponse(**response_data)
+
         # Assert that the id is of type UUID
         assert isinstance(imported_data_schema.id, uuid.UUID)
-        
-        # Validate the database model
-        imported_data_model = ImportedData(**response_data)
-        imported_data_model.id = uuid.UUID(imported_data_model.id)  # Convert id to UUID
-        imported_data_model.uploaded_at = datetime.fromisoformat(imported_data_model.uploaded_at)  # Convert uploaded_at to datetime
-        
-        # Assert that the id is of type UUID
-        assert isinstance(imported_data_model.id, uuid.UUID)
-        
+
         # Validate the attributes of the imported data schema
         assert imported_data_schema.file_name == "test.csv"  # Check the file name
         assert isinstance(imported_data_schema.uploaded_at, datetime)  # Check the uploaded_at type
-        assert isinstance(imported_data_schema.data_content, str)  # Check the data_content type
-        
-        # Deserialize the data_content from JSON
-        deserialized_content = json.loads(imported_data_schema.data_content)
-        
+        assert imported_data_schema.row_count == 2  # Ensure there are two records
+        assert imported_data_schema.columns == ["name", "email"]  # Check the column names
+        assert imported_data_schema.byte_size == len(csv_content)  # Check the upload size
+        assert imported_data_schema.preview[0]["name"] == "John"  # Check the first record's name
+        assert "data_content" not in response_data  # The content is not echoed back
+
+        # Stream the full content from the rows endpoint
+        response = await client.get(f"/api/v1/validator/imports/{imported_data_schema.id}/rows")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        deserialized_content = [json.loads(line) for line in response.text.splitlines()]
+
         # Validate the deserialized content
         assert len(deserialized_content) == 2  # Ensure there are two records
         assert deserialized_content[0]["name"] == "John"  # Check the first record's name
         assert deserialized_content[1]["name"] == "Jane"  # Check the second record's name
 
+        # A file holding only a header is stored with its columns and no rows
+        response = await client.post("/api/v1/validator/import/", files={"file": ("empty.csv", "name,email\n", "text/csv")})
+        assert response.status_code == 200
+        assert response.json()["row_count"] == 0
+        assert response.json()["columns"] == ["name", "email"]
+
+        # Unknown imports are reported as not found
+        response = await client.get(f"/api/v1/validator/imports/{uuid.uuid4()}/rows")
+        assert response.status_code == 404
+
 @pytest.mark.asyncio
 async def test_validation_result_schema(test_app, client, db_session):
     """
@@ -118,8 +126,19 @@ async def test_validation_result_schema(test_app, client, db_session):
     assert response.status_code == 200
     response_json = response.json()  # Get the response data in JSON format
     
+    # Validate the report totals and the per-field summary
+    assert response_json["rows_processed"] == 1  # The single stored object counts as one row
+    assert response_json["summaries"] == [
+        {"field_name": "test_field", "valid_count": 1, "invalid_count": 0, "missing_count": 0}
+    ]
+
+    # The report points to the paged listing of every stored result
+    assert response_json["results_truncated"] is False
+    assert response_json["results_url"] == f"http://test/api/v1/validator/imports/{imported_data.id}/results"
+
     # Iterate over the list of validation results
-    for item in response_json:
+    assert len(response_json["results"]) == 1  # One result for the single validated field
+    for item in response_json["results"]:
         # Create a ValidationResult instance from the response data
         validation_result = ValidationResult(**{k: v for k, v in item.items() if k != "validation_rules"})
         
@@ -127,5 +146,219 @@ async def test_validation_result_schema(test_app, client, db_session):
         assert validation_result.field_name == "test_field"  # Check the field name
         assert validation_result.validation_status == "valid"  # Check the validation status
         assert validation_result.error_message is None  # Ensure there is no error message
+        assert validation_result.row_index == 0  # Check the row index of the result
         assert isinstance(validation_result.id, uuid.UUID)  # Assert that the id is of type UUID
-        assert validation_result.imported_data_id == imported_data.id  # Check the imported data ID
\ No newline at end of file
+        assert validation_result.imported_data_id == imported_data.id  # Check the imported data ID
+
+
+@pytest.mark.asyncio
+async def test_validation_failures_only_mode(test_app, db_session):
+    """
+    Test the failures-only result storage mode.
+
+    This test verifies that only invalid cells are stored as validation results,
+    that the per-field summaries are stored, and that the response carries the
+    summaries instead of one result per cell.
+
+    Args:
+        test_app: The FastAPI test application instance.
+        db_session: The database session used for the test.
+    """
+    from sqlalchemy import select  # Importing select for querying stored results
+    from backend.app.validator.models import ValidationResult as ValidationResultModel, ValidationSummary  # Importing result models
+
+    # Create an ImportedData instance holding three rows
+    imported_data = ImportedData(
+        file_name="test.csv",
+        uploaded_at=datetime.now(),
+        data_content=json.dumps([{"email": "a@b.co"}, {"email": "bad"}, {"email": ""}]).encode('utf-8')
+    )
+    db_session.add(imported_data)
+    await db_session.commit()
+
+    data = {
+        "imported_data_id": str(imported_data.id),
+        "validation_rules": {"email": {"regex": r"^(.*@.*)?$"}},
+        "storage_mode": "failures_only"
+    }
+
+    async with test_app() as app:
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.post("/api/v1/validator/validate/", json=data)
+
+    assert response.status_code == 200
+    response_json = response.json()
+    assert response_json["storage_mode"] == "failures_only"
+    assert response_json["results"] == []  # No per-cell results are returned
+    assert response_json["summaries"] == [
+        {"field_name": "email", "valid_count": 1, "invalid_count": 1, "missing_count": 1}
+    ]
+
+    # Only the invalid cell is stored, together with one summary row
+    stored_results = (await db_session.execute(
+        select(ValidationResultModel).filter(ValidationResultModel.imported_data_id == imported_data.id)
+    )).scalars().all()
+    assert [(result.row_index, result.validation_status) for result in stored_results] == [(1, "invalid")]
+    stored_summaries = (await db_session.execute(
+        select(ValidationSummary).filter(ValidationSummary.imported_data_id == imported_data.id)
+    )).scalars().all()
+    assert [(summary.valid_count, summary.invalid_count, summary.missing_count) for summary in stored_summaries] == [(1, 1, 1)]
+
+
+@pytest.mark.asyncio
+async def test_validation_report_caps_inline_results(test_app, db_session, monkeypatch):
+    """
+    Test that the report carries at most VALIDATION_INLINE_RESULTS results and
+    flags the rest as truncated, while every result is still stored.
+
+    Args:
+        test_app: The FastAPI test application instance.
+        db_session: The database session used for the test.
+        monkeypatch: The fixture used to lower the inline result limit.
+    """
+    from sqlalchemy import func, select  # Importing func and select for counting stored results
+    from app.config import settings  # Importing settings to lower the inline result limit
+    from backend.app.validator.models import ValidationResult as ValidationResultModel  # Importing the result model
+
+    monkeypatch.setattr(settings, "VALIDATION_INLINE_RESULTS", 2)
+    imported_data = ImportedData(
+        file_name="test.csv",
+        uploaded_at=datetime.now(),
+        data_content=json.dumps([{"name": f"user{i}"} for i in range(5)]).encode('utf-8')
+    )
+    db_session.add(imported_data)
+    await db_session.commit()
+
+    data = {"imported_data_id": str(imported_data.id), "validation_rules": {"name": {"type": "string"}}}
+    async with test_app() as app:
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.post("/api/v1/validator/validate/", json=data)
+
+    assert response.status_code == 200
+    response_json = response.json()
+    assert [result["row_index"] for result in response_json["results"]] == [0, 1]  # Only the first results are inline
+    assert response_json["results_truncated"] is True
+    assert response_json["summaries"][0]["valid_count"] == 5  # The summaries cover every row
+
+    stored_count = (await db_session.execute(
+        select(func.count()).select_from(ValidationResultModel).filter(ValidationResultModel.imported_data_id == imported_data.id)
+    )).scalar_one()
+    assert stored_count == 5  # Every result is stored for the results endpoint
+
+
+@pytest.mark.asyncio
+async def test_list_validation_results(test_app, db_session):
+    """
+    Test the paginated listing of the validation results of an import.
+
+    This test verifies that the results can be filtered by status, field and row
+    range, that following next_cursor visits every matching result once in row
+    order, and that an unknown import or a malformed cursor is rejected.
+
+    Args:
+        test_app: The FastAPI test application instance.
+        db_session: The database session used for the test.
+    """
+    # Create an ImportedData instance holding six rows, every other one invalid
+    imported_data = ImportedData(
+        file_name="test.csv",
+        uploaded_at=datetime.now(),
+        data_content=json.dumps([{"email": "a@b.co" if index % 2 else "bad", "name": "x"} for index in range(6)]).encode('utf-8')
+    )
+    db_session.add(imported_data)
+    await db_session.commit()
+
+    data = {
+        "imported_data_id": str(imported_data.id),
+        "validation_rules": {"email": {"regex": r"^.*@.*$"}, "name": {"min_length": 1}}
+    }
+    url = f"/api/v1/validator/imports/{imported_data.id}/results"
+
+    async with test_app() as app:
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.post("/api/v1/validator/validate/", json=data)
+            assert response.status_code == 200
+
+            # Page through the failures two at a time
+            failures, cursor = [], None
+            while True:
+                params = {"validation_status": "invalid", "size": 2}
+                if cursor is not None:
+                    params["cursor"] = cursor
+                response = await ac.get(url, params=params)
+                assert response.status_code == 200
+                page = response.json()
+                failures.extend(page["items"])
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    break
+            assert [(result["row_index"], result["field_name"]) for result in failures] == [(0, "email"), (2, "email"), (4, "email")]
+
+            # Filter by field and row range, with an estimated total
+            response = await ac.get(url, params={"field_name": "name", "row_start": 2, "row_end": 4, "estimate_total": True})
+            page = response.json()
+            assert [result["row_index"] for result in page["items"]] == [2, 3]
+            assert page["next_cursor"] is None
+            assert isinstance(page["total"], int)
+
+            # Unknown imports and malformed cursors are rejected
+            response = await ac.get(f"/api/v1/validator/imports/{uuid.uuid4()}/results")
+            assert response.status_code == 404
+            response = await ac.get(url, params={"cursor": "garbage"})
+            assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+async def test_export_validation_results(test_app, db_session, monkeypatch, export_format):
+    """
+    Test the streaming export of the validation results of an import.
+
+    This test verifies that every matching result is exported in row order when
+    the results span several fetched batches, in both output formats.
+
+    Args:
+        test_app: The FastAPI test application instance.
+        db_session: The database session used for the test.
+        monkeypatch: The pytest fixture used to shrink the export batch size.
+        export_format: The output format to request.
+    """
+    import csv  # Importing csv to parse the CSV export
+    from app.config import settings  # Importing settings to shrink the export batch size
+
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+
+    # Create an ImportedData instance holding five rows, every other one invalid
+    imported_data = ImportedData(
+        file_name="test.csv",
+        uploaded_at=datetime.now(),
+        data_content=json.dumps([{"email": "a@b.co" if index % 2 else "bad"} for index in range(5)]).encode('utf-8')
+    )
+    db_session.add(imported_data)
+    await db_session.commit()
+
+    data = {"imported_data_id": str(imported_data.id), "validation_rules": {"email": {"regex": r"^.*@.*$"}}}
+    url = f"/api/v1/validator/imports/{imported_data.id}/results/export"
+
+    async with test_app() as app:
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.post("/api/v1/validator/validate/", json=data)
+            assert response.status_code == 200
+
+            response = await ac.get(url, params={"format": export_format})
+            assert response.status_code == 200
+            if export_format == "csv":
+                assert response.headers["content-type"].startswith("text/csv")
+                exported = list(csv.DictReader(response.text.splitlines()))
+            else:
+                assert response.headers["content-type"] == "application/x-ndjson"
+                exported = [json.loads(line) for line in response.text.splitlines()]
+            assert [int(result["row_index"]) for result in exported] == [0, 1, 2, 3, 4]
+            assert [result["validation_status"] for result in exported] == ["invalid", "valid", "invalid", "valid", "invalid"]
+
+            # Filters apply to the export as well
+            response = await ac.get(url, params={"format": export_format, "validation_status": "valid"})
+            assert response.text.count("invalid") == 0
+
+            response = await ac.get(f"/api/v1/validator/imports/{uuid.uuid4()}/results/export")
+            assert response.status_code == 404
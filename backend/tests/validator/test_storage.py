@@ -0,0 +1,106 @@
+import pytest  # Importing pytest for testing functionalities
+from httpx import AsyncClient  # Importing AsyncClient for making asynchronous HTTP requests
+from app.config import settings  # Importing settings to select the storage backend
+from app.validator import storage  # Importing the storage backends under test
+
+
+@pytest.mark.asyncio
+async def test_parquet_storage_round_trip(test_app, monkeypatch, tmp_path):
+    """
+    Test that imports stored as Parquet files are validated like row-stored imports,
+    and that only the requested columns are read back.
+
+    Args:
+        test_app: The FastAPI test application instance.
+        monkeypatch: The fixture used to select the Parquet storage backend.
+        tmp_path: The temporary directory used as the storage directory.
+    """
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(settings, "STORAGE_BACKEND", "parquet")
+    monkeypatch.setattr(settings, "STORAGE_DIR", str(tmp_path))
+
+    csv_content = "name,email\nJohn,john@email.com\nJane,invalid\n"
+    async with test_app() as app:
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.post("/api/v1/validator/import/", files={"file": ("test.csv", csv_content, "text/csv")})
+            assert response.status_code == 200
+            imported_data_id = response.json()["id"]
+
+            data = {"imported_data_id": imported_data_id, "validation_rules": {"email": {"email": True}}}
+            response = await ac.post("/api/v1/validator/validate/", json=data)
+
+    assert response.status_code == 200
+    assert response.json()["summaries"] == [
+        {"field_name": "email", "valid_count": 1, "invalid_count": 1, "missing_count": 0}
+    ]
+
+    # The rows are stored in a file named after the import, and columns can be read selectively
+    path = storage.storage_file(f"{imported_data_id}.parquet")
+    assert list(storage.read_parquet_batches(path, ["email", "unknown"], 10)) == [
+        [{"email": "john@email.com"}, {"email": "invalid"}]
+    ]
+
+
+@pytest.mark.parametrize("codec", [None, "zlib", "lzma", "zstd"])
+def test_compressed_payload_round_trip(codec):
+    """
+    Test that rows written by the blob writer are read back in order, with the
+    payload decompressed in pieces smaller than a row and parsed in batches.
+
+    Args:
+        codec: The compression codec, or None for an uncompressed payload.
+    """
+    import asyncio  # Importing asyncio to drive the writer
+    from types import SimpleNamespace  # Importing SimpleNamespace to stand in for the import
+    from app.validator import compression  # Importing the codecs under test
+
+    if codec is not None and codec not in compression.available_codecs():
+        pytest.skip(f"{codec} is not available")
+    imported_data = SimpleNamespace(data_content=None, data_codec=None)
+    rows = [{"name": f"supplier {index}", "country": "US"} for index in range(1000)]
+
+    async def write():
+        writer = storage.BlobRowWriter(imported_data, codec)
+        await writer.write(rows[:600], 0)
+        await writer.write(rows[600:], 600)
+        await writer.close()
+
+    asyncio.run(write())
+
+    assert imported_data.data_codec == codec
+    if codec is not None:
+        assert len(imported_data.data_content) * 10 < len(b"".join(compression.iter_decompressed(imported_data.data_content, codec, 1024)))
+    async def read():
+        return [row async for row in storage.iter_blob_rows(imported_data.data_content, codec, 7, 300)]
+
+    assert list(storage.read_blob_batches(imported_data.data_content, codec, 7, 300))[-1] == rows[900:]
+    assert asyncio.run(read()) == rows
+
+
+@pytest.mark.parametrize("document, expected", [
+    ([{"name": "John"}, {"name": "Jane"}], [{"name": "John"}, {"name": "Jane"}]),
+    ({"name": "John"}, [{"name": "John"}]),
+])
+def test_read_json_rows(document, expected):
+    """
+    Test that legacy JSON documents are read as rows, whether they hold a list of rows or a single object.
+
+    Args:
+        document: The stored JSON document.
+        expected: The rows it holds.
+    """
+    import json  # Importing json to encode the legacy document
+    import zlib  # Importing zlib to compress it
+
+    assert storage.read_json_rows(zlib.compress(json.dumps(document).encode("utf-8")), "zlib", 4) == expected
+    assert storage.read_json_rows(b"", None, 4) == []
+
+
+def test_unknown_codec_is_rejected():
+    """
+    Test that unsupported codecs raise a ValueError.
+    """
+    from app.validator import compression  # Importing the codecs under test
+
+    with pytest.raises(ValueError):
+        compression.compressor("brotli")
@@ -0,0 +1,131 @@
+import re  # Importing re to build precompiled patterns
+import pandas as pd  # Importing pandas to build frames for the vectorized engine
+import pytest  # Importing pytest for testing functionalities
+from backend.app.validator.utils import compile_rules, check_value, validate_field  # Importing the rule compiler under test
+from backend.app.validator.utils import compile_pattern, regex_cache_info, validate_regex  # Importing the pattern cache under test
+from backend.app.validator.utils import validate_frame  # Importing the vectorized engine under test
+
+
+def test_compile_rules_builds_plan_per_field():
+    """
+    Test that compile_rules returns one plan per field, skipping unknown rule types.
+
+    Fields whose rules are all unknown still get an (empty) plan, so they are
+    reported as valid rather than ignored.
+    """
+    plan = compile_rules({"name": {"min_length": "2", "type": "string"}, "note": {"type": "string"}})
+
+    assert set(plan) == {"name", "note"}  # Every field named in the rules gets a plan
+    assert len(plan["name"]) == 1  # The unknown 'type' rule is dropped
+    assert plan["name"][0].args == (2,)  # The length is parsed once at compile time
+    assert plan["note"] == ()  # A field with only unknown rules has an empty plan
+    assert check_value(plan["note"], "anything") is None  # An empty plan accepts any value
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("ab", None),
+    ("a", "Minimum length of 2 characters required"),
+    ("abcd", "Maximum length of 3 characters exceeded"),
+    ("a1", "Invalid format"),
+])
+def test_check_value_reports_failing_rule(value, expected):
+    """
+    Test that check_value reports the message of the failing rule.
+
+    Args:
+        value: The value to validate.
+        expected: The expected error message, or None if the value is valid.
+    """
+    plan = compile_rules({"code": {"min_length": 2, "max_length": 3, "regex": r"^[a-z]+$"}})["code"]
+
+    assert check_value(plan, value) == expected
+
+
+def test_check_value_last_failing_rule_wins():
+    """
+    Test that the last failing rule's message is reported when several rules fail,
+    as validate_field always has.
+    """
+    rules = {"min_length": 5, "regex": r"^\d+$"}
+    plan = compile_rules({"code": rules})["code"]
+
+    assert check_value(plan, "ab") == "Invalid format"
+    assert validate_field("code", "ab", rules) == {"code": "Invalid format"}
+
+
+def test_required_rule_uses_raw_value():
+    """
+    Test that the required rule sees the raw value rather than its string form,
+    so None is reported as missing instead of being validated as "None".
+    """
+    plan = compile_rules({"name": {"required": True}})["name"]
+
+    assert check_value(plan, None) == "This field is required"
+    assert check_value(plan, "") == "This field is required"
+    assert check_value(plan, 0) is None
+
+
+def test_compile_pattern_cache_counts_hits():
+    """
+    Test that repeated patterns are served from the compiled pattern cache.
+    """
+    pattern = r"^cache-test-\d+$"
+    before = regex_cache_info()
+
+    first = compile_pattern(pattern)
+    second = compile_pattern(pattern)
+    after = regex_cache_info()
+
+    assert first is second  # The same compiled object is returned
+    assert after.misses == before.misses + 1  # Compiled once
+    assert after.hits == before.hits + 1  # Served from the cache the second time
+
+
+def test_validate_regex_accepts_compiled_pattern():
+    """
+    Test that validate_regex accepts precompiled patterns as well as pattern strings.
+    """
+    assert validate_regex("abc", re.compile(r"^[a-z]+$"))
+    assert validate_regex("abc", r"^[a-z]+$")
+    assert not validate_regex("ABC", re.compile(r"^[a-z]+$"))
+
+
+def test_validate_frame_matches_check_value():
+    """
+    Test that the vectorized engine reports the same message as check_value
+    for every cell, including nulls, empty strings and non-string values.
+    """
+    plan = compile_rules({
+        "code": {"min_length": 2, "max_length": 5, "regex": r"^[A-Z]"},
+        "email": {"required": True, "email": True},
+        "country": {"country_code": True},
+    })
+    values = [None, "", "x", "AB", "Abcdef", "us", "USA", "a@b.co", "bad@", 12, 1.5, True]
+    frame = pd.DataFrame({field_name: values for field_name in plan}, dtype=object)
+
+    error_messages = validate_frame(plan, frame)
+
+    for field_name, field_plan in plan.items():
+        for index, value in enumerate(values):
+            assert error_messages.at[index, field_name] == check_value(field_plan, value)
+
+
+@pytest.mark.parametrize("sample, expected", [
+    ([["name", "email"], ["John", "john@email.com"]], (0, 0, 2)),
+    ([["Title"], [None, None], [None, "id", "name"], [None, 1, "John"]], (2, 1, 3)),
+    ([["Report", "2024"], ["id", "name", "city"], ["1", "John", "Oslo"], ["2", "Jane", "Rome"]], (1, 0, 3)),
+    ([["Year", 2024, 2025], [None, None, None], ["id", "name", "total"], [1, "a", 3.5]], (2, 0, 3)),
+    ([[None], ["only"], ["values"]], (1, 0, 1)),
+    ([[None, ""], []], None),
+])
+def test_detect_layout(sample, expected):
+    """
+    Test that the header row and the column window are found behind banner rows.
+
+    Args:
+        sample: The raw records to inspect.
+        expected: The expected header row, first column and last column.
+    """
+    from backend.app.validator.layout import detect_layout  # Importing the layout detection under test
+
+    assert detect_layout(sample) == expected